@@ -0,0 +1,615 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Asynchronous flavour of the client based on asyncio.
+
+Requests are sent with aiohttp, which has to be installed unless an HTTP
+session object with the same interface is passed to ``AsyncConnector``.
+Responses are converted to ``requests.Response`` objects, so that errors
+and JSON documents are handled in the same way as by ``Connector``.
+"""
+
+import asyncio
+import base64
+from http import client as http_client
+import logging
+import os
+import re
+import ssl
+
+import requests
+from requests import structures
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from sushy import auth as sushy_auth
+from sushy import connector as sushy_connector
+from sushy import exceptions
+from sushy import main
+from sushy.resources import base
+from sushy.resources.chassis import chassis
+from sushy.resources.manager import manager
+from sushy.resources.system import system
+from sushy import utils
+
+LOG = logging.getLogger(__name__)
+
+
+_RETRYABLE_EXCEPTIONS = (asyncio.TimeoutError, OSError)
+_REQUEST_EXCEPTIONS = ()
+if aiohttp is not None:
+    _RETRYABLE_EXCEPTIONS += (aiohttp.ClientConnectionError,
+                              aiohttp.ClientPayloadError)
+    _REQUEST_EXCEPTIONS += (aiohttp.ClientError,)
+
+
+def _basic_auth_header(username, password):
+    credentials = f'{username}:{password}'.encode('latin1')
+    return 'Basic ' + base64.b64encode(credentials).decode('ascii')
+
+
+def _build_response(url, status_code, headers, content):
+    """Build a requests Response object from a received response."""
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response.headers = structures.CaseInsensitiveDict(headers)
+    response._content = content
+    return response
+
+
+class AsyncConnector(sushy_connector.Connector):
+    """A connection to a Redfish service sending requests with asyncio.
+
+    The HTTP methods are coroutines, otherwise it behaves as ``Connector``,
+    including the retries on connection and server side errors, the
+    re-authentication on access errors, the ETag fallbacks of PATCH
+    requests and the retries without identity encoding.
+    """
+
+    def __init__(
+            self, url, verify=True, response_callback=None,
+            server_side_retries=0, server_side_retries_delay=0,
+            default_request_timeout=60, max_concurrent_requests=None,
+            http_session=None):
+        """A class representing an asynchronous connection.
+
+        :param url: The base URL of the Redfish service.
+        :param verify: Either a boolean value or a path to a CA_BUNDLE file
+            or directory with certificates of trusted CAs.
+        :param response_callback: Callable invoked with every response.
+        :param server_side_retries: Number of times to retry GET requests in
+            case of server side errors.
+        :param server_side_retries_delay: Time in seconds between retries in
+            case of server side errors.
+        :param default_request_timeout: Default timeout in seconds for
+            requests.
+        :param max_concurrent_requests: The maximum number of requests in
+            flight at the same time. Unlimited by default.
+        :param http_session: An ``aiohttp.ClientSession`` to send requests
+            with. By default, one is created with the first request and
+            closed with the connector.
+        """
+        # NOTE: the requests session of the base class only holds the
+        # authentication data, requests are sent with the HTTP session.
+        super().__init__(
+            url, verify=verify, response_callback=response_callback,
+            server_side_retries=server_side_retries,
+            server_side_retries_delay=server_side_retries_delay,
+            default_request_timeout=default_request_timeout,
+            keep_alive=True)
+        self._http_session = http_session
+        self._owns_http_session = http_session is None
+        self._request_limit = (asyncio.Semaphore(max_concurrent_requests)
+                               if max_concurrent_requests else None)
+        self._ssl = None
+
+    def _get_http_session(self):
+        if self._http_session is None:
+            if aiohttp is None:
+                raise ImportError('aiohttp is required to send requests '
+                                  'without an explicit HTTP session')
+            self._http_session = aiohttp.ClientSession()
+        return self._http_session
+
+    def _get_ssl(self):
+        """Get the value of the ``ssl`` argument of requests, if any."""
+        if self._verify is True:
+            return None
+        if not self._verify:
+            return False
+        if self._ssl is None:
+            if os.path.isdir(self._verify):
+                self._ssl = ssl.create_default_context(capath=self._verify)
+            else:
+                self._ssl = ssl.create_default_context(cafile=self._verify)
+        return self._ssl
+
+    async def _send(self, method, url, data, headers,
+                    **extra_session_req_kwargs):
+        headers = dict(headers)
+        auth_token = self._session.headers.get('X-Auth-Token')
+        if auth_token:
+            headers.setdefault('X-Auth-Token', auth_token)
+        if self._session.auth is not None:
+            headers.setdefault('Authorization',
+                               _basic_auth_header(*self._session.auth))
+        ssl_arg = self._get_ssl()
+        if ssl_arg is not None:
+            extra_session_req_kwargs.setdefault('ssl', ssl_arg)
+
+        async with self._get_http_session().request(
+                method, url, json=data, headers=headers,
+                **extra_session_req_kwargs) as response:
+            content = await response.read()
+            return _build_response(url, response.status, response.headers,
+                                   content)
+
+    async def _request(self, method, url, data, headers, timeout,
+                       **extra_session_req_kwargs):
+        request = self._send(method, url, data, headers,
+                             **extra_session_req_kwargs)
+        if self._request_limit is None:
+            return await asyncio.wait_for(request, timeout)
+
+        async with self._request_limit:
+            return await asyncio.wait_for(request, timeout)
+
+    async def _op(self, method, path='', data=None, headers=None,
+                  blocking=False, timeout=None, server_side_retries_left=None,
+                  allow_reauth=True, **extra_session_req_kwargs):
+        """Generic asynchronous RESTful request handler.
+
+        :param method: The HTTP method to be used, e.g: GET, POST,
+            PUT, PATCH, etc...
+        :param path: The sub-URI or absolute URL path to the resource.
+        :param data: Optional JSON data.
+        :param headers: Optional dictionary of headers. Use None value
+                        to remove a default header.
+        :param blocking: Not supported, must be False.
+        :param timeout: Max time in seconds to wait for the response.
+        :param server_side_retries_left: Remaining retries. If not provided
+            will use limit provided by instance's server_side_retries
+        :param allow_reauth: Whether to allow refreshing the authentication
+            token.
+        :param extra_session_req_kwargs: Optional keyword arguments to pass
+            to the ``request`` method of the HTTP session.
+        :returns: The response object from the requests library.
+        :raises: ConnectionError
+        :raises: HTTPError
+        """
+        if blocking:
+            raise ValueError('Blocking requests are not supported by '
+                             'the asynchronous connector')
+
+        if server_side_retries_left is None:
+            server_side_retries_left = self._server_side_retries
+
+        timeout = timeout or self._default_request_timeout
+        url, headers = self._prepare_request(
+            method, path, data, headers, blocking, timeout,
+            extra_session_req_kwargs)
+
+        retries = self._server_side_retries or 3
+        delay = self._server_side_retries_delay or 2
+
+        for attempt in range(retries):
+            try:
+                response = await self._request(method, url, data, headers,
+                                               timeout,
+                                               **extra_session_req_kwargs)
+                break
+            except _RETRYABLE_EXCEPTIONS as e:
+                if attempt < retries - 1:
+                    LOG.warning(
+                        "Transient error during Redfish request to %s "
+                        "(attempt %d/%d): %s", url, attempt + 1, retries, e)
+                    await asyncio.sleep(delay)
+                else:
+                    raise exceptions.ConnectionError(url=url, error=e)
+            except _REQUEST_EXCEPTIONS as e:
+                raise exceptions.ConnectionError(url=url, error=e)
+
+        if self._response_callback:
+            self._response_callback(response)
+
+        try:
+            exceptions.raise_for_response(method, url, response)
+        except exceptions.AccessError as e:
+            reauth = self._get_reauth_method(method, url, e, allow_reauth)
+            if reauth is None:
+                raise
+            try:
+                await reauth()
+            except exceptions.AccessError as refresh_exc:
+                LOG.error("A failure occurred while attempting to refresh "
+                          "the session. Error: %s", refresh_exc.message)
+                raise
+            LOG.debug("Authentication refreshed successfully, "
+                      "retrying the call.")
+            return await self._op(
+                method, path, data=data, headers=headers, timeout=timeout,
+                server_side_retries_left=server_side_retries_left,
+                allow_reauth=False,
+                **extra_session_req_kwargs)
+        except exceptions.HTTPError as e:
+            retry = self._get_retry(method, headers, e,
+                                    server_side_retries_left)
+            if retry is None:
+                raise
+            retry_delay, headers, server_side_retries_left = retry
+            if retry_delay is not None:
+                await asyncio.sleep(retry_delay)
+            return await self._op(
+                method, path, data=data, headers=headers, timeout=timeout,
+                server_side_retries_left=server_side_retries_left,
+                **extra_session_req_kwargs)
+
+        LOG.debug('HTTP response for %(method)s %(url)s: '
+                  'status code: %(code)s',
+                  {'method': method, 'url': url,
+                   'code': response.status_code})
+
+        return response
+
+    async def _etag_handler(self, path='', data=None, headers=None,
+                            etag=None, blocking=False, timeout=None,
+                            **extra_session_req_kwargs):
+        """eTag handler containing workarounds for PATCH requests with eTags.
+
+        See ``Connector._etag_handler``.
+        """
+        if headers:
+            if headers.get('If-Match') == '':
+                del headers['If-Match']
+        if etag:
+            if not headers:
+                headers = {}
+            headers['If-Match'] = etag
+        try:
+            return await self._op('PATCH', path, data=data, headers=headers,
+                                  blocking=blocking, timeout=timeout,
+                                  **extra_session_req_kwargs)
+        except exceptions.HTTPError as resp:
+            LOG.warning("Initial request with eTag failed: %s", resp)
+            if (resp.status_code != http_client.PRECONDITION_FAILED
+                    or not etag):
+                raise
+
+        match = re.match(r'^(W\/)("\w*")$', etag)
+        if match:
+            LOG.info("Weak eTag provided with original request to "
+                     "%s. Attempting to conversion to strong eTag "
+                     "and re-trying.", path)
+            headers['If-Match'] = match.group(2)
+            try:
+                return await self._op('PATCH', path, data=data,
+                                      headers=headers, blocking=blocking,
+                                      timeout=timeout,
+                                      **extra_session_req_kwargs)
+            except exceptions.HTTPError as resp:
+                if resp.status_code == http_client.PRECONDITION_FAILED:
+                    LOG.warning("Request to %s with weak eTag "
+                                "converted to strong eTag also "
+                                "failed. Making the final attempt "
+                                "with no eTag specified.", path)
+        else:
+            LOG.warning("Strong eTag provided - retrying request to "
+                        "%s with eTag removed.", path)
+
+        del headers['If-Match']
+        try:
+            return await self._op('PATCH', path, data=data, headers=headers,
+                                  blocking=blocking, timeout=timeout,
+                                  **extra_session_req_kwargs)
+        except exceptions.HTTPError as resp:
+            LOG.error("Final re-try with eTag removed has failed, "
+                      "raising exception %s", resp)
+            raise
+
+    async def close(self):
+        """Close this connector and the HTTP session it has created."""
+        if self._http_session is not None and self._owns_http_session:
+            await self._http_session.close()
+            self._http_session = None
+        self._session.close()
+
+    def __enter__(self):
+        raise TypeError('Use "async with" with the asynchronous connector')
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_args):
+        await self.close()
+
+
+class AsyncSessionOrBasicAuth(sushy_auth.SessionOrBasicAuth):
+    """Session or basic authentication for the asynchronous client.
+
+    Same as ``SessionOrBasicAuth``, except that the methods sending requests
+    are coroutines.
+    """
+
+    async def authenticate(self):
+        """Perform authentication.
+
+        :raises: RuntimeError
+        """
+        if self._root_resource is None or self._connector is None:
+            raise RuntimeError('_root_resource / _connector is missing. '
+                               'Forgot to call set_context()?')
+        await self._do_authenticate()
+
+    async def _do_authenticate(self):
+        """Establish a RedfishSession, fallback to basic authentication."""
+        try:
+            auth_token, session_uri = await self._root_resource.create_session(
+                self._username, self._password)
+        except exceptions.SushyError as e:
+            self._handle_session_error(e)
+        else:
+            self._set_session(auth_token, session_uri)
+
+    async def refresh_session(self):
+        """Create a new RedfishSession if one was established before."""
+        if self.can_refresh_session():
+            self.reset_session_attrs()
+            await self._do_authenticate()
+
+    async def close(self):
+        """Close the Redfish Session."""
+        if self._session_resource_id is not None:
+            try:
+                await self._connector.delete(self._session_resource_id)
+            except (exceptions.AccessError,
+                    exceptions.ServerSideError) as exc:
+                LOG.warning('Received exception "%(exception)s" while '
+                            'attempting to delete the active session: '
+                            '%(session_id)s',
+                            {'exception': exc,
+                             'session_id': self._session_resource_id})
+            self.reset_session_attrs()
+
+
+class AsyncSushy(main.Sushy):
+    """Asynchronous Redfish service root.
+
+    Create it with ``await AsyncSushy.connect(...)``. The methods fetching
+    resources below are coroutines and parse the same fields as ``Sushy``.
+    The resources they return can be refreshed with ``refresh_async()``
+    and their collections fetched with ``get_members_async()``. Other
+    methods of ``Sushy`` and of the resources send requests synchronously,
+    they are not supported.
+    """
+
+    def __init__(self, base_url, connector, json_doc, auth=None,
+                 root_prefix='/redfish/v1/', language='en',
+                 expand_members=False):
+        """A class representing an asynchronous RootService
+
+        :param base_url: The base URL to the Redfish controller.
+        :param connector: An AsyncConnector instance.
+        :param json_doc: The service root document.
+        :param auth: An authentication mechanism with coroutines, such as
+            ``AsyncSessionOrBasicAuth``.
+        :param root_prefix: The default URL prefix.
+        :param language: RFC 5646 language code for Message Registries.
+        :param expand_members: Whether to expand members of collections
+            when the service supports it.
+        """
+        # NOTE: Sushy.__init__ is not called, it fetches the service root
+        # and authenticates synchronously.
+        self._root_prefix = root_prefix
+        self._expand_members = expand_members
+        self._auth = auth
+        base.ResourceBase.__init__(self, connector, path=root_prefix,
+                                   json_doc=json_doc)
+        self._public_connector = requests
+        self._language = language
+        self._base_url = base_url
+        if auth is not None:
+            auth.set_context(self, connector)
+
+    @classmethod
+    async def connect(cls, base_url, username=None, password=None,
+                      root_prefix='/redfish/v1/', verify=True, auth=None,
+                      connector=None, language='en', server_side_retries=10,
+                      server_side_retries_delay=3, expand_members=False,
+                      max_concurrent_requests=None):
+        """Fetch the service root and authenticate
+
+        :param base_url: The base URL to the Redfish controller. It
+            should include scheme and authority portion of the URL. For
+            example: https://mgmt.vendor.com
+        :param username: User account with admin/server-profile access
+            privilege
+        :param password: User account password
+        :param root_prefix: The default URL prefix. This part includes
+            the root service and version. Defaults to /redfish/v1
+        :param verify: Either a boolean value or a path to a CA_BUNDLE file
+            or directory with certificates of trusted CAs.
+        :param auth: An authentication mechanism with coroutines. Defaults
+            to ``AsyncSessionOrBasicAuth``.
+        :param connector: A user-defined AsyncConnector object.
+        :param language: RFC 5646 language code for Message Registries.
+            Defaults to 'en'.
+        :param server_side_retries: Number of times to retry GET requests in
+            case of server side errors. Defaults to 10.
+        :param server_side_retries_delay: Time in seconds between retries of
+            GET requests in case of server side errors. Defaults to 3.
+        :param expand_members: Whether to expand members of collections
+            when the service supports it. Defaults to False.
+        :param max_concurrent_requests: The maximum number of requests in
+            flight to the service. Unlimited by default. Ignored if a
+            connector is given.
+        :returns: An authenticated AsyncSushy object
+        """
+        if (auth is not None and (password is not None
+                                  or username is not None)):
+            msg = ('Username or Password were provided to Sushy '
+                   'when an authentication mechanism was specified.')
+            raise ValueError(msg)
+        if auth is None:
+            auth = AsyncSessionOrBasicAuth(username=username,
+                                           password=password)
+        if connector is None:
+            connector = AsyncConnector(
+                base_url, verify=verify,
+                server_side_retries=server_side_retries,
+                server_side_retries_delay=server_side_retries_delay,
+                max_concurrent_requests=max_concurrent_requests)
+
+        response = await connector.get(path=root_prefix)
+        root = cls(base_url, connector, utils.json_from_response(response),
+                   auth=auth, root_prefix=root_prefix, language=language,
+                   expand_members=expand_members)
+        await auth.authenticate()
+        return root
+
+    def __del__(self):
+        # NOTE: the session can only be closed from a coroutine, see close()
+        pass
+
+    async def close(self):
+        """Close the Redfish session and the connector."""
+        if self._auth:
+            try:
+                await self._auth.close()
+            except Exception as ex:
+                LOG.warning('Ignoring error while closing Redfish session '
+                            'with %s: %s', self._base_url, ex)
+            self._auth = None
+        await self._conn.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_args):
+        await self.close()
+
+    async def create_session(self, username=None, password=None):
+        """Creates a session without invoking SessionService.
+
+        See ``Sushy.create_session``.
+
+        :returns: A session key and uri in the form of a tuple
+        """
+        session_service_path = self._prepare_session_request()
+        data = {'UserName': username, 'Password': password}
+        rsp = await self._conn.post(session_service_path, data=data)
+        return self._get_session_from_response(session_service_path, rsp)
+
+    async def _get_resource(self, resource_class, path):
+        response = await self._conn.get(path=path)
+        return resource_class(self._conn, path,
+                              redfish_version=self.redfish_version,
+                              root=self,
+                              json_doc=utils.json_from_response(response))
+
+    @staticmethod
+    def _get_default_identity(collection, entity):
+        identities = collection.members_identities
+        if len(identities) != 1:
+            raise exceptions.UnknownDefaultError(
+                entity=entity,
+                error=f'{entity} count is not exactly one')
+        return identities[0]
+
+    async def get_system_collection(self):
+        """Get the SystemCollection object
+
+        :raises: MissingAttributeError, if the collection attribute is
+            not found
+        :returns: a SystemCollection object
+        """
+        if not self._systems_path:
+            raise exceptions.MissingAttributeError(
+                attribute='Systems/@odata.id', resource=self._path)
+
+        return await self._get_resource(system.SystemCollection,
+                                        self._systems_path)
+
+    async def get_system(self, identity=None):
+        """Given the identity return a System object
+
+        :param identity: The identity of the System resource. If not given,
+            defaults to the single available System.
+        :raises: `UnknownDefaultError` if default system can't be determined.
+        :returns: The System object
+        """
+        if identity is None:
+            identity = self._get_default_identity(
+                await self.get_system_collection(), 'ComputerSystem')
+
+        return await self._get_resource(system.System, identity)
+
+    async def get_chassis_collection(self):
+        """Get the ChassisCollection object
+
+        :raises: MissingAttributeError, if the collection attribute is
+            not found
+        :returns: a ChassisCollection object
+        """
+        if not self._chassis_path:
+            raise exceptions.MissingAttributeError(
+                attribute='Chassis/@odata.id', resource=self._path)
+
+        return await self._get_resource(chassis.ChassisCollection,
+                                        self._chassis_path)
+
+    async def get_chassis(self, identity=None):
+        """Given the identity return a Chassis object
+
+        :param identity: The identity of the Chassis resource. If not given,
+            defaults to the single available Chassis.
+        :raises: `UnknownDefaultError` if default chassis can't be
+            determined.
+        :returns: The Chassis object
+        """
+        if identity is None:
+            identity = self._get_default_identity(
+                await self.get_chassis_collection(), 'Chassis')
+
+        return await self._get_resource(chassis.Chassis, identity)
+
+    async def get_manager_collection(self):
+        """Get the ManagerCollection object
+
+        :raises: MissingAttributeError, if the collection attribute is
+            not found
+        :returns: a ManagerCollection object
+        """
+        if not self._managers_path:
+            raise exceptions.MissingAttributeError(
+                attribute='Managers/@odata.id', resource=self._path)
+
+        return await self._get_resource(manager.ManagerCollection,
+                                        self._managers_path)
+
+    async def get_manager(self, identity=None):
+        """Given the identity return a Manager object
+
+        :param identity: The identity of the Manager resource. If not given,
+            defaults to the single available Manager.
+        :raises: `UnknownDefaultError` if default manager can't be
+            determined.
+        :returns: The Manager object
+        """
+        if identity is None:
+            identity = self._get_default_identity(
+                await self.get_manager_collection(), 'Manager')
+
+        return await self._get_resource(manager.Manager, identity)
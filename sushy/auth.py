@@ -153,11 +153,16 @@ class SessionAuth(AuthBase):
         :raises: AccessError
         :raises: HTTPError
         """
-        auth_token = None
-
         auth_token, session_uri = self._root_resource.create_session(
             self._username, self._password)
-        # Record the session authentication data.
+        self._set_session(auth_token, session_uri)
+
+    def _set_session(self, auth_token, session_uri):
+        """Record an established redfish session.
+
+        :param auth_token: The session key.
+        :param session_uri: The session resource id or URL.
+        """
         self._session_key = auth_token
         self._session_resource_id = session_uri
         # Set flag so we know we've previously successfully achieved
@@ -241,7 +246,19 @@ class SessionOrBasicAuth(SessionAuth):
         try:
             # Attempt session based authentication
             super()._do_authenticate()
-        except exceptions.AccessError as e:
+        except exceptions.SushyError as e:
+            self._handle_session_error(e)
+
+    def _handle_session_error(self, e):
+        """Handle a failure to establish a RedfishSession.
+
+        Falls back to basic authentication unless the failure is not
+        expected to be fixed by it.
+
+        :param e: The exception raised while establishing the session.
+        :raises: the exception if there is no fallback.
+        """
+        if isinstance(e, exceptions.AccessError):
             if (not self.can_refresh_session()
                     and not self._session_auth_previously_successful):
                 # We should only try and fallback if we've not been able
@@ -262,8 +279,8 @@ class SessionOrBasicAuth(SessionAuth):
                           'ceased to support Session based '
                           'authentication.',
                           {'exception': e})
-                raise
-        except exceptions.ConnectionError as e:
+                raise e
+        elif isinstance(e, exceptions.ConnectionError):
             # The reason to explicitly catch a connectivity failure is the
             # case where transitory connectivity failures can occur while
             # working to authenticate.
@@ -278,8 +295,8 @@ class SessionOrBasicAuth(SessionAuth):
             # consider a client reuse disqualifier if there has been
             # a connection failure, so it is okay for us to fix the behavior
             # here.
-            raise
-        except exceptions.SushyError as e:
+            raise e
+        else:
             LOG.debug('Received exception "%(exception)s" while '
                       'attempting to establish a session. '
                       'Falling back to basic authentication.',
@@ -16,12 +16,17 @@
 from http import client as http_client
 import logging
 import re
+import threading
 import time
 from urllib import parse as urlparse
+import weakref
 
 import requests
+from requests import adapters
 from requests import exceptions as req_exc
+from urllib3 import connectionpool
 from urllib3.exceptions import InsecureRequestWarning
+from urllib3 import poolmanager
 
 from sushy import exceptions
 from sushy.taskmonitor import TaskMonitor
@@ -39,13 +44,161 @@ _RETRYABLE_EXCEPTIONS = (
 )
 
 
+class _ConnectionTracker:
+    """Counts and recycles the HTTP connections of a connector.
+
+    The state is kept per connection: a connection is recycled after
+    ``max_requests`` requests or when it has been idle for longer than
+    ``idle_timeout`` seconds, without affecting the other connections of
+    the pool.
+    """
+
+    def __init__(self, max_requests=None, idle_timeout=None):
+        self._max_requests = max_requests
+        self._idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        # Connection -> [number of requests, time it was last released]
+        self._connections = weakref.WeakKeyDictionary()
+        self._stats = {'new': 0, 'reused': 0}
+
+    @property
+    def stats(self):
+        with self._lock:
+            return dict(self._stats)
+
+    def _expired(self, state):
+        count, last_used = state
+        if self._max_requests and count >= self._max_requests:
+            return True
+        return (self._idle_timeout is not None and last_used is not None
+                and time.monotonic() - last_used > self._idle_timeout)
+
+    def acquire(self, conn):
+        """Account for a connection taken from the pool for a request."""
+        with self._lock:
+            state = self._connections.setdefault(conn, [0, None])
+            if conn.sock is not None and self._expired(state):
+                LOG.debug('Recycling HTTP connection to %(host)s after '
+                          '%(count)d request(s)',
+                          {'host': conn.host, 'count': state[0]})
+                conn.close()
+
+            # A connection without a socket connects on its next request,
+            # either because it is fresh or because it has been closed by
+            # the server, by urllib3 or by the recycling above.
+            if conn.sock is None:
+                self._stats['new'] += 1
+                state[0] = 0
+            else:
+                self._stats['reused'] += 1
+            state[0] += 1
+            state[1] = None
+
+    def release(self, conn):
+        """Account for a connection returned to the pool."""
+        with self._lock:
+            state = self._connections.get(conn)
+            if state is not None:
+                state[1] = time.monotonic()
+
+
+class _TrackingPoolMixin:
+
+    connection_tracker = None
+
+    def _get_conn(self, timeout=None):
+        conn = super()._get_conn(timeout=timeout)
+        if self.connection_tracker is not None:
+            self.connection_tracker.acquire(conn)
+        return conn
+
+    def _put_conn(self, conn):
+        if conn is not None and self.connection_tracker is not None:
+            self.connection_tracker.release(conn)
+        super()._put_conn(conn)
+
+
+class _TrackingHTTPConnectionPool(_TrackingPoolMixin,
+                                  connectionpool.HTTPConnectionPool):
+    pass
+
+
+class _TrackingHTTPSConnectionPool(_TrackingPoolMixin,
+                                   connectionpool.HTTPSConnectionPool):
+    pass
+
+
+class _TrackingPoolManager(poolmanager.PoolManager):
+
+    def __init__(self, *args, connection_tracker=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.pool_classes_by_scheme = {
+            'http': _TrackingHTTPConnectionPool,
+            'https': _TrackingHTTPSConnectionPool,
+        }
+        self._connection_tracker = connection_tracker
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port,
+                                 request_context=request_context)
+        pool.connection_tracker = self._connection_tracker
+        return pool
+
+
+class _TrackingHTTPAdapter(adapters.HTTPAdapter):
+    """HTTP adapter whose connections are accounted by a tracker."""
+
+    def __init__(self, connection_tracker, **kwargs):
+        self._connection_tracker = connection_tracker
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False,
+                         **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+        self.poolmanager = _TrackingPoolManager(
+            num_pools=connections, maxsize=maxsize, block=block,
+            connection_tracker=self._connection_tracker, **pool_kwargs)
+
+
 class Connector:
 
     def __init__(
             self, url, username=None, password=None, verify=True,
             response_callback=None, server_side_retries=0,
             server_side_retries_delay=0,
-            default_request_timeout=60):
+            default_request_timeout=60, keep_alive=False,
+            keep_alive_max_requests=100, keep_alive_idle_timeout=10,
+            pool_maxsize=1, max_workers=1):
+        """A class representing a connection to a Redfish service.
+
+        :param url: The base URL of the Redfish service.
+        :param username: Deprecated, use ``set_auth`` instead.
+        :param password: Deprecated, use ``set_auth`` instead.
+        :param verify: Either a boolean value or a path to a CA_BUNDLE file
+            or directory with certificates of trusted CAs.
+        :param response_callback: Callable invoked with every response.
+        :param server_side_retries: Number of times to retry GET requests in
+            case of server side errors.
+        :param server_side_retries_delay: Time in seconds between retries in
+            case of server side errors.
+        :param default_request_timeout: Default timeout in seconds for
+            requests.
+        :param keep_alive: Whether to keep HTTP connections open between
+            requests instead of asking the BMC to close them. Defaults to
+            False because some BMCs choke at persistent connections.
+        :param keep_alive_max_requests: In keep-alive mode, the maximum
+            number of requests sent over a connection before it is recycled.
+        :param keep_alive_idle_timeout: In keep-alive mode, time in seconds
+            after which an idle connection is recycled instead of reused.
+        :param pool_maxsize: In keep-alive mode, the maximum number of
+            connections kept in the pool for this BMC.
+        :param max_workers: The maximum number of concurrent requests used
+            to load the members of a collection. Defaults to 1, which loads
+            them one by one. In keep-alive mode, ``pool_maxsize`` should be
+            at least as large.
+        """
         self._url = url
         self._verify = verify
         self._session = requests.Session()
@@ -54,15 +207,33 @@ class Connector:
         self._server_side_retries = server_side_retries
         self._server_side_retries_delay = server_side_retries_delay
         self._default_request_timeout = default_request_timeout
+        self._max_workers = max_workers
 
         # NOTE(TheJulia): In order to help prevent recursive post operations
         # by allowing us to understand that we should stop authentication.
         self._sessions_uri = None
-        # NOTE(etingof): field studies reveal that some BMCs choke at
-        # long-running persistent HTTP connections (or TCP connections).
-        # By default, we ask HTTP server to shut down HTTP connection we've
-        # just used.
-        self._session.headers['Connection'] = 'close'
+
+        self._keep_alive = keep_alive
+
+        if keep_alive:
+            self._connection_tracker = _ConnectionTracker(
+                max_requests=keep_alive_max_requests,
+                idle_timeout=keep_alive_idle_timeout)
+            adapter = _TrackingHTTPAdapter(self._connection_tracker,
+                                           pool_connections=1,
+                                           pool_maxsize=pool_maxsize)
+        else:
+            self._connection_tracker = _ConnectionTracker()
+            adapter = _TrackingHTTPAdapter(self._connection_tracker)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+        if not keep_alive:
+            # NOTE(etingof): field studies reveal that some BMCs choke at
+            # long-running persistent HTTP connections (or TCP connections).
+            # By default, we ask HTTP server to shut down HTTP connection
+            # we've just used.
+            self._session.headers['Connection'] = 'close'
 
         if username or password:
             LOG.warning('Passing username and password to Connector is '
@@ -95,6 +266,22 @@ class Connector:
         """Close this connector and the associated HTTP session."""
         self._session.close()
 
+    @property
+    def max_workers(self):
+        """The maximum number of concurrent requests to load members."""
+        return self._max_workers
+
+    @property
+    def connection_stats(self):
+        """Counters of new and reused HTTP connections.
+
+        A connection is new when a request has to open it and reused when
+        the request is sent over a connection kept open by a previous one.
+
+        :returns: a dictionary with the ``new`` and ``reused`` keys.
+        """
+        return self._connection_tracker.stats
+
     def check_retry_on_exception(self, exception_msg):
         """Checks whether retry on exception is required."""
         retry = False
@@ -109,38 +296,12 @@ class Connector:
             retry = True
         return retry
 
-    def _op(self, method, path='', data=None, headers=None, blocking=False,
-            timeout=None, server_side_retries_left=None, allow_reauth=True,
-            **extra_session_req_kwargs):
-        """Generic RESTful request handler.
+    def _prepare_request(self, method, path, data, headers, blocking,
+                         timeout, extra_session_req_kwargs):
+        """Build the URL and the headers of a request.
 
-        :param method: The HTTP method to be used, e.g: GET, POST,
-            PUT, PATCH, etc...
-        :param path: The sub-URI or absolute URL path to the resource.
-        :param data: Optional JSON data.
-        :param headers: Optional dictionary of headers. Use None value
-                        to remove a default header.
-        :param blocking: Whether to block for asynchronous operations.
-        :param timeout: Max time in seconds to wait for blocking async call or
-                        for requests library to connect and read. Timeouts
-                        should never be disabled: set to a large enough value
-                        instead.
-        :param server_side_retries_left: Remaining retries. If not provided
-            will use limit provided by instance's server_side_retries
-        :param allow_reauth: Whether to allow refreshing the authentication
-            token.
-        :param extra_session_req_kwargs: Optional keyword argument to pass
-         requests library arguments which would pass on to requests session
-         object.
-        :returns: The response object from the requests library.
-        :raises: ConnectionError
-        :raises: HTTPError
+        :returns: a tuple with the URL and the headers.
         """
-        if server_side_retries_left is None:
-            server_side_retries_left = self._server_side_retries
-
-        timeout = timeout or self._default_request_timeout
-
         url = path if urlparse.urlparse(path).netloc else urlparse.urljoin(
             self._url, path)
         headers = (headers or {}).copy()
@@ -173,6 +334,137 @@ class Connector:
                    'blocking': blocking, 'timeout': timeout,
                    'session': extra_session_req_kwargs})
 
+        return url, headers
+
+    def _get_retry(self, method, headers, error, server_side_retries_left):
+        """Check whether a request which failed with an error can be retried.
+
+        :param method: The HTTP method of the request.
+        :param headers: The headers of the request.
+        :param error: The HTTPError raised for the response.
+        :param server_side_retries_left: Remaining retries.
+        :returns: None if the request must not be retried, otherwise a
+            tuple with the time in seconds to wait before retrying (None
+            not to wait), the headers and the remaining retries to retry
+            with.
+        """
+        if isinstance(error, exceptions.ServerSideError):
+            if ((method.lower() == 'get'
+                or self.check_retry_on_exception(error.message))
+                    and server_side_retries_left > 0):
+                LOG.warning('Got server side error %s in response to a '
+                            'request, retrying after %d seconds. Retries '
+                            'left %d.',
+                            error, self._server_side_retries_delay,
+                            server_side_retries_left)
+                return (self._server_side_retries_delay, headers,
+                        server_side_retries_left - 1)
+        elif isinstance(error, exceptions.BadRequestError):
+            if (method.lower() != 'get'
+                    and self.check_retry_on_exception(error.message)
+                    and server_side_retries_left > 0):
+                LOG.warning('Server has indicated a BadRequest for %s but '
+                            'the response payload is a known retriable '
+                            'condition and we will retry in %d seconds. '
+                            'Retries left  %d.',
+                            error, self._server_side_retries_delay,
+                            server_side_retries_left)
+                return (self._server_side_retries_delay, headers,
+                        server_side_retries_left - 1)
+        elif isinstance(error, exceptions.NotAcceptableError):
+            # NOTE(dtantsur): some HPE Gen 10 Plus machines do not allow
+            # identity encoding when fetching registries.
+            if (method.lower() == 'get'
+                    and headers.get('Accept-Encoding') == 'identity'):
+                LOG.warning('Server has indicated a NotAcceptable for %s, '
+                            'retrying without identity encoding', error)
+                return (None, dict(headers, **{'Accept-Encoding': None}),
+                        server_side_retries_left)
+        return None
+
+    def _get_reauth_method(self, method, url, error, allow_reauth):
+        """Get the method to re-authenticate with after an AccessError.
+
+        :param method: The HTTP method of the request.
+        :param url: The URL of the request.
+        :param error: The AccessError raised for the response.
+        :param allow_reauth: Whether refreshing the authentication is allowed.
+        :returns: The method of the authentication mechanism to call or None
+            if the request must not be retried.
+        """
+        if (method == 'POST'
+                and self._sessions_uri is not None
+                and self._sessions_uri in url):
+            LOG.error('Authentication to the session service failed. '
+                      'Please check credentials and try again.')
+            return None
+        if not allow_reauth:
+            LOG.error("Failure occurred while attempting to retry "
+                      "request after refreshing the session: %s", error)
+            return None
+        if self._auth is None:
+            if method == 'GET' and url.endswith('SessionService'):
+                LOG.debug('HTTP GET of SessionService failed %s, '
+                          'this is expected prior to authentication',
+                          error.message)
+            else:
+                LOG.error("Authentication error detected. Cannot proceed: "
+                          "%s", error.message)
+            return None
+        # self._session.auth value is only set when basic auth is used
+        if self._session.auth is not None:
+            LOG.warning('We have encountered an AccessError when '
+                        'using \'basic\' authentication. %(err)s',
+                        {'err': str(error)})
+            # NOTE(TheJulia): There is no way to recover Basic auth,
+            # as we need the client to be re-launched with new
+            # credentials.
+            return None
+        if self._auth.can_refresh_session():
+            return self._auth.refresh_session
+
+        LOG.warning('Session authentication appears to have '
+                    'been lost at some point in time. '
+                    'Connectivity may have been lost during '
+                    'a prior session refresh. Attempting to '
+                    're-authenticate.')
+        return self._auth.authenticate
+
+    def _op(self, method, path='', data=None, headers=None, blocking=False,
+            timeout=None, server_side_retries_left=None, allow_reauth=True,
+            **extra_session_req_kwargs):
+        """Generic RESTful request handler.
+
+        :param method: The HTTP method to be used, e.g: GET, POST,
+            PUT, PATCH, etc...
+        :param path: The sub-URI or absolute URL path to the resource.
+        :param data: Optional JSON data.
+        :param headers: Optional dictionary of headers. Use None value
+                        to remove a default header.
+        :param blocking: Whether to block for asynchronous operations.
+        :param timeout: Max time in seconds to wait for blocking async call or
+                        for requests library to connect and read. Timeouts
+                        should never be disabled: set to a large enough value
+                        instead.
+        :param server_side_retries_left: Remaining retries. If not provided
+            will use limit provided by instance's server_side_retries
+        :param allow_reauth: Whether to allow refreshing the authentication
+            token.
+        :param extra_session_req_kwargs: Optional keyword argument to pass
+         requests library arguments which would pass on to requests session
+         object.
+        :returns: The response object from the requests library.
+        :raises: ConnectionError
+        :raises: HTTPError
+        """
+        if server_side_retries_left is None:
+            server_side_retries_left = self._server_side_retries
+
+        timeout = timeout or self._default_request_timeout
+        url, headers = self._prepare_request(
+            method, path, data, headers, blocking, timeout,
+            extra_session_req_kwargs)
+
         retries = self._server_side_retries or 3
         delay = self._server_side_retries_delay or 2
 
@@ -214,109 +506,37 @@ class Connector:
         try:
             exceptions.raise_for_response(method, url, response)
         except exceptions.AccessError as e:
-            if (method == 'POST'
-                    and self._sessions_uri is not None
-                    and self._sessions_uri in url):
-                LOG.error('Authentication to the session service failed. '
-                          'Please check credentials and try again.')
+            reauth = self._get_reauth_method(method, url, e, allow_reauth)
+            if reauth is None:
                 raise
-            if not allow_reauth:
-                LOG.error("Failure occurred while attempting to retry "
-                          "request after refreshing the session: %s", e)
-                raise
-            if self._auth is not None:
-                # self._session.auth value is only set when basic auth is used
-                if self._session.auth is not None:
-                    LOG.warning('We have encountered an AccessError when '
-                                'using \'basic\' authentication. %(err)s',
-                                {'err': str(e)})
-                    # NOTE(TheJulia): There is no way to recover Basic auth,
-                    # as we need the client to be re-launched with new
-                    # credentials.
-                    raise
-                try:
-                    if self._auth.can_refresh_session():
-                        self._auth.refresh_session()
-                    else:
-                        LOG.warning('Session authentication appears to have '
-                                    'been lost at some point in time. '
-                                    'Connectivity may have been lost during '
-                                    'a prior session refresh. Attempting to '
-                                    're-authenticate.')
-                        self._auth.authenticate()
-                except exceptions.AccessError as refresh_exc:
-                    LOG.error("A failure occurred while attempting to refresh "
-                              "the session. Error: %s", refresh_exc.message)
-                    raise
-                LOG.debug("Authentication refreshed successfully, "
-                          "retrying the call.")
-                return self._op(
-                    method, path, data=data, headers=headers,
-                    blocking=blocking, timeout=timeout,
-                    server_side_retries_left=server_side_retries_left,
-                    allow_reauth=False,
-                    **extra_session_req_kwargs)
-            else:
-                if method == 'GET' and url.endswith('SessionService'):
-                    LOG.debug('HTTP GET of SessionService failed %s, '
-                              'this is expected prior to authentication',
-                              e.message)
-                else:
-                    LOG.error("Authentication error detected. Cannot proceed: "
-                              "%s", e.message)
-                raise
-        except exceptions.ServerSideError as e:
-            if ((method.lower() == 'get'
-                or self.check_retry_on_exception(e.message))
-                    and server_side_retries_left > 0):
-                LOG.warning('Got server side error %s in response to a '
-                            'request, retrying after %d seconds. Retries '
-                            'left %d.',
-                            e, self._server_side_retries_delay,
-                            server_side_retries_left)
-                time.sleep(self._server_side_retries_delay)
-                server_side_retries_left -= 1
-                return self._op(
-                    method, path, data=data, headers=headers,
-                    blocking=blocking, timeout=timeout,
-                    server_side_retries_left=server_side_retries_left,
-                    **extra_session_req_kwargs)
-            else:
+            try:
+                reauth()
+            except exceptions.AccessError as refresh_exc:
+                LOG.error("A failure occurred while attempting to refresh "
+                          "the session. Error: %s", refresh_exc.message)
                 raise
-        except exceptions.BadRequestError as e:
-            if (method.lower() != 'get'
-                    and self.check_retry_on_exception(e.message)
-                    and server_side_retries_left > 0):
-                LOG.warning('Server has indicated a BadRequest for %s but '
-                            'the response payload is a known retriable '
-                            'condition and we will retry in %d seconds. '
-                            'Retries left  %d.',
-                            e, self._server_side_retries_delay,
-                            server_side_retries_left)
-                time.sleep(self._server_side_retries_delay)
-                server_side_retries_left -= 1
-                return self._op(
-                    method, path, data=data, headers=headers,
-                    blocking=blocking, timeout=timeout,
-                    server_side_retries_left=server_side_retries_left,
-                    **extra_session_req_kwargs)
-            else:
-                raise
-        except exceptions.NotAcceptableError as e:
-            # NOTE(dtantsur): some HPE Gen 10 Plus machines do not allow
-            # identity encoding when fetching registries.
-            if (method.lower() == 'get'
-                    and headers.get('Accept-Encoding') == 'identity'):
-                LOG.warning('Server has indicated a NotAcceptable for %s, '
-                            'retrying without identity encoding', e)
-                headers = dict(headers, **{'Accept-Encoding': None})
-                return self._op(
-                    method, path, data=data, headers=headers,
-                    blocking=blocking, timeout=timeout,
-                    server_side_retries_left=server_side_retries_left,
-                    **extra_session_req_kwargs)
-            else:
+            LOG.debug("Authentication refreshed successfully, "
+                      "retrying the call.")
+            return self._op(
+                method, path, data=data, headers=headers,
+                blocking=blocking, timeout=timeout,
+                server_side_retries_left=server_side_retries_left,
+                allow_reauth=False,
+                **extra_session_req_kwargs)
+        except exceptions.HTTPError as e:
+            retry = self._get_retry(method, headers, e,
+                                    server_side_retries_left)
+            if retry is None:
                 raise
+            retry_delay, headers, server_side_retries_left = retry
+            if retry_delay is not None:
+                time.sleep(retry_delay)
+            return self._op(
+                method, path, data=data, headers=headers,
+                blocking=blocking, timeout=timeout,
+                server_side_retries_left=server_side_retries_left,
+                **extra_session_req_kwargs)
+
         if blocking and response.status_code == 202:
             if not response.headers.get('Location'):
                 m = (f'HTTP response for {method} request to {url} '
@@ -356,6 +576,24 @@ class Connector:
                         blocking=blocking, timeout=timeout,
                         **extra_session_req_kwargs)
 
+    def head(self, path='', headers=None, timeout=None,
+             **extra_session_req_kwargs):
+        """HTTP HEAD method.
+
+        :param path: Optional sub-URI path to the resource.
+        :param headers: Optional dictionary of headers.
+        :param timeout: Max time in seconds to wait for the response.
+                        Defaults to default_request_timeout on Connector.
+        :param extra_session_req_kwargs: Optional keyword argument to pass
+         requests library arguments which would pass on to requests session
+         object.
+        :returns: The response object from the requests library.
+        :raises: ConnectionError
+        :raises: HTTPError
+        """
+        return self._op('HEAD', path, headers=headers, timeout=timeout,
+                        **extra_session_req_kwargs)
+
     def post(self, path='', data=None, headers=None, blocking=False,
              timeout=None, **extra_session_req_kwargs):
         """HTTP POST method.
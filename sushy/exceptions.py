@@ -74,6 +74,40 @@ class OEMExtensionNotFoundError(SushyError):
     message = 'No %(resource)s OEM extension found by name "%(name)s".'
 
 
+class MembersError(SushyError):
+    message = ('Failed to get %(count)d member(s) of %(resource)s: '
+               '%(errors)s')
+
+    def __init__(self, resource, errors):
+        """Errors of getting several members of a collection.
+
+        :param resource: path of the collection.
+        :param errors: dictionary of member identities and the exceptions
+            raised when getting them.
+        """
+        self.errors = errors
+        super().__init__(
+            resource=resource, count=len(errors),
+            errors='; '.join(f'{identity}: {exc}'
+                             for identity, exc in errors.items()))
+
+
+class InvalidAttributesError(SushyError):
+    message = 'Invalid attributes for %(resource)s: %(violations)s'
+
+    def __init__(self, resource, violations):
+        """Attribute values rejected by an attribute registry.
+
+        :param resource: path of the resource the attributes are set on.
+        :param violations: list of `AttributeViolation`.
+        """
+        self.violations = violations
+        super().__init__(
+            resource=resource,
+            violations='; '.join(f'{v.name}={v.value!r}: {v.reason}'
+                                 for v in violations))
+
+
 class MissingHeaderError(SushyError):
     message = 'Response to %(target_uri)s did not contain a %(header)s header'
 
@@ -0,0 +1,158 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Inventory of many Redfish services at once.
+
+Example::
+
+    endpoints = [fleet.Endpoint('https://bmc1', 'admin', 'password'),
+                 fleet.Endpoint('https://bmc2', 'admin', 'password')]
+    for node in fleet.crawl(endpoints, max_nodes=16):
+        if node.error:
+            print(node.endpoint.base_url, node.error)
+            continue
+        for sys_inv in node.systems:
+            print(sys_inv.system.identity,
+                  len(sys_inv.resources['processors']),
+                  sys_inv.timings)
+"""
+
+import collections
+from concurrent import futures
+import logging
+import time
+
+from sushy import auth as sushy_auth
+from sushy import connector as sushy_connector
+from sushy import main
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_RESOURCES = ('processors', 'ethernet_interfaces', 'simple_storage',
+                     'storage')
+"""Collections of a System fetched by default"""
+
+Endpoint = collections.namedtuple(
+    'Endpoint', ['base_url', 'username', 'password', 'verify'],
+    defaults=(None, None, True))
+"""A Redfish service to crawl"""
+
+NodeInventory = collections.namedtuple(
+    'NodeInventory', ['endpoint', 'systems', 'timings', 'error'])
+"""Inventory of one Redfish service
+
+``systems`` is a list of `SystemInventory`. ``timings`` maps ``connect``,
+``systems`` and ``total`` to the time in seconds spent connecting, listing
+the systems and crawling the whole service. ``error`` is the exception
+which prevented the service from being crawled, or None.
+"""
+
+SystemInventory = collections.namedtuple(
+    'SystemInventory', ['system', 'resources', 'timings', 'errors'])
+"""Inventory of one System
+
+``resources`` maps the name of each crawled collection to the list of its
+members. ``timings`` maps the same names to the time in seconds spent
+fetching them. ``errors`` maps the names of the collections which could not
+be fetched to the exceptions, these are missing from ``resources``.
+"""
+
+
+def _timed(timings, name, func, *args, **kwargs):
+    start = time.monotonic()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        timings[name] = time.monotonic() - start
+
+
+def _crawl_system(system, resources):
+    result = {}
+    timings = {}
+    errors = {}
+    for name in resources:
+        try:
+            result[name] = _timed(
+                timings, name, lambda: getattr(system, name).get_members())
+        except Exception as exc:
+            LOG.debug('Cannot get %(name)s of system %(system)s: %(exc)s',
+                      {'name': name, 'system': system.path, 'exc': exc})
+            errors[name] = exc
+
+    return SystemInventory(system, result, timings, errors)
+
+
+def _crawl_node(endpoint, resources, max_requests_per_node, **kwargs):
+    timings = {}
+    start = time.monotonic()
+    systems = []
+    error = None
+    auth = sushy_auth.SessionOrBasicAuth(username=endpoint.username,
+                                         password=endpoint.password)
+    conn = sushy_connector.Connector(
+        endpoint.base_url, verify=endpoint.verify,
+        max_workers=max_requests_per_node,
+        server_side_retries=kwargs.pop('server_side_retries', 10),
+        server_side_retries_delay=kwargs.pop('server_side_retries_delay', 3))
+    try:
+        root = _timed(timings, 'connect', main.Sushy, endpoint.base_url,
+                      auth=auth, connector=conn, **kwargs)
+        members = _timed(timings, 'systems',
+                         lambda: root.get_system_collection().get_members())
+        systems = [_crawl_system(system, resources) for system in members]
+    # NOTE: anything going wrong with one service, e.g. a body which is not
+    # JSON, must not stop crawling the others
+    except Exception as exc:
+        LOG.warning('Cannot crawl Redfish service %(url)s: %(exc)s',
+                    {'url': endpoint.base_url, 'exc': exc})
+        error = exc
+    finally:
+        try:
+            auth.close()
+        except Exception as exc:
+            LOG.warning('Ignoring error while closing Redfish session '
+                        'with %s: %s', endpoint.base_url, exc)
+        conn.close()
+
+    timings['total'] = time.monotonic() - start
+    return NodeInventory(endpoint, systems, timings, error)
+
+
+def crawl(endpoints, max_nodes=8, max_requests_per_node=1,
+          resources=DEFAULT_RESOURCES, **kwargs):
+    """Crawl the inventory of the systems of many Redfish services
+
+    Services are crawled concurrently, their inventory is yielded as soon
+    as it is complete, so not in the order of ``endpoints``. Closing the
+    generator cancels crawling the services which are not started yet.
+
+    :param endpoints: An iterable of `Endpoint`
+    :param max_nodes: The maximum number of services crawled at the same
+        time.
+    :param max_requests_per_node: The maximum number of requests sent at the
+        same time to each service, when fetching the members of collections.
+    :param resources: The names of the collection properties of `System` to
+        fetch the members of.
+    :param kwargs: Other arguments passed to `Sushy`, e.g. ``root_prefix``,
+        ``server_side_retries`` or ``expand_members``.
+    :returns: A generator of `NodeInventory`
+    """
+    resources = tuple(resources)
+    executor = futures.ThreadPoolExecutor(max_workers=max_nodes)
+    try:
+        crawls = [executor.submit(_crawl_node, endpoint, resources,
+                                  max_requests_per_node, **kwargs)
+                  for endpoint in endpoints]
+        for node_crawl in futures.as_completed(crawls):
+            yield node_crawl.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -13,6 +13,7 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 import collections
+import functools
 from importlib import resources
 import logging
 import os
@@ -31,6 +32,7 @@ from sushy.resources.fabric import fabric
 from sushy.resources.manager import manager
 from sushy.resources.registry import message_registry
 from sushy.resources.registry import message_registry_file
+from sushy.resources.registry import packaged_registries
 from sushy.resources.sessionservice import session
 from sushy.resources.sessionservice import sessionservice
 from sushy.resources.system import system
@@ -159,7 +161,9 @@ class Sushy(base.ResourceBase):
                  auth=None, connector=None,
                  public_connector=None,
                  language='en', server_side_retries=10,
-                 server_side_retries_delay=3):
+                 server_side_retries_delay=3, expand_members=False,
+                 identity_map_size=None, registry_store=None,
+                 registry_pool=None):
         """A class representing a RootService
 
         :param base_url: The base URL to the Redfish controller. It
@@ -186,8 +190,29 @@ class Sushy(base.ResourceBase):
             case of server side errors. Defaults to 10.
         :param server_side_retries_delay: Time in seconds between retries of
             GET requests in case of server side errors. Defaults to 3.
+        :param expand_members: Whether to fetch all members of a collection
+            with one ``$expand`` request when the service supports it.
+            Defaults to False.
+        :param identity_map_size: If set, resources are reused when the same
+            path is requested again, e.g. through the links between systems,
+            chassis and managers. This many recently used resources are kept
+            in memory. Defaults to None, creating new resources every time.
+        :param registry_store: A `RegistryStore` in which registries
+            provided by the service are looked up before being downloaded,
+            and stored after, e.g. a `DirectoryRegistryStore`. Message
+            registries may be served at another patch version than the
+            one of the service. Defaults to None.
+        :param registry_pool: A `RegistryPool` in which parsed registries
+            are shared with the other clients using it, e.g.
+            `registry_pool.DEFAULT_POOL`. Defaults to None, not sharing
+            registries.
         """
         self._root_prefix = root_prefix
+        self._expand_members = expand_members
+        self._identity_map = (base.IdentityMap(identity_map_size)
+                              if identity_map_size else None)
+        self._registry_store = registry_store
+        self._registry_pool = registry_pool
         if (auth is not None and (password is not None
                                   or username is not None)):
             msg = ('Username or Password were provided to Sushy '
@@ -230,6 +255,26 @@ class Sushy(base.ResourceBase):
         super()._parse_attributes(json_doc)
         self.redfish_version = json_doc.get('RedfishVersion')
 
+    @property
+    def members_expand_query(self):
+        """The query to expand the members of collections with.
+
+        :returns: the query string or None if expanding members is disabled
+            or not supported by the service.
+        """
+        if not self._expand_members:
+            return None
+
+        features = self.protocol_features_supported
+        expand = features.expand_query if features else None
+        if expand is True:
+            return system.EXPAND_QUERY
+        if isinstance(expand, dict) and expand.get('NoLinks'):
+            if expand.get('Levels'):
+                return system.EXPAND_QUERY
+            return '?$expand=.'
+        return None
+
     def get_system_collection(self):
         """Get the SystemCollection object
 
@@ -246,12 +291,16 @@ class Sushy(base.ResourceBase):
             redfish_version=self.redfish_version,
             registries=self.lazy_registries, root=self)
 
-    def get_system(self, identity=None):
+    def get_system(self, identity=None, select=None):
         """Given the identity return a System object
 
         :param identity: The identity of the System resource. If not given,
             sushy will default to the single available System or fail
             if there appear to be more or less then one System listed.
+        :param select: names of the only properties to fetch, e.g.
+            ``['PowerState', 'Status']``. Only used if the service supports
+            the ``$select`` query parameter, other attributes of the System
+            are None until it is refreshed without ``select``.
         :raises: `UnknownDefaultError` if default system can't be determined.
         :returns: The System object
         """
@@ -267,7 +316,8 @@ class Sushy(base.ResourceBase):
 
         return system.System(self._conn, identity,
                              redfish_version=self.redfish_version,
-                             registries=self.lazy_registries, root=self)
+                             registries=self.lazy_registries, root=self,
+                             select=select)
 
     def get_chassis_collection(self):
         """Get the ChassisCollection object
@@ -430,6 +480,16 @@ class Sushy(base.ResourceBase):
         :raises: HTTPError
         :raises: MissingAttributeError
         """
+        session_service_path = self._prepare_session_request()
+        data = {'UserName': username, 'Password': password}
+        rsp = self._conn.post(session_service_path, data=data)
+        return self._get_session_from_response(session_service_path, rsp)
+
+    def _prepare_session_request(self):
+        """Prepare the connector and find where to create a session.
+
+        :returns: The path to create a session with.
+        """
         # Explicitly removes in-client session data to proceed. This prevents
         # AccessErrors as prior authentication shouldn't be submitted with a
         # new authentication attempt, and doing so with old/invalid session
@@ -454,10 +514,18 @@ class Sushy(base.ResourceBase):
             session_url = self._root_prefix + 'SessionService/Sessions'
             self._conn._sessions_uri = session_url
 
-        data = {'UserName': username, 'Password': password}
         LOG.debug("Requesting new session from %s.",
                   session_service_path)
-        rsp = self._conn.post(session_service_path, data=data)
+        return session_service_path
+
+    def _get_session_from_response(self, session_service_path, rsp):
+        """Get the session key and uri from the response creating it.
+
+        :param session_service_path: The path the session was created with.
+        :param rsp: The response to the session creation request.
+        :returns: A session key and uri in the form of a tuple
+        :raises: MissingXAuthToken
+        """
         session_key = rsp.headers.get('X-Auth-Token')
         if session_key is None:
             raise exceptions.MissingXAuthToken(
@@ -565,20 +633,35 @@ class Sushy(base.ResourceBase):
     def _get_standard_message_registry_collection(self):
         """Load packaged standard message registries
 
-        :returns: list of MessageRegistry
+        The messages of the packaged registries are parsed on first use if
+        possible.
+
+        :returns: list of MessageRegistry or PackagedMessageRegistry
         """
+        packaged = packaged_registries.get_registries()
+        if packaged is not None:
+            return packaged
 
-        return [
-            message_registry.MessageRegistry(
+        def load(name):
+            return message_registry.MessageRegistry(
                 None,
-                os.path.join(STANDARD_REGISTRY_PATH, json_file.name),
+                os.path.join(STANDARD_REGISTRY_PATH, name),
                 reader=base.JsonPackagedFileReader(__package__),
             )
-            for json_file in resources.files(__package__)
-            .joinpath(STANDARD_REGISTRY_PATH)
-            .iterdir()
-            if json_file.is_file()
-        ]
+
+        names = [json_file.name
+                 for json_file in resources.files(__package__)
+                 .joinpath(STANDARD_REGISTRY_PATH)
+                 .iterdir()
+                 if json_file.is_file()]
+
+        if self._registry_pool is None:
+            return [load(name) for name in names]
+
+        pool = self._registry_pool
+        return [pool.get_or_load((STANDARD_REGISTRY_PATH, name),
+                                 functools.partial(load, name))
+                for name in names]
 
     @property
     @utils.cache_it
@@ -611,11 +694,15 @@ class Sushy(base.ResourceBase):
                 # Check for Message and Attribute registries
                 registry = r.get_message_registry(
                     self._language,
-                    self._public_connector)
+                    self._public_connector,
+                    store=self._registry_store,
+                    pool=self._registry_pool)
                 if not registry:
                     registry = r.get_attribute_registry(
                         self._language,
-                        self._public_connector)
+                        self._public_connector,
+                        store=self._registry_store,
+                        pool=self._registry_pool)
                 if registry:
                     endpoint_registries[r.registry] = registry
                     endpoint_registries.setdefault(r.identity, registry)
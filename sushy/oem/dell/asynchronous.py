@@ -18,6 +18,8 @@ import time
 from dateutil import parser
 
 import sushy
+from sushy import polling
+from sushy import utils
 
 LOG = logging.getLogger(__name__)
 
@@ -33,10 +35,24 @@ def _to_datetime(retry_after_str):
         return parser.parse(retry_after_str)
 
 
+def _percent_complete(response):
+    try:
+        percent_complete = utils.json_from_response(response).get(
+            'PercentComplete')
+        return None if percent_complete is None else int(percent_complete)
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
 def http_call(conn, method, *args, **kwargs):
     handle = getattr(conn, method.lower())
 
-    sleep_for = kwargs.pop('sushy_task_poll_period', TASK_POLL_PERIOD)
+    poll_strategy = kwargs.pop('sushy_poll_strategy', None)
+    if poll_strategy is None:
+        poll_strategy = polling.FixedPollStrategy(
+            kwargs.pop('sushy_task_poll_period', TASK_POLL_PERIOD))
+    else:
+        kwargs.pop('sushy_task_poll_period', None)
     max_404_retries = kwargs.pop('max_404_retries', 3)
     retry_404_delay = kwargs.pop('retry_404_delay', 10)
 
@@ -63,6 +79,8 @@ def http_call(conn, method, *args, **kwargs):
         time.sleep(retry_404_delay)
 
     location = None
+    attempt = 0
+    started_at = time.monotonic()
     while response.status_code == 202:
         location = response.headers.get('Location', location)
         if not location:
@@ -74,8 +92,16 @@ def http_call(conn, method, *args, **kwargs):
 
         retry_after = response.headers.get('Retry-After')
         if retry_after:
-            retry_after = _to_datetime(retry_after)
-            sleep_for = max(0, (retry_after - datetime.now()).total_seconds())
+            retry_after = max(0, (_to_datetime(retry_after)
+                                  - datetime.now()).total_seconds())
+        else:
+            retry_after = None
+
+        sleep_for = poll_strategy.delay(
+            attempt, retry_after=retry_after,
+            percent_complete=_percent_complete(response),
+            elapsed=time.monotonic() - started_at)
+        attempt += 1
 
         LOG.debug('Sleeping for %d secs before retrying HTTP GET '
                   '%s', sleep_for, location)
@@ -0,0 +1,109 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Strategies deciding how often asynchronous operations are polled.
+
+They are used by :py:class:`sushy.taskmonitor.TaskMonitor` and the
+asynchronous calls of the Dell OEM extension. Example::
+
+    strategy = polling.BackoffPollStrategy(initial=2, max_delay=120)
+    monitor = taskmonitor.TaskMonitor.from_response(
+        conn, response, path, poll_strategy=strategy)
+    monitor.wait(3600)
+"""
+
+import abc
+import random
+
+
+class PollStrategy(metaclass=abc.ABCMeta):
+    """Decides how long to wait before polling an operation again"""
+
+    @abc.abstractmethod
+    def delay(self, attempt, retry_after=None, percent_complete=None,
+              elapsed=None):
+        """Get the number of seconds to wait before the next poll
+
+        :param attempt: The number of polls done so far, starting at 0.
+        :param retry_after: Seconds to wait according to the ``Retry-After``
+            header of the last response, or None if it had none.
+        :param percent_complete: Progress of the operation reported by the
+            service, or None if unknown.
+        :param elapsed: Seconds since the operation started being polled,
+            or None if unknown.
+        :returns: The number of seconds to wait
+        """
+
+
+class FixedPollStrategy(PollStrategy):
+    """Polls at a fixed period, unless the service asks otherwise"""
+
+    def __init__(self, period=1):
+        """Create a fixed poll strategy
+
+        :param period: Seconds between polls without ``Retry-After``.
+        """
+        self._period = period
+
+    def delay(self, attempt, retry_after=None, percent_complete=None,
+              elapsed=None):
+        if retry_after is not None:
+            return retry_after
+        return self._period
+
+
+class BackoffPollStrategy(PollStrategy):
+    """Polls less and less often, unless the service asks otherwise
+
+    Without ``Retry-After``, the delay starts at ``initial`` seconds and is
+    multiplied by ``factor`` after every poll, up to ``max_delay``. When the
+    progress of the operation is known, the delay is shortened to the time
+    the operation is expected to still take, so completion is noticed
+    promptly. A random ``jitter`` spreads the polls of operations started
+    at the same time.
+    """
+
+    def __init__(self, initial=1, factor=2, max_delay=60, jitter=0.1,
+                 use_progress=True):
+        """Create an exponential backoff poll strategy
+
+        :param initial: Seconds to wait before the second poll.
+        :param factor: Multiplier of the delay after each poll.
+        :param max_delay: Maximum number of seconds between polls.
+        :param jitter: Maximum fraction of the delay added or removed at
+            random.
+        :param use_progress: Whether to shorten the delay according to the
+            progress of the operation.
+        """
+        self._initial = initial
+        self._factor = factor
+        self._max_delay = max_delay
+        self._jitter = jitter
+        self._use_progress = use_progress
+
+    def delay(self, attempt, retry_after=None, percent_complete=None,
+              elapsed=None):
+        if retry_after is not None:
+            return retry_after
+
+        # Avoid overflows, the delay is capped long before
+        delay = min(self._max_delay,
+                    self._initial * self._factor ** min(attempt, 64))
+        if (self._use_progress and percent_complete and elapsed
+                and 0 < percent_complete < 100):
+            remaining = elapsed * (100 - percent_complete) / percent_complete
+            delay = min(delay, max(self._initial, remaining))
+
+        if self._jitter:
+            delay *= 1 + random.uniform(  # noqa: S311
+                -self._jitter, self._jitter)
+        return min(delay, self._max_delay)
@@ -14,13 +14,17 @@
 #    under the License.
 
 import abc
+import asyncio
 import collections
-import copy
 import enum
+from http import client as http_client
 from importlib import resources
 import io
 import json
 import logging
+import threading
+import time
+import weakref
 import zipfile
 
 from sushy import exceptions
@@ -58,6 +62,10 @@ class Field:
             raise ValueError('Path cannot be empty')
 
         self._path = path
+        # Pre-resolve the traversal of the JSON document
+        self._parents = tuple(path[:-1])
+        self._name = path[-1]
+        self._name_is_key = not callable(self._name)
         self._required = required
         self._default = default
         self._adapter = adapter
@@ -85,12 +93,14 @@ class Field:
         :raises: MalformedAttributeError on invalid field value or type.
         :returns: loaded and verified value
         """
-        name = self._path[-1]
-        for path_item in self._path[:-1]:
+        for path_item in self._parents:
             body = body.get(path_item, {})
 
         try:
-            item = self._get_item(body, name)
+            if self._name_is_key:
+                item = body[self._name]
+            else:
+                item = self._get_item(body, self._name)
 
         except KeyError:
             if self._required:
@@ -123,16 +133,55 @@ class Field:
                 error=exc)
 
 
+_FIELDS_ATTR = '_sushy_fields'
+
+
 def _collect_fields(resource):
     """Collect fields from the JSON.
 
+    The fields are looked up only once per class, the result is cached
+    on the class itself.
+
     :param resource: ResourceBase or CompositeField instance.
-    :returns: generator of tuples (key, field)
+    :returns: tuple of tuples (key, field)
     """
-    for attr in dir(resource.__class__):
-        field = getattr(resource.__class__, attr)
-        if isinstance(field, Field):
-            yield (attr, field)
+    cls = resource.__class__
+    fields = cls.__dict__.get(_FIELDS_ATTR)
+    if fields is None:
+        fields = []
+        for attr in dir(cls):
+            field = getattr(cls, attr)
+            if isinstance(field, Field):
+                fields.append((attr, field))
+        fields = tuple(fields)
+        setattr(cls, _FIELDS_ATTR, fields)
+
+    return fields
+
+
+def _new_record(field):
+    """Create an empty value of a field consisting of several sub-fields.
+
+    Values are instances of a subclass of the class of the field, created
+    once per field. The subclass holds the configuration of the field as
+    class attributes and the values of the sub-fields in slots, so values
+    keep the methods and attribute access of the field while being cheap
+    to create and store.
+
+    :param field: CompositeField, ListField or DictionaryField instance.
+    :returns: a new instance of the record class of the field.
+    """
+    record_class = field.__dict__.get('_record_class')
+    if record_class is None:
+        cls = type(field)
+        namespace = dict(vars(field))
+        namespace.update(__slots__=tuple(field._subfields),
+                         __module__=cls.__module__,
+                         __qualname__=cls.__qualname__)
+        record_class = type(cls)(cls.__name__, (cls,), namespace)
+        field._record_class = record_class
+
+    return record_class.__new__(record_class)
 
 
 class CompositeField(collections.abc.Mapping, Field, metaclass=abc.ABCMeta):
@@ -141,6 +190,7 @@ class CompositeField(collections.abc.Mapping, Field, metaclass=abc.ABCMeta):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._subfields = dict(_collect_fields(self))
+        self._subfield_items = tuple(self._subfields.items())
 
     def _load(self, body, resource, nested_in=None):
         """Load the composite field.
@@ -158,8 +208,8 @@ class CompositeField(collections.abc.Mapping, Field, metaclass=abc.ABCMeta):
         # We need a new instance, as this method is called a singleton instance
         # that is attached to a class (not instance) of a resource or another
         # CompositeField. We don't want to end up modifying this instance.
-        instance = copy.copy(self)
-        for attr, field in self._subfields.items():
+        instance = _new_record(self)
+        for attr, field in self._subfield_items:
             # Hide the Field object behind the real value
             setattr(instance, attr, field._load(value, resource, nested_in))
 
@@ -187,6 +237,7 @@ class ListField(Field):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._subfields = dict(_collect_fields(self))
+        self._subfield_items = tuple(self._subfields.items())
 
     def _load(self, body, resource, nested_in=None):
         """Load the field list.
@@ -204,8 +255,8 @@ class ListField(Field):
         # Initialize the list that will contain each field instance
         instances = []
         for value in values:
-            instance = copy.copy(self)
-            for attr, field in self._subfields.items():
+            instance = _new_record(self)
+            for attr, field in self._subfield_items:
                 # Hide the Field object behind the real value
                 setattr(instance, attr, field._load(value,
                                                     resource,
@@ -229,6 +280,7 @@ class DictionaryField(Field):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._subfields = dict(_collect_fields(self))
+        self._subfield_items = tuple(self._subfields.items())
 
     def _load(self, body, resource, nested_in=None):
         """Load the dictionary.
@@ -245,8 +297,8 @@ class DictionaryField(Field):
 
         instances = {}
         for key, value in values.items():
-            instance_value = copy.copy(self)
-            for attr, field in self._subfields.items():
+            instance_value = _new_record(self)
+            for attr, field in self._subfield_items:
                 # Hide the Field object behind the real value
                 setattr(instance_value, attr, field._load(value,
                                                           resource,
@@ -415,15 +467,50 @@ class AbstractDataReader(metaclass=abc.ABCMeta):
     def get_data(self):
         """Based on data source get data and parse to JSON"""
 
+    def get_data_if_modified(self):
+        """Get data unless it has not changed since it was last fetched.
+
+        Readers not supporting revalidation always fetch the data.
+
+        :returns: FieldData with the ``304 Not Modified`` status code and
+            no JSON document if the data has not changed.
+        """
+        return self.get_data()
+
+    def get_data_selected(self, select):
+        """Get only the given properties of the data.
+
+        Readers not supporting projection return all the data.
+
+        :param select: names of the properties to get.
+        """
+        return self.get_data()
+
 
 class JsonDataReader(AbstractDataReader):
     """Gets the data from HTTP response given by path"""
 
-    def get_data(self):
-        """Gets JSON file from URI directly"""
-        data = self._conn.get(path=self._path)
+    def __init__(self):
+        """Initializes the reader"""
+        # ETags of the last successful fetch, keyed by path
+        self._etags = {}
+
+    def _get(self, **kwargs):
+        """Fetch the path and parse the response"""
+        data = self._conn.get(path=self._path, **kwargs)
+
+        etag = data.headers.get('ETag')
+        if isinstance(etag, str) and etag:
+            self._etags[self._path] = etag
+        elif data.status_code != http_client.NOT_MODIFIED:
+            self._etags.pop(self._path, None)
+
+        if data.status_code == http_client.NOT_MODIFIED:
+            return FieldData(data.status_code, data.headers, None)
+
         try:
-            json_data = data.json() if data.content else {}
+            json_data = (utils.json_from_response(data) if data.content
+                         else {})
         except Exception as exc:
             LOG.error("Unable to parse JSON in response. %(exc)s. The server "
                       "returned:\n%(data)s",
@@ -431,6 +518,36 @@ class JsonDataReader(AbstractDataReader):
             raise
         return FieldData(data.status_code, data.headers, json_data)
 
+    def get_data(self):
+        """Gets JSON file from URI directly"""
+        return self._get()
+
+    def get_data_if_modified(self):
+        """Gets JSON file from URI unless its ETag still matches
+
+        Sends ``If-None-Match`` with the ETag remembered from the last fetch
+        of the same path, if any.
+        """
+        etag = self._etags.get(self._path)
+        if not etag:
+            return self._get()
+
+        return self._get(headers={'If-None-Match': etag})
+
+    def get_data_selected(self, select):
+        """Gets JSON file from URI with only the given properties
+
+        Uses the ``$select`` query parameter. The ETag of the response is not
+        remembered since it may not describe the whole resource.
+
+        :param select: names of the properties to fetch.
+        """
+        data = self._conn.get(path='{}?$select={}'.format(
+            self._path, ','.join(select)))
+        return FieldData(data.status_code, data.headers,
+                         utils.json_from_response(data) if data.content
+                         else {})
+
 
 class JsonPublicFileReader(AbstractDataReader):
     """Loads the data from the Internet"""
@@ -439,7 +556,8 @@ class JsonPublicFileReader(AbstractDataReader):
         """Get JSON file from full URI"""
         data = self._conn.get(self._path)
 
-        return FieldData(data.status_code, data.headers, data.json())
+        return FieldData(data.status_code, data.headers,
+                         utils.json_from_response(data))
 
 
 class JsonArchiveReader(AbstractDataReader):
@@ -506,7 +624,93 @@ def get_reader(connector, path, reader=None):
     return reader
 
 
-class ResourceBase(metaclass=abc.ABCMeta):
+class IdentityMap:
+    """Map of the resources of a client by connector and path.
+
+    The ``maxsize`` most recently used resources are kept in memory, the
+    other ones are only found as long as they are referenced elsewhere.
+    """
+
+    def __init__(self, maxsize=1000):
+        self._maxsize = maxsize
+        self._recent = collections.OrderedDict()
+        self._resources = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._resources)
+
+    def _use(self, key, resource):
+        self._recent[key] = resource
+        self._recent.move_to_end(key)
+        while len(self._recent) > self._maxsize:
+            self._recent.popitem(last=False)
+
+    def get(self, key):
+        """Get a resource.
+
+        :param key: tuple of the connector and path of the resource.
+        :returns: the resource or None if it is not in the map.
+        """
+        with self._lock:
+            resource = self._resources.get(key)
+            if resource is not None:
+                self._use(key, resource)
+            return resource
+
+    def add(self, key, resource):
+        """Add or replace a resource.
+
+        :param key: tuple of the connector and path of the resource.
+        :param resource: the resource.
+        """
+        with self._lock:
+            self._resources[key] = resource
+            self._use(key, resource)
+
+    def clear(self):
+        """Remove all resources."""
+        with self._lock:
+            self._recent.clear()
+            self._resources.clear()
+
+
+# Constructor arguments handled by the identity map, resources created
+# with any other one are neither looked up nor stored in it
+_IDENTITY_MAP_KWARGS = frozenset(
+    ['connector', 'path', 'redfish_version', 'registries', 'root',
+     'json_doc', 'reader', 'select'])
+
+
+class _ResourceMeta(abc.ABCMeta):
+    """Metaclass reusing resources from the identity map of their root."""
+
+    def __call__(cls, *args, **kwargs):
+        root = kwargs.get('root')
+        identity_map = getattr(root, '_identity_map', None)
+        # Other arguments, e.g. the embedded members of a collection with
+        # a made-up path, may give a different resource for the same path
+        if (identity_map is None or len(args) > 2
+                or not _IDENTITY_MAP_KWARGS.issuperset(kwargs)
+                or kwargs.get('reader') is not None or kwargs.get('select')):
+            return super().__call__(*args, **kwargs)
+
+        connector = args[0] if args else kwargs.get('connector')
+        path = args[1] if len(args) > 1 else kwargs.get('path', '')
+        key = (connector, path.rstrip('/'))
+
+        if kwargs.get('json_doc') is None:
+            resource = identity_map.get(key)
+            if type(resource) is cls:
+                resource.refresh(force=False)
+                return resource
+
+        resource = super().__call__(*args, **kwargs)
+        identity_map.add(key, resource)
+        return resource
+
+
+class ResourceBase(metaclass=_ResourceMeta):
 
     redfish_version = None
     """The Redfish version"""
@@ -519,6 +723,16 @@ class ResourceBase(metaclass=abc.ABCMeta):
     _log_resource_body = True
     """Whether to log the whole resource body in debug mode."""
 
+    _headers_max_age = 30
+    """Seconds the HTTP headers of the last fetch can be reused for."""
+
+    max_age = None
+    """Seconds after which ``refresh(force=False)`` fetches the resource again.
+
+    None keeps it fresh until it is invalidated. Accessors of cached
+    sub-resources refresh them this way, so they honour it too.
+    """
+
     def __init__(self,
                  connector,
                  path='',
@@ -526,7 +740,8 @@ class ResourceBase(metaclass=abc.ABCMeta):
                  registries=None,
                  reader=None,
                  json_doc=None,
-                 root=None):
+                 root=None,
+                 select=None):
         """A class representing the base of any Redfish resource
 
         Invokes the ``refresh()`` method of resource for the first
@@ -540,20 +755,36 @@ class ResourceBase(metaclass=abc.ABCMeta):
         :param reader: Reader to use to fetch JSON data.
         :param json_doc: parsed JSON document in form of Python types.
         :param root: Sushy root object. Empty for Sushy root itself.
+        :param select: names of the only properties to fetch, see
+            ``refresh()``.
         """
         self._conn = connector
         self._path = path
         self._json = None
+        # Whether the attributes have been parsed from the current JSON
+        # document, a revalidated document is only parsed again if not
+        self._json_parsed = False
+        # Top-level properties to parse, None to parse all of them
+        self._selected = None
+        # HTTP headers of the last fetch and when they were received
+        self._headers = None
+        self._headers_time = None
         self.redfish_version = redfish_version
         self._registries = registries
         # Note(deray): Indicates if the resource holds stale data or not.
         # Starting off with True and eventually gets set to False when
         # attribute values are fetched.
         self._is_stale = True
+        # When the resource was last marked fresh
+        self._fresh_time = None
+        # Serialises refreshes, so that threads sharing this resource
+        # fetch it once when it is stale
+        self._refresh_lock = threading.RLock()
+        self._refreshing = False
 
         self._reader = get_reader(connector, path, reader)
         self._root = root
-        self.refresh(json_doc=json_doc)
+        self.refresh(json_doc=json_doc, select=select)
 
     def _get_value(self, val):
         """Iterate through the input to get values for all attributes
@@ -628,17 +859,30 @@ class ResourceBase(metaclass=abc.ABCMeta):
         Parsed JSON fields are set to `self` as declared in the class.
 
         :param json_doc: parsed JSON document in form of Python types
-        :returns: dictionary of attribute/values after parsing
         """
-        settings = {}
+        selected = self._selected
         for attr, field in _collect_fields(self):
+            if selected is not None and field._path[0] not in selected:
+                # Not fetched, keep the value parsed before if any
+                if attr not in vars(self):
+                    setattr(self, attr, None)
+                continue
+
             # Hide the Field object behind the real value
             setattr(self, attr, field._load(json_doc, self))
 
-            # Get the attribute/value pairs that have been parsed
-            settings[attr] = self._get_value(getattr(self, attr))
+    def _get_attributes(self):
+        """Get the parsed attributes of a resource.
+
+        This walks all parsed values recursively, so it is only meant for
+        debugging.
 
-        return settings
+        :returns: dictionary of attribute/values after parsing
+        """
+        attributes = vars(self)
+        return {attr: self._get_value(attributes[attr])
+                for attr, _field in _collect_fields(self)
+                if attr in attributes}
 
     def _get_etag(self):
         """Returns the ETag of the HTTP request if any was specified.
@@ -647,12 +891,38 @@ class ResourceBase(metaclass=abc.ABCMeta):
         """
         return self._get_headers().get('ETag')
 
+    def _set_headers(self, headers):
+        """Remember the HTTP headers of the last fetch of the resource.
+
+        :param headers: dict of HTTP headers or None
+        """
+        self._headers = headers
+        self._headers_time = time.monotonic()
+
     def _get_headers(self):
         """Returns the HTTP headers of the request for the resource.
 
+        The headers received with the last fetch are reused while the
+        resource is fresh and they are not older than ``_headers_max_age``
+        seconds. Otherwise they are requested with ``HEAD``, falling back
+        to a full ``GET`` if the service does not support it.
+
         :returns: dict of HTTP headers
         """
-        return self._reader.get_data()._headers
+        if (self._headers is not None and self._is_fresh()
+                and (time.monotonic() - self._headers_time
+                     <= self._headers_max_age)):
+            return self._headers
+
+        try:
+            headers = self._conn.head(path=self._path).headers
+        except exceptions.HTTPError as exc:
+            LOG.debug('HEAD request for %(path)s failed, falling back to '
+                      'GET: %(exc)s', {'path': self._path, 'exc': exc})
+            headers = self._reader.get_data().headers
+
+        self._set_headers(headers)
+        return headers
 
     def _allow_patch(self):
         """Returns if the resource supports the PATCH HTTP method.
@@ -665,7 +935,35 @@ class ResourceBase(metaclass=abc.ABCMeta):
         methods = set([h.strip().upper() for h in allow_header.split(',')])
         return "PATCH" in methods
 
-    def refresh(self, force=True, json_doc=None):
+    def _is_select_supported(self):
+        """Whether the service supports the ``$select`` query parameter."""
+        root = self if self._root is None else self._root
+        features = getattr(root, 'protocol_features_supported', None)
+        return getattr(features, 'select_query', None) is True
+
+    def _get_selected(self, select):
+        """Fetch only the given properties of the resource.
+
+        :param select: names of the properties to fetch.
+        :returns: FieldData or None if the service does not support
+            ``$select`` or failed to handle it.
+        """
+        if not self._is_select_supported():
+            LOG.debug('The service does not support $select, fetching '
+                      'the whole %(type)s %(path)s',
+                      {'type': self.__class__.__name__, 'path': self._path})
+            return None
+
+        try:
+            return self._reader.get_data_selected(select)
+        except exceptions.HTTPError as exc:
+            LOG.warning('Unable to fetch %(type)s %(path)s with $select, '
+                        'fetching the whole resource: %(exc)s',
+                        {'type': self.__class__.__name__,
+                         'path': self._path, 'exc': exc})
+            return None
+
+    def refresh(self, force=True, json_doc=None, select=None):
         """Refresh the resource
 
         Freshly retrieves/fetches the resource attributes and invokes
@@ -675,38 +973,141 @@ class ResourceBase(metaclass=abc.ABCMeta):
         in ``_do_refresh()`` method, if needed. This method represents the
         template method in the paradigm of Template design pattern.
 
+        If the resource has been fetched before and the service reports it
+        as not modified since then, the attributes are not parsed again.
+
         :param force: if set to False, will only refresh if the resource is
-            marked as stale, otherwise neither it nor its subresources will
-            be refreshed.
+            marked as stale or older than ``max_age``, otherwise neither it
+            nor its subresources will be refreshed.
         :param json_doc: parsed JSON document in form of Python types.
+        :param select: names of the only properties to fetch, e.g.
+            ``['PowerState', 'Status']``. If the service supports the
+            ``$select`` query parameter, only the fields of these properties
+            are parsed and the other attributes keep their previous values,
+            or None if the resource has not been fetched before. Otherwise
+            the whole resource is fetched.
         :raises: ResourceNotFoundError
         :raises: ConnectionError
         :raises: HTTPError
         """
         # Note(deray): Don't re-fetch / invalidate the sub-resources if the
         # resource is "_not_ stale" (i.e. fresh) OR _not_ forced.
-        if not self._is_stale and not force:
+        if not force and self._is_fresh():
             return
 
+        with self._refresh_lock:
+            # Another thread may have refreshed it meanwhile
+            if not force and self._is_fresh():
+                return
+
+            # A cascading refresh may come back to this resource through
+            # the links of its sub-resources
+            if self._refreshing:
+                return
+
+            self._refreshing = True
+            try:
+                self._refresh(force, json_doc, select)
+            finally:
+                self._refreshing = False
+
+    def _refresh(self, force, json_doc, select):
+        """Fetch and parse the resource, see ``refresh()``."""
+        data = None
+        if select and not json_doc:
+            data = self._get_selected(select)
+
         data_source = ""
-        if json_doc:
+        if data is not None:
+            self._json = {**(self._json or {}), **data.json_doc}
+            # The headers of a projection do not describe the resource
+            self._headers = None
+            self._selected = frozenset(name.split('/')[0]
+                                       for name in select)
+            data_source = " selecting {}".format(', '.join(select))
+        elif json_doc:
             self._json = json_doc
+            self._headers = None
             data_source = "from expanded document"
+        elif self._json is None:
+            data = self._reader.get_data()
+            self._json = data.json_doc
+            self._set_headers(data.headers)
         else:
-            self._json = self._reader.get_data().json_doc
-
-        attributes = self._parse_attributes(self._json)
-        LOG.debug('Received representation of %(type)s %(path)s%(source)s: '
-                  '%(json)s',
-                  {'type': self.__class__.__name__,
-                   'path': self._path,
-                   'source': data_source,
-                   'json': (attributes if self._log_resource_body
-                            else '<stripped>')})
+            data = self._reader.get_data_if_modified()
+            if data.status_code != http_client.NOT_MODIFIED:
+                self._json = data.json_doc
+                self._set_headers(data.headers)
+            else:
+                LOG.debug('%(type)s %(path)s has not been modified',
+                          {'type': self.__class__.__name__,
+                           'path': self._path})
+                # The representation is unchanged, so are its headers
+                if self._headers is not None:
+                    self._headers_time = time.monotonic()
+                if self._json_parsed:
+                    self._do_refresh(force)
+                    self._mark_fresh()
+                    return
+
+                data_source = " from cached document"
+
+        self._json_parsed = False
+        try:
+            self._parse_attributes(self._json)
+            self._json_parsed = True
+        finally:
+            self._selected = None
+
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug('Received representation of %(type)s %(path)s'
+                      '%(source)s: %(json)s',
+                      {'type': self.__class__.__name__,
+                       'path': self._path,
+                       'source': data_source,
+                       'json': (self._get_attributes()
+                                if self._log_resource_body
+                                else '<stripped>')})
         self._do_refresh(force)
 
-        # Mark it fresh
+        self._mark_fresh()
+
+    def _mark_fresh(self):
+        """Mark the resource as fresh as of now."""
         self._is_stale = False
+        self._fresh_time = time.monotonic()
+
+    def _is_fresh(self):
+        """Check whether the resource needs no refresh.
+
+        :returns: False if the resource is stale or older than ``max_age``
+            seconds, True otherwise.
+        """
+        if self._is_stale:
+            return False
+        return (self.max_age is None or self._fresh_time is None
+                or time.monotonic() - self._fresh_time < self.max_age)
+
+    async def refresh_async(self, force=True):
+        """Refresh the resource using an asynchronous connector
+
+        Same as ``refresh()`` for resources created with a connector whose
+        methods are coroutines, such as ``sushy.aio.AsyncConnector``. The
+        fetched document is parsed with the same fields.
+
+        :param force: if set to False, will only refresh if the resource is
+            marked as stale or older than ``max_age``.
+        :raises: ResourceNotFoundError
+        :raises: ConnectionError
+        :raises: HTTPError
+        """
+        if not force and self._is_fresh():
+            return
+
+        response = await self._conn.get(path=self._path)
+        self.refresh(force=force,
+                     json_doc=utils.json_from_response(response))
+        self._set_headers(response.headers)
 
     def _do_refresh(self, force):
         """Primitive method to be overridden by refresh related activities.
@@ -743,8 +1144,14 @@ class ResourceBase(metaclass=abc.ABCMeta):
         :raises: HTTPError
         """
         self._is_stale = True
-        if force_refresh:
-            self.refresh()
+        # NOTE: a resource being refreshed by another thread will be fresh
+        # anyway, waiting for it could deadlock when resources link to each
+        # other
+        if force_refresh and self._refresh_lock.acquire(blocking=False):
+            try:
+                self.refresh()
+            finally:
+                self._refresh_lock.release()
 
     @property
     def oem_vendors(self):
@@ -793,10 +1200,19 @@ class ResourceBase(metaclass=abc.ABCMeta):
         return self._root
 
 
+def _is_expanded(member):
+    """Whether a collection member is expanded and not just a reference.
+
+    :param member: the member JSON document.
+    """
+    return (isinstance(member, dict) and '@odata.id' in member
+            and len(member) > 1)
+
+
 class ResourceLinksBase(ResourceBase, metaclass=abc.ABCMeta):
 
     def __init__(self, connector, path, redfish_version=None, registries=None,
-                 root=None):
+                 root=None, json_doc=None):
         """A class representing the base of any Redfish resource collection
 
         It gets inherited from ``ResourceBase`` and invokes the base class
@@ -808,11 +1224,12 @@ class ResourceLinksBase(ResourceBase, metaclass=abc.ABCMeta):
         :param registries: Dict of Redfish Message Registry objects to be
             used in any resource that needs registries to parse messages.
         :param root: Sushy root object. Empty for Sushy root itself.
+        :param json_doc: parsed JSON document in form of Python types.
         """
         super().__init__(connector, path, redfish_version, registries,
-                         root=root)
+                         json_doc=json_doc, root=root)
         LOG.debug('Received %(count)d member(s) for %(type)s %(path)s',
-                  {'count': len(self.members_identities),
+                  {'count': len(self._received_members_identities),
                    'type': self.__class__.__name__, 'path': self._path})
 
     @property
@@ -820,6 +1237,14 @@ class ResourceLinksBase(ResourceBase, metaclass=abc.ABCMeta):
     def members_identities(self):
         """A sequence with members identities"""
 
+    @property
+    def _received_members_identities(self):
+        """The members identities received without any further request"""
+        return self.members_identities
+
+    async def _get_members_identities_async(self):
+        return self.members_identities
+
     @property
     @abc.abstractmethod
     def _resource_type(self):
@@ -841,13 +1266,61 @@ class ResourceLinksBase(ResourceBase, metaclass=abc.ABCMeta):
             registries=self.registries,
             root=self.root)
 
+    async def get_member_async(self, identity):
+        """Given the identity fetch a ``_resource_type`` object
+
+        Same as ``get_member()`` for an asynchronous connector, such as
+        ``sushy.aio.AsyncConnector``.
+
+        :param identity: The identity of the ``_resource_type``
+        :returns: The ``_resource_type`` object
+        :raises: ResourceNotFoundError
+        """
+        response = await self._conn.get(path=identity)
+        return self._resource_type(
+            self._conn, identity, redfish_version=self.redfish_version,
+            registries=self.registries, root=self.root,
+            json_doc=utils.json_from_response(response))
+
+    async def get_members_async(self):
+        """Fetch the ``_resource_type`` objects present in collection
+
+        Same as ``get_members()`` for an asynchronous connector, such as
+        ``sushy.aio.AsyncConnector``, except that members are not cached.
+        All members are requested at once, the connector limits how many
+        requests are in flight.
+
+        :returns: A list of ``_resource_type`` objects
+        :raises: MembersError with all errors if fetching any member fails
+        """
+        identities = await self._get_members_identities_async()
+        results = await asyncio.gather(
+            *(self.get_member_async(id_) for id_ in identities),
+            return_exceptions=True)
+
+        errors = {identity: result
+                  for identity, result in zip(identities, results)
+                  if isinstance(result, exceptions.SushyError)}
+        if errors:
+            raise exceptions.MembersError(resource=self._path, errors=errors)
+
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
+        return results
+
     @utils.cache_it
     def get_members(self):
         """Return a list of ``_resource_type`` objects present in collection
 
+        Members are fetched concurrently if the connector allows more than
+        one worker, see ``utils.get_members``.
+
         :returns: A list of ``_resource_type`` objects
         """
-        return [self.get_member(id_) for id_ in self.members_identities]
+        return utils.get_members(self._conn, self.get_member,
+                                 self.members_identities, self._path)
 
 
 class ResourceCollectionBase(ResourceLinksBase):
@@ -855,9 +1328,183 @@ class ResourceCollectionBase(ResourceLinksBase):
     name = Field('Name')
     """The name of the collection"""
 
-    members_identities = Field('Members', default=[],
-                               adapter=utils.get_members_identities)
-    """A tuple with the members identities"""
+    _first_members_identities = Field('Members', default=[],
+                                      adapter=utils.get_members_identities)
+    """A tuple with the members identities of the first page"""
+
+    _members_next_link = Field('Members@odata.nextLink')
+    """The URI of the next page of members, if the collection is paged"""
+
+    @property
+    def members_identities(self):
+        """A tuple with the members identities
+
+        If the collection is paged, the other pages are fetched on first
+        access. Use :py:func:`~iter_members` to avoid keeping all the members
+        of large collections in memory.
+        """
+        if not self._members_next_link:
+            return self._first_members_identities
+        return self._get_all_members_identities()
+
+    @members_identities.setter
+    def members_identities(self, value):
+        self._first_members_identities = value
+        self._members_next_link = None
+        utils.cache_clear(self, force_refresh=False,
+                          only_these=['_get_all_members_identities'])
+
+    @property
+    def _received_members_identities(self):
+        return self._first_members_identities
+
+    @utils.cache_it
+    def _get_all_members_identities(self):
+        return tuple(identity for page in self._iter_members_pages()
+                     for identity in utils.get_members_identities(page))
+
+    def _iter_members_pages(self):
+        """Iterate over the members of each page of the collection
+
+        Pages after the first one are fetched when the previous one has
+        been consumed, following ``Members@odata.nextLink``.
+
+        :returns: A generator of lists of members in JSON format
+        """
+        members = self._json.get('Members') if self._json else None
+        yield members if isinstance(members, list) else []
+
+        next_link = self._members_next_link
+        seen = set()
+        while next_link and next_link not in seen:
+            seen.add(next_link)
+            members, next_link = self._parse_members_page(
+                next_link,
+                utils.json_from_response(self._conn.get(path=next_link)))
+            yield members
+
+    def _parse_members_page(self, link, page):
+        if not isinstance(page, dict):
+            LOG.warning('Unexpected page %(link)s of %(path)s: %(page)s',
+                        {'link': link, 'path': self._path, 'page': page})
+            return [], None
+        members = page.get('Members')
+        return (members if isinstance(members, list) else [],
+                page.get('Members@odata.nextLink'))
+
+    async def _get_members_identities_async(self):
+        if not self._members_next_link:
+            return self._first_members_identities
+
+        identities = list(self._first_members_identities)
+        next_link = self._members_next_link
+        seen = set()
+        while next_link and next_link not in seen:
+            seen.add(next_link)
+            response = await self._conn.get(path=next_link)
+            members, next_link = self._parse_members_page(
+                next_link, utils.json_from_response(response))
+            identities.extend(utils.get_members_identities(members))
+        return tuple(identities)
+
+    def iter_members(self):
+        """Iterate over the ``_resource_type`` objects of the collection
+
+        Unlike :py:func:`~get_members`, members are neither cached nor
+        fetched concurrently. Pages of a paged collection are fetched on
+        demand, members are built from their representation in the page
+        if it is expanded, otherwise fetched one by one.
+
+        :returns: A generator of ``_resource_type`` objects
+        """
+        for page in self._iter_members_pages():
+            for member in page:
+                if _is_expanded(member):
+                    yield self._resource_type(
+                        self._conn, member['@odata.id'].rstrip('/'),
+                        redfish_version=self.redfish_version,
+                        registries=self.registries, root=self.root,
+                        json_doc=member)
+                    continue
+
+                for identity in utils.get_members_identities([member]):
+                    yield self.get_member(identity)
+
+    def _get_expanded_members_json(self):
+        """Get the JSON documents of all members of the collection.
+
+        Uses the representation of the collection if its members are
+        already expanded in it. Otherwise, if the root object has a query
+        to expand collection members with, fetches the collection again
+        with that query.
+
+        :returns: a list of JSON documents of the members or None if the
+            members have to be fetched one by one.
+        """
+        members = self._json.get('Members') if self._json else None
+        if not members or not isinstance(members, list):
+            return None
+
+        if self._members_next_link:
+            # Paged collections are not expanded with a query, as the
+            # expanded representation may be paged differently
+            if not all(_is_expanded(member) for member in members):
+                return None
+            members = [member for page in self._iter_members_pages()
+                       for member in page]
+            if all(_is_expanded(member) for member in members):
+                return members
+            return None
+
+        if all(_is_expanded(member) for member in members):
+            return members
+
+        query = getattr(self.root, 'members_expand_query', None)
+        if not isinstance(query, str) or '?' in self._path:
+            return None
+
+        try:
+            json_doc = utils.json_from_response(
+                self._conn.get(path=self._path + query))
+        except (exceptions.HTTPError, ValueError) as exc:
+            LOG.warning('Unable to expand members of %(path)s, fetching '
+                        'them one by one: %(exc)s',
+                        {'path': self._path, 'exc': exc})
+            return None
+
+        members = (json_doc.get('Members') if isinstance(json_doc, dict)
+                   else None)
+        if (not isinstance(members, list)
+                or len(members) != len(self.members_identities)
+                or not all(_is_expanded(member) for member in members)):
+            LOG.debug('Service did not expand members of %s, fetching '
+                      'them one by one', self._path)
+            return None
+
+        return members
+
+    @utils.cache_it
+    def get_members(self):
+        """Return a list of ``_resource_type`` objects present in collection
+
+        Members are built from an expanded representation of the collection
+        if it is available, otherwise they are fetched one by one.
+
+        :returns: A list of ``_resource_type`` objects
+        """
+        members_json = self._get_expanded_members_json()
+        if members_json is None:
+            return utils.get_members(self._conn, self.get_member,
+                                     self.members_identities, self._path)
+
+        return [
+            self._resource_type(
+                self._conn, member['@odata.id'].rstrip('/'),
+                redfish_version=self.redfish_version,
+                registries=self.registries, root=self.root,
+                json_doc=member)
+            for member in members_json
+        ]
 
 
 class MutableResourceCollectionBase(ResourceCollectionBase):
@@ -342,7 +342,7 @@ class ChassisCollection(base.ResourceCollectionBase):
         return Chassis
 
     def __init__(self, connector, path, redfish_version=None, registries=None,
-                 root=None):
+                 root=None, json_doc=None):
         """A class representing a ChassisCollection
 
         :param connector: A Connector instance
@@ -352,7 +352,8 @@ class ChassisCollection(base.ResourceCollectionBase):
         :param registries: Dict of Redfish Message Registry objects to be
             used in any resource that needs registries to parse messages
         :param root: Sushy root object. Empty for Sushy root itself.
+        :param json_doc: parsed JSON document in form of Python types.
         """
         super().__init__(
             connector, path, redfish_version=redfish_version,
-            registries=registries, root=root)
+            registries=registries, root=root, json_doc=json_doc)
@@ -120,6 +120,9 @@ class TemperaturesListField(Sensor):
 class Thermal(base.ResourceBase):
     """This class represents a Thermal resource."""
 
+    max_age = 5
+    """Sensor readings are refreshed when older than 5 seconds"""
+
     identity = base.Field('Id')
     """Identifier of the resource"""
 
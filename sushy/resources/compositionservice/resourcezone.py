@@ -55,7 +55,7 @@ class ResourceZone(base.ResourceBase):
     """The resource zone status"""
 
     def __init__(self, connector, identity, redfish_version=None,
-                 registries=None, root=None):
+                 registries=None, root=None, json_doc=None):
         """A class representing a ResourceZone
 
         :param connector: A Connector instance
@@ -65,10 +65,11 @@ class ResourceZone(base.ResourceBase):
         :param registries: Dict of Redfish Message Registry objects to be
             used in any resource that needs registries to parse messages
         :param root: Sushy root object. Empty for Sushy root itself.
+        :param json_doc: parsed JSON document in form of Python types.
         """
         super().__init__(
             connector, identity, redfish_version=redfish_version,
-            registries=registries, root=root)
+            registries=registries, root=root, json_doc=json_doc)
 
 
 class ResourceZoneCollection(base.ResourceCollectionBase):
@@ -54,7 +54,7 @@ class EventDestination(base.ResourceBase):
     This object will be null on a GET."""
 
     def __init__(self, connector, identity, redfish_version=None,
-                 registries=None, root=None):
+                 registries=None, root=None, json_doc=None):
         """A class representing an EventDestination
 
         :param connector: A Connector instance
@@ -64,10 +64,11 @@ class EventDestination(base.ResourceBase):
         :param registries: Dict of registries to be used in any resource
             that needs registries to parse messages.
         :param root: Sushy root object. Empty for Sushy root itself.
+        :param json_doc: parsed JSON document in form of Python types.
         """
         super().__init__(
             connector, identity, redfish_version=redfish_version,
-            registries=registries, root=root)
+            registries=registries, root=root, json_doc=json_doc)
 
     def delete(self):
         """Delete an EventDestination
@@ -103,7 +103,7 @@ class Manager(base.ResourceBase):
         self.refresh(force=True)
 
     def __init__(self, connector, identity, redfish_version=None,
-                 registries=None, root=None):
+                 registries=None, root=None, json_doc=None):
         """A class representing a Manager
 
         :param connector: A Connector instance
@@ -113,10 +113,11 @@ class Manager(base.ResourceBase):
         :param registries: Dict of Redfish Message Registry objects to be
             used in any resource that needs registries to parse messages
         :param root: Sushy root object. Empty for Sushy root itself.
+        :param json_doc: parsed JSON document in form of Python types.
         """
         super().__init__(
             connector, identity, redfish_version=redfish_version,
-            registries=registries, root=root)
+            registries=registries, root=root, json_doc=json_doc)
 
     def get_supported_graphical_console_types(self):
         """Get the supported values for Graphical Console connection types.
@@ -278,7 +279,7 @@ class ManagerCollection(base.ResourceCollectionBase):
         return Manager
 
     def __init__(self, connector, path, redfish_version=None, registries=None,
-                 root=None):
+                 root=None, json_doc=None):
         """A class representing a ManagerCollection
 
         :param connector: A Connector instance
@@ -288,7 +289,8 @@ class ManagerCollection(base.ResourceCollectionBase):
         :param registries: Dict of Redfish Message Registry objects to be
             used in any resource that needs registries to parse messages
         :param root: Sushy root object. Empty for Sushy root itself.
+        :param json_doc: parsed JSON document in form of Python types.
         """
         super().__init__(
             connector, path, redfish_version=redfish_version,
-            registries=registries, root=root)
+            registries=registries, root=root, json_doc=json_doc)
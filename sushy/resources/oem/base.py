@@ -49,6 +49,9 @@ class OEMResourceBase(base.ResourceBase):
         self._parent_resource = parent_resource
         self._vendor_id = vendor_id
         # NOTE(etingof): this is required to pull OEM subtree
+        # The document may not have changed, but it has not been parsed
+        # for this vendor yet
+        self._json_parsed = False
         self.invalidate(force_refresh=True)
         return self
 
@@ -13,9 +13,12 @@
 # The Redfish standard schema that defines the AttributeRegistry is at:
 # https://redfish.dmtf.org/schemas/v1/AttributeRegistry.v1_3_5.json
 
+import collections
 import logging
+import re
 
 from sushy.resources import base
+from sushy import utils
 
 LOG = logging.getLogger(__name__)
 
@@ -61,6 +64,166 @@ class AttributeListField(base.ListField):
     allowable_values = base.Field('Value')
     """An array of the possible values for enumerated attribute values"""
 
+    value_expression = base.Field('ValueExpression')
+    """A regular expression valid values of a string attribute match"""
+
+
+AttributeViolation = collections.namedtuple(
+    'AttributeViolation', ['name', 'value', 'reason'])
+"""An attribute value rejected by `AttributeIndex.validate`"""
+
+
+def _check_integer(index, row, value):
+    if isinstance(value, bool) or not isinstance(value, int):
+        return 'must be an integer'
+    lower = index._lower_bounds[row]
+    if lower is not None and value < lower:
+        return f'must be at least {lower}'
+    upper = index._upper_bounds[row]
+    if upper is not None and value > upper:
+        return f'must be at most {upper}'
+
+
+def _check_string(index, row, value):
+    if not isinstance(value, str):
+        return 'must be a string'
+    min_length = index._min_lengths[row]
+    if min_length is not None and len(value) < min_length:
+        return f'must be at least {min_length} characters long'
+    max_length = index._max_lengths[row]
+    if max_length is not None and len(value) > max_length:
+        return f'must be at most {max_length} characters long'
+    expression = index._value_expressions[row]
+    if expression is not None and not expression.fullmatch(value):
+        return f'must match {expression.pattern}'
+
+
+def _check_boolean(index, row, value):
+    if not isinstance(value, bool):
+        return 'must be a boolean'
+
+
+def _check_enumeration(index, row, value):
+    allowed = index._allowable_values[row]
+    if allowed is not None and value not in allowed:
+        return f'must be one of {", ".join(sorted(allowed, key=str))}'
+
+
+_CHECKS = {
+    'Boolean': _check_boolean,
+    'Enumeration': _check_enumeration,
+    'Integer': _check_integer,
+    'Password': _check_string,
+    'String': _check_string,
+}
+
+
+def _compile_expression(attr):
+    """Compile the value expression of an attribute
+
+    :returns: the compiled expression or None if there is none or it is
+        not a valid Python regular expression
+    """
+    if not attr.value_expression:
+        return None
+
+    # NOTE: value expressions are ECMAScript regular expressions, most of
+    # them are valid Python ones too
+    try:
+        return re.compile(attr.value_expression)
+    except (re.error, TypeError) as exc:
+        LOG.debug('Not checking the value expression %(expr)r of '
+                  'attribute %(name)s: %(error)s',
+                  {'expr': attr.value_expression, 'name': attr.name,
+                   'error': exc})
+        return None
+
+
+def _get_allowed_values(attr):
+    """Get the names of the allowable values of an attribute
+
+    :returns: a frozenset of the names or None if there is none
+    """
+    if not attr.allowable_values:
+        return None
+
+    allowed = frozenset(value.get('ValueName')
+                        for value in attr.allowable_values
+                        if isinstance(value, dict))
+    return (allowed - {None}) or None
+
+
+class AttributeIndex(collections.abc.Mapping):
+    """Attributes of a registry indexed by name
+
+    Maps attribute names to `AttributeListField`. The properties used to
+    validate values are stored column by column.
+    """
+
+    __slots__ = ('_rows', '_attributes', '_types', '_writable',
+                 '_lower_bounds', '_upper_bounds', '_min_lengths',
+                 '_max_lengths', '_value_expressions', '_allowable_values')
+
+    def __init__(self, attributes):
+        """Create the index
+
+        :param attributes: an iterable of `AttributeListField`
+        """
+        self._rows = {}
+        self._attributes = tuple(attributes)
+        columns = [[] for _ in range(8)]
+        for row, attr in enumerate(self._attributes):
+            self._rows.setdefault(attr.name, row)
+            for column, value in zip(columns, (
+                    attr.attribute_type,
+                    not (attr.read_only or attr.immutable),
+                    attr.lower_bound, attr.upper_bound,
+                    attr.min_length, attr.max_length,
+                    _compile_expression(attr), _get_allowed_values(attr))):
+                column.append(value)
+
+        (self._types, self._writable, self._lower_bounds,
+         self._upper_bounds, self._min_lengths, self._max_lengths,
+         self._value_expressions, self._allowable_values) = map(tuple,
+                                                                columns)
+
+    def __getitem__(self, name):
+        return self._attributes[self._rows[name]]
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __contains__(self, name):
+        return name in self._rows
+
+    def validate(self, values):
+        """Validate attribute values against the registry
+
+        Checks that the attributes exist and are writable, and that the
+        values have the right type, are within the bounds and lengths,
+        match the value expression and are allowable values.
+
+        :param values: dict of attribute names and values
+        :returns: a list of `AttributeViolation`, empty if all values are
+            valid
+        """
+        violations = []
+        for name, value in values.items():
+            row = self._rows.get(name)
+            if row is None:
+                reason = 'unknown attribute'
+            elif not self._writable[row]:
+                reason = 'attribute is read-only'
+            else:
+                check = _CHECKS.get(self._types[row])
+                reason = check(self, row, value) if check else None
+            if reason:
+                violations.append(AttributeViolation(name, value, reason))
+        return violations
+
 
 class AttributeRegistryEntryField(base.CompositeField):
 
@@ -96,3 +259,13 @@ class AttributeRegistry(base.ResourceBase):
 
     registry_entries = AttributeRegistryEntryField('RegistryEntries')
     """Field containing Attributes, Dependencies, Menus etc."""
+
+    @property
+    @utils.cache_it
+    def attribute_index(self):
+        """Attributes of this registry indexed by name
+
+        :returns: an `AttributeIndex`
+        """
+        entries = self.registry_entries
+        return AttributeIndex(entries.attributes or [] if entries else [])
@@ -13,7 +13,10 @@
 # This is referred from Redfish standard schema.
 # https://redfish.dmtf.org/schemas/v1/MessageRegistry.v1_1_1.json
 
+import collections
+import functools
 import logging
+import re
 
 from sushy.resources import base
 from sushy.resources import constants as res_cons
@@ -21,6 +24,17 @@ from sushy.resources.registry import constants as reg_cons
 
 LOG = logging.getLogger(__name__)
 
+_ARG_RE = re.compile(r'%(\d+)')
+
+# Registries searched, in order, for messages without a registry name
+_FALLBACK_REGISTRIES = ('Messages', 'BaseMessages')
+
+
+RegistryMessage = collections.namedtuple(
+    'RegistryMessage', ['description', 'message', 'number_of_args',
+                        'param_types', 'resolution', 'severity'])
+"""A message of a registry, same as `MessageDictionaryField`"""
+
 
 class MessageDictionaryField(base.DictionaryField):
 
@@ -99,28 +113,8 @@ def parse_message(message_registries, message_field):
     :returns: parsed settings.MessageListField with missing attributes filled
     """
 
-    reg_msg = None
-    if '.' in message_field.message_id:
-        registry, msg_key = message_field.message_id.rsplit('.', 1)
-
-        if (registry in message_registries
-                and hasattr(message_registries[registry], "messages")
-                and msg_key in message_registries[registry].messages):
-            reg_msg = message_registries[registry].messages[msg_key]
-    else:
-        # Some firmware only reports the MessageKey and no RegistryName.
-        # Fall back to the MessageRegistryFile with Id of Messages next, and
-        # BaseMessages as a last resort
-        registry = 'unknown'
-        msg_key = message_field.message_id
-
-        mrf_ids = ['Messages', 'BaseMessages']
-        for mrf_id in mrf_ids:
-            if (mrf_id in message_registries and msg_key in
-                    message_registries[mrf_id].messages):
-                reg_msg = message_registries[mrf_id].messages[msg_key]
-                break
-
+    registry, msg_key, reg_msg = _find_message(message_registries,
+                                               message_field.message_id)
     if not reg_msg:
         LOG.warning(
             'Unable to find message for registry %(registry)s, '
@@ -131,18 +125,67 @@ def parse_message(message_registries, message_field):
             message_field.message = 'unknown'
         return message_field
 
-    msg = reg_msg.message
-    for i in range(1, reg_msg.number_of_args + 1):
-        if i <= len(message_field.message_args):
-            msg = msg.replace('%%%i' % i,
-                              str(message_field.message_args[i - 1]))
-        else:
-            msg = msg.replace('%%%i' % i, 'unknown')
-
-    message_field.message = msg
+    args = ()
+    if reg_msg.number_of_args:
+        args = tuple(str(arg) for arg in message_field.message_args or ())
+    message_field.message = _render(reg_msg.message, reg_msg.number_of_args,
+                                    args)
     if not message_field.severity:
         message_field.severity = reg_msg.severity
     if not message_field.resolution:
         message_field.resolution = reg_msg.resolution
 
     return message_field
+
+
+def _find_message(message_registries, message_id):
+    """Find the registry message of a MessageId
+
+    :returns: a tuple with the registry name, the message key and the
+        registry message or None if not found
+    """
+    if '.' in message_id:
+        registry, msg_key = message_id.rsplit('.', 1)
+        messages = getattr(message_registries.get(registry), 'messages', None)
+        return registry, msg_key, messages and messages.get(msg_key)
+
+    # Some firmware only reports the MessageKey and no RegistryName.
+    # Fall back to the MessageRegistryFile with Id of Messages next, and
+    # BaseMessages as a last resort
+    for mrf_id in _FALLBACK_REGISTRIES:
+        messages = getattr(message_registries.get(mrf_id), 'messages', None)
+        if messages and message_id in messages:
+            return mrf_id, message_id, messages[message_id]
+
+    return 'unknown', message_id, None
+
+
+@functools.lru_cache(maxsize=256)
+def _tokenize(template, number_of_args):
+    """Split a message template into literal strings and argument indexes
+
+    Placeholders beyond ``number_of_args`` are kept as literal text.
+    """
+    segments = []
+    literal = []
+    for i, part in enumerate(_ARG_RE.split(template)):
+        if i % 2 and 1 <= int(part) <= number_of_args:
+            segments.append(''.join(literal))
+            segments.append(int(part) - 1)
+            literal = []
+        else:
+            literal.append('%' + part if i % 2 else part)
+    segments.append(''.join(literal))
+    return tuple(segment for segment in segments if segment != '')
+
+
+@functools.lru_cache(maxsize=1024)
+def _render(template, number_of_args, args):
+    """Substitute the arguments of a message template
+
+    Missing arguments are substituted with ``unknown``.
+    """
+    return ''.join(
+        segment if isinstance(segment, str)
+        else (args[segment] if segment < len(args) else 'unknown')
+        for segment in _tokenize(template, number_of_args))
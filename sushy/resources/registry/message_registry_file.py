@@ -14,6 +14,8 @@
 # https://redfish.dmtf.org/schemas/v1/MessageRegistryFileCollection.json
 # https://redfish.dmtf.org/schemas/v1/MessageRegistryFile.v1_1_0.json
 
+import hashlib
+import json
 import logging
 
 from sushy.resources import base
@@ -49,6 +51,39 @@ class LocationListField(base.ListField):
     """Location URI of publicly available schema"""
 
 
+def _detach(registry):
+    """Drop the references of a pooled registry to the client loading it
+
+    The connector holds the credentials of that client. Pooled registries
+    are never fetched again.
+    """
+    if registry is not None:
+        registry._conn = None
+        registry._reader = None
+    return registry
+
+
+def _get_pool_key(json_doc, language, requested_type):
+    """Get the key identifying the contents of a registry in a pool
+
+    Message registries are identified by their prefix, full version and
+    language, so they are shared by the clients of all the services
+    providing them. Attribute registries with the same prefix and version
+    differ between server models and BIOS releases, so they are identified
+    by a digest of their document, as are registries without a version.
+    """
+    prefix = json_doc.get('RegistryPrefix')
+    version = json_doc.get('RegistryVersion')
+    if (requested_type == 'MessageRegistry' and isinstance(prefix, str)
+            and isinstance(version, str)):
+        return (requested_type, prefix, version,
+                str(json_doc.get('Language') or language).lower())
+
+    digest = hashlib.sha256(
+        json.dumps(json_doc, sort_keys=True).encode()).hexdigest()
+    return requested_type, digest
+
+
 class RegistryType(base.ResourceBase):
     _odata_type = base.Field('@odata.type', required=True)
 
@@ -76,32 +111,140 @@ class MessageRegistryFile(base.ResourceBase):
     location = LocationListField('Location', required=True)
     """List of locations of Registry files for each supported language"""
 
-    def get_message_registry(self, language, public_connector):
+    def get_message_registry(self, language, public_connector, store=None,
+                             pool=None):
         """Get a Message Registry from the location
 
         :param language: RFC 5646 language code for registry files
         :param public_connector: connector to use when downloading registry
             from the Internet
+        :param store: a `RegistryStore` to look the registry up in before
+            downloading it, and to store it in after. The stored registry
+            may be of another patch version than the one of the service.
+        :param pool: a `RegistryPool` to share the parsed registry in.
         :returns: a MessageRegistry or None if not found
         """
         return self._get_registry(language, public_connector,
                                   'MessageRegistry',
-                                  message_registry.MessageRegistry)
+                                  message_registry.MessageRegistry,
+                                  store=store, pool=pool)
 
-    def get_attribute_registry(self, language, public_connector):
+    def get_attribute_registry(self, language, public_connector,
+                               store=None, pool=None):
         """Get an Attribute Registry from the location
 
         :param language: RFC 5646 language code for registry files
         :param public_connector: connector to use when downloading registry
             from the Internet
+        :param store: a `RegistryStore` to look the registry up in before
+            downloading it, and to store it in after, only used if its
+            ``attribute_registries`` is set.
+        :param pool: a `RegistryPool` to share the parsed registry in.
         :returns: an AttributeRegistry or None if not found
         """
         return self._get_registry(language, public_connector,
                                   'AttributeRegistry',
-                                  attribute_registry.AttributeRegistry)
+                                  attribute_registry.AttributeRegistry,
+                                  store=store, pool=pool)
+
+    def _create_registry(self, registry_class, args, kwargs, json_doc,
+                         language, requested_type, pool):
+        """Create a registry from its JSON document
+
+        :param registry_class: registry class
+        :param args: positional arguments of the registry class
+        :param kwargs: keyword arguments of the registry class
+        :param json_doc: the registry JSON document
+        :param language: RFC 5646 language code for registry files
+        :param requested_type: string identifying registry
+        :param pool: a `RegistryPool` or None
+        :returns: the registry, the pooled one with the same contents if any
+        """
+        if pool is None:
+            return registry_class(*args, json_doc=json_doc, **kwargs)
+
+        return pool.get_or_load(
+            _get_pool_key(json_doc, language, requested_type),
+            lambda: _detach(registry_class(*args, json_doc=json_doc,
+                                           **kwargs)))
+
+    def _get_stored_registry(self, store, language, requested_type,
+                             registry_class, pool=None):
+        """Load registry from a registry store
+
+        :param store: the `RegistryStore`
+        :param language: RFC 5646 language code for registry files
+        :param requested_type: string identifying registry
+        :param registry_class: registry class
+        :param pool: a `RegistryPool` to share the registry in, or None
+        :returns: tuple of whether the registry is stored and the registry,
+            None if it is of another type.
+        """
+        prefix, _, major_minor = self.registry.partition('.')
+        version = store.get_version(prefix, major_minor, language)
+        if version is None:
+            return False, None
+
+        json_doc = store.get(prefix, version, language)
+        if json_doc is None:
+            return False, None
+
+        # NOTE: the recorded version only points at the document stored
+        # last, it must actually be that version of this registry
+        if (json_doc.get('RegistryVersion') != version
+                or json_doc.get('RegistryPrefix', prefix) != prefix):
+            LOG.warning('Ignoring stored registry %(registry)s, it is not '
+                        'version %(version)s',
+                        {'registry': self.registry, 'version': version})
+            return False, None
+
+        odata_type = json_doc.get('@odata.type', '')
+        # NOTE: attribute registries of other server models may be stored
+        # with the same prefix and version
+        if (odata_type.endswith('AttributeRegistry')
+                and not store.attribute_registries):
+            return False, None
+
+        if not odata_type.endswith(requested_type):
+            return True, None
+
+        try:
+            registry = self._create_registry(
+                registry_class, (self._conn, self._path),
+                {'redfish_version': self.redfish_version}, json_doc,
+                language, requested_type, pool)
+        except Exception as exc:
+            LOG.warning('Cannot load stored registry %(registry)s: '
+                        '%(error)s',
+                        {'registry': self.registry, 'error': exc})
+            return False, None
+
+        LOG.debug('Loaded registry %(registry)s version %(version)s from '
+                  'the registry store',
+                  {'registry': self.registry, 'version': version})
+        return True, registry
+
+    def _store_registry(self, store, language, json_doc):
+        """Store a downloaded registry in a registry store
+
+        :param store: the `RegistryStore`
+        :param language: RFC 5646 language code for registry files
+        :param json_doc: the registry JSON document
+        """
+        prefix, _, major_minor = self.registry.partition('.')
+        version = json_doc.get('RegistryVersion')
+        if (not isinstance(version, str) or not version
+                or json_doc.get('RegistryPrefix', prefix) != prefix):
+            LOG.debug('Not storing registry %(registry)s without a '
+                      'matching prefix and version',
+                      {'registry': self.registry})
+            return
+
+        store.put(prefix, version, language, json_doc)
+        store.set_version(prefix, major_minor, language, version)
 
     def _get_registry(self, language, public_connector, requested_type,
-                      registry_class):
+                      registry_class, store=None, pool=None):
         """Load registry file depending on the registry type
 
         Will try to find requested_type based on `odata.type` property,
@@ -113,12 +256,39 @@ class MessageRegistryFile(base.ResourceBase):
             from the Internet
         :param requested_type: string identifying registry
         :param registry_class: registry class
+        :param store: a `RegistryStore` or None
+        :param pool: a `RegistryPool` or None
         :returns: registry or None if not found
         """
 
         # NOTE (etingof): as per RFC5646, languages are case-insensitive
         language = language.lower()
 
+        # NOTE: the registry is unknown when the Registry field is missing
+        if self.registry == 'UNKNOWN.0.0':
+            store = pool = None
+
+        if pool is not None and not (requested_type == 'MessageRegistry'
+                                     or pool.attribute_registries):
+            pool = None
+
+        return self._load_registry(language, public_connector,
+                                   requested_type, registry_class, store,
+                                   pool)
+
+    def _load_registry(self, language, public_connector, requested_type,
+                       registry_class, store, pool):
+        """Load registry file from the store or the locations
+
+        The registry is only parsed if no registry with the same contents
+        is in the pool. See ``_get_registry()`` for the arguments.
+        """
+        if store is not None:
+            stored, registry = self._get_stored_registry(
+                store, language, requested_type, registry_class, pool)
+            if stored:
+                return registry
+
         # NOTE(iurygregory): some registries may have "en-US" as their
         # language, in this case we can check if the registry language
         # starts with the requested language.
@@ -174,7 +344,13 @@ class MessageRegistryFile(base.ResourceBase):
 
             if registry_type._odata_type.endswith(requested_type):
                 try:
-                    return registry_class(*args, **kwargs)
+                    if pool is None:
+                        registry = registry_class(*args, **kwargs)
+                    else:
+                        # NOTE: the contents are only known once downloaded
+                        registry = self._create_registry(
+                            registry_class, args, kwargs, registry_type.json,
+                            language, requested_type, pool)
 
                 except Exception as exc:
                     LOG.warning(
@@ -185,6 +361,11 @@ class MessageRegistryFile(base.ResourceBase):
                             'error': exc})
                     continue
 
+                if store is not None and (requested_type == 'MessageRegistry'
+                                          or store.attribute_registries):
+                    self._store_registry(store, language, registry.json)
+                return registry
+
             LOG.debug('Ignoring unsupported flavor of registry %(registry)s',
                       {'registry': registry_type._odata_type})
             return
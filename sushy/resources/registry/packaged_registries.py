@@ -0,0 +1,104 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Standard message registries packaged with sushy.
+
+Parsing the packaged JSON registries with the fields of `MessageRegistry`
+is slow, and only a few of them are usually needed. The registries are
+only decoded from JSON when first loaded, which is enough to index them by
+their metadata. The messages of each registry are parsed when first used.
+"""
+
+import functools
+from importlib import resources
+import json
+import logging
+import threading
+
+from sushy.resources.registry import message_registry
+
+LOG = logging.getLogger(__name__)
+
+REGISTRIES_PATH = 'standard_registries'
+"""Directory of the packaged registries in the sushy package"""
+
+# Attributes of `MessageRegistry` by JSON property, all required but the
+# description
+_METADATA = {'identity': 'Id', 'name': 'Name', 'description': 'Description',
+             'language': 'Language', 'owning_entity': 'OwningEntity',
+             'registry_prefix': 'RegistryPrefix',
+             'registry_version': 'RegistryVersion'}
+
+
+class PackagedMessageRegistry:
+    """A packaged message registry with messages parsed on first use
+
+    It has the same attributes as `MessageRegistry`, messages are
+    `RegistryMessage` tuples.
+    """
+
+    def __init__(self, path, json_doc):
+        for name, prop in _METADATA.items():
+            setattr(self, name, (json_doc.get(prop) if name == 'description'
+                                 else json_doc[prop]))
+        self._path = path
+        self._json_doc = json_doc
+        self._messages = None
+        self._lock = threading.Lock()
+
+    @property
+    def messages(self):
+        """Messages of this registry by message key"""
+        if self._messages is None:
+            with self._lock:
+                if self._messages is None:
+                    self._messages = _parse_messages(self._path,
+                                                     self._json_doc)
+                    self._json_doc = None
+        return self._messages
+
+
+def _parse_messages(path, json_doc):
+    registry = message_registry.MessageRegistry(None, path,
+                                                json_doc=json_doc)
+    return {
+        key: message_registry.RegistryMessage(
+            msg.description, msg.message, msg.number_of_args,
+            msg.param_types, msg.resolution, msg.severity)
+        for key, msg in registry.messages.items()}
+
+
+def _read_registry_files():
+    """Read the packaged registries
+
+    :returns: a dict of the contents of the JSON files by file name
+    """
+    directory = resources.files('sushy').joinpath(REGISTRIES_PATH)
+    return {entry.name: entry.read_bytes()
+            for entry in directory.iterdir()
+            if entry.is_file() and entry.name.endswith('.json')}
+
+
+@functools.lru_cache(maxsize=None)
+def get_registries():
+    """Get the packaged standard registries
+
+    :returns: a list of `PackagedMessageRegistry` or None if the packaged
+        registries cannot be loaded
+    """
+    try:
+        return [PackagedMessageRegistry(name, json.loads(contents))
+                for name, contents
+                in sorted(_read_registry_files().items())]
+    except Exception as exc:
+        LOG.debug('Cannot load the packaged registries: %s', exc)
+        return None
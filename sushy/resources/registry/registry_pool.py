@@ -0,0 +1,113 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import collections
+import threading
+
+
+class RegistryPool:
+    """Parsed registries shared by Sushy clients
+
+    Registries are kept by a key identifying their contents. Message
+    registries of services are identified by their prefix, full version and
+    language, so a registry is parsed once for all the services providing
+    it, e.g. servers of the same model. The ``maxsize`` most recently used
+    ones are kept. Registries in the pool must not be modified.
+    """
+
+    def __init__(self, maxsize=256, attribute_registries=False):
+        """Create a registry pool
+
+        :param maxsize: the maximum number of registries kept.
+        :param attribute_registries: whether attribute registries of
+            services are pooled too, not only message registries. They
+            differ between server models and BIOS releases with the same
+            prefix and version, so they are identified by a digest of
+            their document, computed every time they are downloaded.
+        """
+        self._maxsize = maxsize
+        self.attribute_registries = attribute_registries
+        self._registries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        # Locks of the keys being loaded, with the number of their users
+        self._loading = {}
+
+    def __len__(self):
+        return len(self._registries)
+
+    def get(self, key):
+        """Get a registry
+
+        :param key: the key of the registry
+        :returns: the registry or None if it is not in the pool
+        """
+        with self._lock:
+            registry = self._registries.get(key)
+            if registry is not None:
+                self._registries.move_to_end(key)
+            return registry
+
+    def add(self, key, registry):
+        """Add a registry, evicting the least recently used ones if needed
+
+        :param key: the key of the registry
+        :param registry: the registry
+        """
+        with self._lock:
+            self._registries[key] = registry
+            self._registries.move_to_end(key)
+            while len(self._registries) > self._maxsize:
+                self._registries.popitem(last=False)
+
+    def get_or_load(self, key, load):
+        """Get a registry, loading it if it is not in the pool
+
+        Threads getting the same registry at the same time wait for the
+        first one to load it.
+
+        :param key: the key of the registry
+        :param load: callable returning the registry or None if it cannot
+            be loaded, in which case nothing is added to the pool
+        :returns: the registry or None
+        """
+        registry = self.get(key)
+        if registry is not None:
+            return registry
+
+        with self._lock:
+            lock, users = self._loading.get(key, (threading.Lock(), 0))
+            self._loading[key] = (lock, users + 1)
+
+        try:
+            with lock:
+                registry = self.get(key)
+                if registry is None:
+                    registry = load()
+                    if registry is not None:
+                        self.add(key, registry)
+                return registry
+        finally:
+            with self._lock:
+                lock, users = self._loading[key]
+                if users == 1:
+                    del self._loading[key]
+                else:
+                    self._loading[key] = (lock, users - 1)
+
+    def clear(self):
+        """Remove all registries."""
+        with self._lock:
+            self._registries.clear()
+
+
+DEFAULT_POOL = RegistryPool()
+"""A registry pool for the Sushy clients of a whole process"""
@@ -0,0 +1,159 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import abc
+import contextlib
+import json
+import logging
+import os
+import re
+import tempfile
+
+LOG = logging.getLogger(__name__)
+
+
+class RegistryStore(metaclass=abc.ABCMeta):
+    """Storage of registry documents shared by Sushy clients
+
+    Registries are identified by their prefix, e.g. ``Base``, their full
+    version as given by their ``RegistryVersion`` property, e.g. ``1.0.3``,
+    and their language. Services only tell the Major_version.Minor_version
+    of their registries before they are downloaded, so the store also
+    records the full version last stored for each of them. A message
+    registry may thus be served at another patch version than the one of
+    the service asking for it.
+
+    Attribute registries with the same prefix and version differ between
+    server models and BIOS releases, so they are only stored and served
+    by stores with ``attribute_registries`` set.
+    """
+
+    attribute_registries = False
+    """Whether attribute registries are stored, not only message registries
+    """
+
+    @abc.abstractmethod
+    def get(self, prefix, version, language):
+        """Get a registry document
+
+        :param prefix: registry prefix
+        :param version: full registry version
+        :param language: RFC 5646 language code of the registry
+        :returns: the registry JSON document or None if not stored
+        """
+
+    @abc.abstractmethod
+    def put(self, prefix, version, language, json_doc):
+        """Store a registry document
+
+        :param prefix: registry prefix
+        :param version: full registry version
+        :param language: RFC 5646 language code of the registry
+        :param json_doc: the registry JSON document
+        """
+
+    @abc.abstractmethod
+    def get_version(self, prefix, major_minor, language):
+        """Get the full version last stored for a Major.Minor version
+
+        :param prefix: registry prefix
+        :param major_minor: registry version in form
+            Major_version.Minor_version
+        :param language: RFC 5646 language code of the registry
+        :returns: the full registry version or None if not recorded
+        """
+
+    @abc.abstractmethod
+    def set_version(self, prefix, major_minor, language, version):
+        """Record the full version last stored for a Major.Minor version
+
+        :param prefix: registry prefix
+        :param major_minor: registry version in form
+            Major_version.Minor_version
+        :param language: RFC 5646 language code of the registry
+        :param version: full registry version
+        """
+
+
+class DirectoryRegistryStore(RegistryStore):
+    """Registry store keeping each registry in a file of a directory
+
+    The full version recorded for each Major.Minor version is kept in a
+    small file next to the registries.
+    """
+
+    def __init__(self, path, attribute_registries=False):
+        """Create a registry store
+
+        :param path: the directory, created if it does not exist
+        :param attribute_registries: whether attribute registries are
+            stored too, only safe if all the services using the store
+            provide the same attribute registries for the same prefix and
+            version, e.g. servers of the same model and BIOS release.
+        """
+        self._path = path
+        self.attribute_registries = attribute_registries
+
+    def _get_file_path(self, prefix, version, language, suffix):
+        name = re.sub(r'[^\w.-]', '_',
+                      f'{prefix}.{version}.{language.lower()}')
+        return os.path.join(self._path, name + suffix)
+
+    def _read(self, file_path, load):
+        try:
+            with open(file_path) as f:
+                return load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            LOG.warning('Cannot read registry store file %(path)s: '
+                        '%(error)s', {'path': file_path, 'error': exc})
+            return None
+
+    def _write(self, file_path, dump):
+        tmp_path = None
+        try:
+            os.makedirs(self._path, exist_ok=True)
+            # Written to a temporary file first, so that other processes
+            # never read a partial file
+            with tempfile.NamedTemporaryFile(
+                    'w', dir=self._path, suffix='.tmp',
+                    delete=False) as f:
+                tmp_path = f.name
+                dump(f)
+            os.replace(tmp_path, file_path)
+        except (OSError, TypeError, ValueError) as exc:
+            LOG.warning('Cannot write registry store file %(path)s: '
+                        '%(error)s', {'path': file_path, 'error': exc})
+            if tmp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
+
+    def get(self, prefix, version, language):
+        return self._read(
+            self._get_file_path(prefix, version, language, '.json'),
+            json.load)
+
+    def put(self, prefix, version, language, json_doc):
+        self._write(self._get_file_path(prefix, version, language, '.json'),
+                    lambda f: json.dump(json_doc, f))
+
+    def get_version(self, prefix, major_minor, language):
+        version = self._read(
+            self._get_file_path(prefix, major_minor, language, '.version'),
+            lambda f: f.read().strip())
+        return version or None
+
+    def set_version(self, prefix, major_minor, language, version):
+        self._write(
+            self._get_file_path(prefix, major_minor, language, '.version'),
+            lambda f: f.write(version))
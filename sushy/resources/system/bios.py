@@ -32,6 +32,9 @@ class ActionsField(base.CompositeField):
 
 class Bios(base.ResourceBase):
 
+    max_age = 600
+    """BIOS attributes are refreshed when older than 10 minutes"""
+
     def __init__(self, connector, path, redfish_version=None, registries=None,
                  root=None):
         """A class representing a Bios
@@ -103,7 +106,7 @@ class Bios(base.ResourceBase):
 
     def set_attribute(self, key, value, apply_time=None,
                       maint_window_start_time=None,
-                      maint_window_duration=None):
+                      maint_window_duration=None, validate=False):
         """Update an attribute
 
         Attribute update is not immediate but requires system restart.
@@ -121,13 +124,17 @@ class Bios(base.ResourceBase):
             maintenance window start time in seconds. Required when updating
             during maintenance window and default maintenance window not
             set by the system.
+        :param validate: Whether to validate the attribute against the
+            attribute registry before updating it, see
+            :py:func:`~set_attributes`.
+        :raises: InvalidAttributesError if the attribute is invalid.
         """
         self.set_attributes({key: value}, apply_time, maint_window_start_time,
-                            maint_window_duration)
+                            maint_window_duration, validate=validate)
 
     def set_attributes(self, value, apply_time=None,
                        maint_window_start_time=None,
-                       maint_window_duration=None):
+                       maint_window_duration=None, validate=False):
         """Update many attributes at once
 
         Attribute update is not immediate but requires system restart.
@@ -144,7 +151,15 @@ class Bios(base.ResourceBase):
             maintenance window start time in seconds. Required when updating
             during maintenance window and default maintenance window not
             set by the system.
+        :param validate: Whether to validate the attributes against the
+            attribute registry before updating them. Invalid attributes
+            would otherwise only be reported after the system restart.
+            Validation is skipped if the registry is not available.
+        :raises: InvalidAttributesError with all the invalid attributes.
         """
+        if validate:
+            self._validate_attributes(value)
+
         payload = {'Attributes': value}
         payload = utils.process_apply_time_input(
             payload, apply_time, maint_window_start_time,
@@ -158,6 +173,18 @@ class Bios(base.ResourceBase):
         utils.cache_clear(self, force_refresh=False,
                           only_these=['_pending_settings_resource'])
 
+    def _validate_attributes(self, value):
+        registry = self.get_attribute_registry()
+        if registry is None:
+            LOG.warning('Cannot validate BIOS attributes of %s, the '
+                        'attribute registry is not available', self.identity)
+            return
+
+        violations = registry.attribute_index.validate(value)
+        if violations:
+            raise exceptions.InvalidAttributesError(resource=self._path,
+                                                    violations=violations)
+
     def _get_reset_bios_action_element(self):
         actions = self._actions
 
@@ -53,6 +53,9 @@ class ProcessorIdField(base.CompositeField):
 
 class Processor(base.ResourceBase):
 
+    max_age = 3600
+    """Processors are refreshed when older than an hour"""
+
     identity = base.Field('Id', required=True)
     """The processor identity string"""
 
@@ -92,7 +95,7 @@ class Processor(base.ResourceBase):
     """The total number of execution threads supported by this processor"""
 
     def __init__(self, connector, identity, redfish_version=None,
-                 registries=None, root=None):
+                 registries=None, root=None, json_doc=None):
         """A class representing a Processor
 
         :param connector: A Connector instance
@@ -102,10 +105,11 @@ class Processor(base.ResourceBase):
         :param registries: Dict of Redfish Message Registry objects to be
             used in any resource that needs registries to parse messages
         :param root: Sushy root object. Empty for Sushy root itself.
+        :param json_doc: parsed JSON document in form of Python types.
         """
         super().__init__(
             connector, identity, redfish_version=redfish_version,
-            registries=registries, root=root)
+            registries=registries, root=root, json_doc=json_doc)
 
     def _get_subprocessor_collection_path(self):
         """Helper function to find the SubProcessors path"""
@@ -65,24 +65,6 @@ class SimpleStorageCollection(base.ResourceCollectionBase):
     def _resource_type(self):
         return SimpleStorage
 
-    @utils.cache_it
-    def get_members(self):
-        """Return SimpleStorage objects using expanded JSON when available."""
-        members = []
-        for member in self._json['Members']:
-            # If data only contains a reference (@odata.id),
-            # treat as unexpanded
-            if (isinstance(member, dict)
-                    and list(member.keys()) == ['@odata.id']):
-                return super().get_members()
-
-            simple_storage = SimpleStorage(
-                self._conn, member['@odata.id'],
-                json_doc=member, redfish_version=self.redfish_version,
-                registries=self.registries, root=self.root)
-            members.append(simple_storage)
-        return members
-
     @property
     @utils.cache_it
     def disks_sizes_bytes(self):
@@ -260,7 +260,7 @@ class System(base.ResourceBase):
     """The last updated boot progress indicator"""
 
     def __init__(self, connector, identity, redfish_version=None,
-                 registries=None, root=None):
+                 registries=None, root=None, json_doc=None, select=None):
         """A class representing a ComputerSystem
 
         :param connector: A Connector instance
@@ -270,12 +270,14 @@ class System(base.ResourceBase):
         :param registries: Dict of registries to be used in any resource
             that needs registries to parse messages.
         :param root: Sushy root object. Empty for Sushy root itself.
+        :param json_doc: parsed JSON document in form of Python types.
+        :param select: names of the only properties to fetch.
         """
         super().__init__(
             connector, identity,
             redfish_version=redfish_version,
             registries=registries,
-            root=root)
+            root=root, json_doc=json_doc, select=select)
 
     def _get_reset_action_element(self):
         reset_action = self._actions.reset
@@ -780,7 +782,7 @@ class SystemCollection(base.ResourceCollectionBase):
         return System
 
     def __init__(self, connector, path, redfish_version=None, registries=None,
-                 root=None):
+                 root=None, json_doc=None):
         """A class representing a ComputerSystemCollection
 
         :param connector: A Connector instance
@@ -790,7 +792,8 @@ class SystemCollection(base.ResourceCollectionBase):
         :param registries: Dict of Redfish Message Registry objects to be
             used in any resource that needs registries to parse messages
         :param root: Sushy root object. Empty for Sushy root itself.
+        :param json_doc: parsed JSON document in form of Python types.
         """
         super().__init__(
             connector, path, redfish_version=redfish_version,
-            registries=registries, root=root)
+            registries=registries, root=root, json_doc=json_doc)
@@ -59,7 +59,8 @@ class SoftwareInventory(base.ResourceBase):
     """The version of the software"""
 
     def __init__(self, connector, identity,
-                 redfish_version=None, registries=None, root=None):
+                 redfish_version=None, registries=None, root=None,
+                 json_doc=None):
         """A class representing a SoftwareInventory
 
         :param connector: A Connector instance
@@ -69,10 +70,11 @@ class SoftwareInventory(base.ResourceBase):
         :param registries: Dict of Redfish Message Registry objects to be
             used in any resource that needs registries to parse messages
         :param root: Sushy root object. Empty for Sushy root itself.
+        :param json_doc: parsed JSON document in form of Python types.
         """
         super().__init__(
             connector, identity, redfish_version=redfish_version,
-            registries=registries, root=root)
+            registries=registries, root=root, json_doc=json_doc)
 
 
 class SoftwareInventoryCollection(base.ResourceCollectionBase):
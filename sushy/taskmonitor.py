@@ -13,16 +13,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent import futures
 from datetime import datetime
+import heapq
 from http import client as http_client
+import itertools
 import logging
+import threading
 import time
 from urllib.parse import urljoin
 
 from dateutil import parser
 
 from sushy import exceptions
+from sushy import polling
 from sushy.resources.taskservice import task
+from sushy import utils
 
 LOG = logging.getLogger(__name__)
 
@@ -33,7 +39,8 @@ class TaskMonitor:
                  task_monitor_uri,
                  redfish_version=None,
                  registries=None,
-                 response=None):
+                 response=None,
+                 poll_strategy=None):
         """A class representing a task monitor
 
         :param connector: A Connector instance
@@ -43,6 +50,9 @@ class TaskMonitor:
         :param registries: Dict of Redfish Message Registry objects to be
             used in any resource that needs registries to parse messages.
         :param response: Raw response
+        :param poll_strategy: A `sushy.polling.PollStrategy` deciding how
+            long to wait between polls. Defaults to polling every second
+            unless the service sends ``Retry-After``.
         """
         self._connector = connector
         self._task_monitor_uri = task_monitor_uri
@@ -50,13 +60,17 @@ class TaskMonitor:
         self._registries = registries
         self._task = None
         self._response = response
+        self._poll_strategy = poll_strategy or polling.FixedPollStrategy()
+        self._poll_count = 0
+        self._started_at = time.monotonic()
 
         if (self._response and self._response.content
                 and self._response.status_code == http_client.ACCEPTED):
-            self._task = task.Task(self._connector, self._task_monitor_uri,
-                                   redfish_version=self._redfish_version,
-                                   registries=self._registries,
-                                   json_doc=self._response.json())
+            self._task = task.Task(
+                self._connector, self._task_monitor_uri,
+                redfish_version=self._redfish_version,
+                registries=self._registries,
+                json_doc=utils.json_from_response(self._response))
         else:
             self.refresh()
 
@@ -69,6 +83,7 @@ class TaskMonitor:
         :raises: HTTPError
         """
         self._response = self._connector.get(path=self.task_monitor_uri)
+        self._poll_count += 1
 
         if self._response.status_code == http_client.ACCEPTED:
             # A Task should have been returned, but wasn't
@@ -77,13 +92,14 @@ class TaskMonitor:
                 return
 
             # Assume that the body contains a Task since we got a 202
+            json_doc = utils.json_from_response(self._response)
             if not self._task:
                 self._task = task.Task(self._connector, self._task_monitor_uri,
                                        redfish_version=self._redfish_version,
                                        registries=self._registries,
-                                       json_doc=self._response.json())
+                                       json_doc=json_doc)
             else:
-                self._task.refresh(json_doc=self._response.json())
+                self._task.refresh(json_doc=json_doc)
         else:
             self._task = None
 
@@ -116,20 +132,40 @@ class TaskMonitor:
 
         return self.is_processing
 
+    @property
+    def poll_count(self):
+        """The number of times the task monitor has been fetched
+
+        :returns: The number of GET requests done to the task monitor URI.
+        """
+        return self._poll_count
+
     @property
     def sleep_for(self):
         """Seconds the client should wait before querying the operation status
 
+        Decided by the poll strategy from the Retry-After header of the last
+        response, the number of polls so far and the progress of the task.
         Defaults to 1 second if Retry-After not specified in response.
 
         :returns: The number of seconds to wait
         """
+        percent_complete = getattr(self._task, 'percent_complete', None)
+        return self._poll_strategy.delay(
+            self._poll_count, retry_after=self._retry_after,
+            percent_complete=(percent_complete
+                              if isinstance(percent_complete, int) else None),
+            elapsed=time.monotonic() - self._started_at)
+
+    @property
+    def _retry_after(self):
+        """Seconds to wait according to Retry-After, None if not specified"""
         retry_after = self._response.headers.get('Retry-After')
         if retry_after is None:
-            return 1
+            return None
 
         if isinstance(retry_after, int) or retry_after.isdigit():
-            return retry_after
+            return int(retry_after)
 
         return max(0, (parser.parse(retry_after)
                    - datetime.now().astimezone()).total_seconds())
@@ -178,37 +214,48 @@ class TaskMonitor:
     def wait(self, timeout_sec):
         """Waits until task is completed or it times out.
 
+        The task monitor is fetched once per poll cycle. The last sleep is
+        shortened so that the final poll happens when the timeout expires.
+
         :param timeout_sec: Timeout to wait
         :raises: ConnectionError when times out
         """
-        timeout_at = time.time() + timeout_sec
+        timeout_at = time.monotonic() + timeout_sec
 
         while self.check_is_processing:
+            remaining = timeout_at - time.monotonic()
+            if remaining <= 0:
+                m = (f'Timeout waiting for task monitor '
+                     f'{self.task_monitor_uri} (timeout = {timeout_sec}, '
+                     f'polls = {self._poll_count})')
+                raise exceptions.ConnectionError(url=self.task_monitor_uri,
+                                                 error=m)
 
+            sleep_for = min(self.sleep_for, remaining)
             LOG.debug('Waiting for task monitor %(url)s; sleeping for '
                       '%(sleep)s seconds',
                       {'url': self.task_monitor_uri,
-                       'sleep': self.sleep_for})
-            time.sleep(self.sleep_for)
-            if time.time() >= timeout_at and self.check_is_processing:
-                m = (f'Timeout waiting for task monitor '
-                     f'{self.task_monitor_uri} (timeout = {timeout_sec})')
-                raise exceptions.ConnectionError(url=self.task_monitor_uri,
-                                                 error=m)
+                       'sleep': sleep_for})
+            time.sleep(sleep_for)
+
+        LOG.debug('Task monitor %(url)s is done after %(polls)s polls',
+                  {'url': self.task_monitor_uri, 'polls': self._poll_count})
 
     @staticmethod
     def from_response(conn, response, target_uri, redfish_version=None,
-                      registries=None):
+                      registries=None, poll_strategy=None):
         """Construct TaskMonitor instance from received response.
 
         :response: Unprocessed response
         :target_uri: URI used to initiate async operation
         :redfish_version: Redfish version. Optional when used internally.
         :registries: Redfish registries. Optional when used internally.
+        :poll_strategy: A `sushy.polling.PollStrategy`. Optional.
         :returns: TaskMonitor instance
         :raises: MissingHeaderError if Location is missing in response
         """
-        json_data = response.json() if response.content else {}
+        json_data = (utils.json_from_response(response) if response.content
+                     else {})
 
         header = 'Location'
         task_monitor_uri = response.headers.get(header)
@@ -225,4 +272,202 @@ class TaskMonitor:
                            task_monitor_uri,
                            redfish_version=redfish_version,
                            registries=registries,
-                           response=response)
+                           response=response,
+                           poll_strategy=poll_strategy)
+
+
+class _Watch:
+    """A task monitor waited for by a `TaskMonitorGroup`"""
+
+    __slots__ = ('monitor', 'future', 'timeout_sec', 'timeout_at')
+
+    def __init__(self, monitor, future, timeout_sec):
+        self.monitor = monitor
+        self.future = future
+        self.timeout_sec = timeout_sec
+        self.timeout_at = (None if timeout_sec is None
+                           else time.monotonic() + timeout_sec)
+
+
+class TaskMonitorGroup:
+    """Waits for many task monitors using a few threads
+
+    Task monitors are kept in a priority queue ordered by the time they
+    are due to be polled, according to their ``Retry-After``. A scheduler
+    thread hands due task monitors to a small pool of worker threads, which
+    poll them once and queue them again until their task is completed.
+
+    Example::
+
+        with taskmonitor.TaskMonitorGroup(max_workers=8) as group:
+            waits = [group.add(monitor, timeout_sec=3600)
+                     for monitor in monitors]
+            for wait in futures.as_completed(waits):
+                print(wait.result().task_monitor_uri, 'done')
+    """
+
+    def __init__(self, max_workers=4):
+        """Create a group of task monitors
+
+        :param max_workers: The maximum number of task monitors polled at
+            the same time.
+        """
+        self._executor = futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='sushy-taskmon')
+        self._queue = []
+        # All task monitors waited for, queued or being polled
+        self._watches = set()
+        # Orders task monitors due at the same time
+        self._counter = itertools.count()
+        self._cond = threading.Condition()
+        self._scheduler = None
+        self._closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        with self._cond:
+            return len(self._queue)
+
+    def add(self, monitor, timeout_sec=None):
+        """Wait for a task monitor
+
+        :param monitor: A `TaskMonitor`
+        :param timeout_sec: Timeout to wait, None to wait until the task is
+            completed.
+        :returns: A ``concurrent.futures.Future`` resolved with the task
+            monitor when its task is completed, or failing with
+            ConnectionError when it times out or the error raised when
+            polling it. Callbacks can be attached with its
+            ``add_done_callback`` method.
+        :raises: RuntimeError if the group is closed
+        """
+        future = futures.Future()
+        watch = _Watch(monitor, future, timeout_sec)
+        if not monitor.is_processing:
+            future.set_result(monitor)
+            return future
+
+        with self._cond:
+            if self._closed:
+                raise RuntimeError('The task monitor group is closed')
+            self._watches.add(watch)
+            self._schedule(watch)
+            if self._scheduler is None:
+                self._scheduler = threading.Thread(
+                    target=self._run, name='sushy-taskmon-scheduler',
+                    daemon=True)
+                self._scheduler.start()
+        return future
+
+    def close(self, wait=True):
+        """Stop waiting for task monitors
+
+        Futures of the task monitors still waited for are cancelled.
+
+        :param wait: Whether to wait for the polls in progress to finish.
+        """
+        with self._cond:
+            self._closed = True
+            self._queue = []
+            watches, self._watches = self._watches, set()
+            self._cond.notify_all()
+
+        # Including the task monitors handed to the workers, whose polls
+        # may be dropped by the shutdown below
+        for watch in watches:
+            self._cancel(watch.future)
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _schedule(self, watch):
+        # Called with the condition held, returns the delay until the poll
+        try:
+            delay = float(watch.monitor.sleep_for)
+        except (TypeError, ValueError):
+            delay = 1
+        now = time.monotonic()
+        due = now + delay
+        if watch.timeout_at is not None:
+            due = min(due, watch.timeout_at)
+        heapq.heappush(self._queue, (due, next(self._counter), watch))
+        self._cond.notify()
+        return due - now
+
+    def _run(self):
+        with self._cond:
+            while not self._closed:
+                if not self._queue:
+                    self._cond.wait()
+                    continue
+
+                delay = self._queue[0][0] - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+
+                _due, _count, watch = heapq.heappop(self._queue)
+                self._executor.submit(self._poll, watch)
+
+    @staticmethod
+    def _cancel(future):
+        # A bare cancel() does not wake up futures.wait() and
+        # futures.as_completed(), the future must be notified as well
+        if future.cancel():
+            try:
+                future.set_running_or_notify_cancel()
+            except RuntimeError:
+                # Already notified
+                pass
+
+    def _resolve(self, watch, set_outcome, outcome):
+        with self._cond:
+            if watch not in self._watches:
+                # Cancelled by close()
+                return
+            self._watches.discard(watch)
+        try:
+            set_outcome(outcome)
+        except futures.InvalidStateError:
+            # Cancelled by the caller while being polled
+            self._cancel(watch.future)
+
+    def _poll(self, watch):
+        monitor = watch.monitor
+        if watch.future.cancelled():
+            with self._cond:
+                self._watches.discard(watch)
+            self._cancel(watch.future)
+            return
+
+        try:
+            processing = monitor.check_is_processing
+        except Exception as exc:
+            self._resolve(watch, watch.future.set_exception, exc)
+            return
+
+        if not processing:
+            self._resolve(watch, watch.future.set_result, monitor)
+            return
+
+        if (watch.timeout_at is not None
+                and time.monotonic() >= watch.timeout_at):
+            m = (f'Timeout waiting for task monitor '
+                 f'{monitor.task_monitor_uri} (timeout = {watch.timeout_sec})')
+            self._resolve(watch, watch.future.set_exception,
+                          exceptions.ConnectionError(
+                              url=monitor.task_monitor_uri, error=m))
+            return
+
+        with self._cond:
+            if self._closed:
+                # Cancelled by close()
+                return
+            delay = self._schedule(watch)
+
+        LOG.debug('Task monitor %(url)s is still processing; polling again '
+                  'in %(sleep)s seconds',
+                  {'url': monitor.task_monitor_uri, 'sleep': delay})
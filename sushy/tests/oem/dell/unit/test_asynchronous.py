@@ -20,6 +20,7 @@ from oslotest.base import BaseTestCase
 
 import sushy
 from sushy.oem.dell.asynchronous import http_call
+from sushy import polling
 
 
 class AsychronousTestCase(BaseTestCase):
@@ -162,3 +163,39 @@ class AsychronousTestCase(BaseTestCase):
         self.assertEqual(self.conn.get.call_count, 1)
         # Should have slept for 404 retry and 202 polling
         self.assertEqual(mock_sleep.call_count, 2)
+
+    @mock.patch('time.sleep', autospec=True)
+    def test_http_call_poll_strategy(self, mock_sleep):
+        self.conn.post.return_value = mock.Mock(
+            status_code=202, headers={'Location': '/Jobs/1'})
+        self.conn.get.side_effect = [
+            mock.Mock(status_code=202, headers={},
+                      content=b'{"PercentComplete": 40}'),
+            mock.Mock(status_code=200)]
+        strategy = mock.Mock(spec=polling.PollStrategy)
+        strategy.delay.side_effect = [5, 10]
+
+        resp = http_call(self.conn, 'POST', '/some/path',
+                         sushy_poll_strategy=strategy,
+                         sushy_task_poll_period=3)
+
+        self.assertEqual(200, resp.status_code)
+        self.assertEqual([mock.call(5), mock.call(10)],
+                         mock_sleep.call_args_list)
+        first, second = strategy.delay.call_args_list
+        self.assertEqual(0, first.args[0])
+        self.assertIsNone(first.kwargs['retry_after'])
+        self.assertEqual(1, second.args[0])
+        self.assertEqual(40, second.kwargs['percent_complete'])
+        self.conn.post.assert_called_once_with('/some/path')
+        self.conn.get.assert_called_with('/Jobs/1')
+
+    @mock.patch('time.sleep', autospec=True)
+    def test_http_call_poll_period(self, mock_sleep):
+        self.conn.post.return_value = mock.Mock(
+            status_code=202, headers={'Location': '/Jobs/1'})
+        self.conn.get.return_value = mock.Mock(status_code=200)
+
+        http_call(self.conn, 'POST', sushy_task_poll_period=3)
+
+        mock_sleep.assert_called_once_with(3)
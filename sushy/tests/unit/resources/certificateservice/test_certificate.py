@@ -89,8 +89,10 @@ class CertificateCollectionTestCase(base.TestCase):
         self.assertEqual("1", cert.identity)
         self.conn.get.assert_has_calls([
             mock.call(path=self.ident),
+            mock.call().headers.get('ETag'),
             mock.call().json(),
             mock.call(path=member),
+            mock.call().headers.get('ETag'),
             mock.call().json(),
         ])
 
@@ -114,10 +116,13 @@ class CertificateCollectionTestCase(base.TestCase):
 
         self.conn.get.assert_has_calls([
             mock.call(path=self.ident),
+            mock.call().headers.get('ETag'),
             mock.call().json(),
             mock.call(path=self.ident),
+            mock.call().headers.get('ETag'),
             mock.call().json(),
             mock.call(path=member),
+            mock.call().headers.get('ETag'),
             mock.call().json(),
         ])
         self.conn.post.assert_called_once_with(
@@ -135,8 +140,10 @@ class CertificateCollectionTestCase(base.TestCase):
 
         self.conn.get.assert_has_calls([
             mock.call(path=self.ident),
+            mock.call().headers.get('ETag'),
             mock.call().json(),
             mock.call(path=self.ident),
+            mock.call().headers.get('ETag'),
             mock.call().json(),
         ])
         self.conn.post.assert_called_once_with(
@@ -74,7 +74,8 @@ class ChassisTestCase(base.TestCase):
                          )
 
     def test__parse_attributes_return(self):
-        attributes = self.chassis._parse_attributes(self.json_doc)
+        self.chassis._parse_attributes(self.json_doc)
+        attributes = self.chassis._get_attributes()
 
         # Test that various types are returned correctly
         self.assertEqual('Blade', attributes.get('name'))
@@ -143,7 +143,8 @@ class PowerTestCase(base.TestCase):
                          self.power.power_supplies[1].spare_part_number)
 
     def test__parse_attributes_return(self):
-        attributes = self.power._parse_attributes(self.json_doc)
+        self.power._parse_attributes(self.json_doc)
+        attributes = self.power._get_attributes()
 
         # Test that various types are returned correctly
         self.assertEqual('Quad Blade Chassis Power', attributes.get('name'))
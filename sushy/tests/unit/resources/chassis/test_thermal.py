@@ -80,7 +80,8 @@ class ThermalTestCase(base.TestCase):
         self.assertEqual('CPU', self.thermal.temperatures[0].physical_context)
 
     def test__parse_attributes_return(self):
-        attributes = self.thermal._parse_attributes(self.json_doc)
+        self.thermal._parse_attributes(self.json_doc)
+        attributes = self.thermal._get_attributes()
 
         # Test that various types are returned correctly
         self.assertEqual([{'identity': '0',
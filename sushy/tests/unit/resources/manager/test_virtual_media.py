@@ -70,7 +70,8 @@ class VirtualMediaTestCase(base.TestCase):
         self.assertEqual(False, self.sys_virtual_media.write_protected)
 
     def test__parse_attributes_return(self):
-        attributes = self.sys_virtual_media._parse_attributes(self.json_doc)
+        self.sys_virtual_media._parse_attributes(self.json_doc)
+        attributes = self.sys_virtual_media._get_attributes()
 
         # Test that various types are returned correctly
         self.assertEqual('https://www.dmtf.org/freeImages/Sardine.img',
@@ -176,7 +177,8 @@ class VirtualMediaTestCase(base.TestCase):
                           True, False, transfer_method='quickly!')
 
     def test_insert_media_fallback(self):
-        self.conn.get.return_value.headers = {'Allow': 'GET,HEAD,PATCH'}
+        self.conn.head.return_value.headers = {'Allow': 'GET,HEAD,PATCH'}
+        self.sys_virtual_media.invalidate()
         self.sys_virtual_media._actions.insert_media = None
         self.sys_virtual_media.insert_media(
             "https://www.dmtf.org/freeImages/Sardine.img", True, False)
@@ -188,8 +190,9 @@ class VirtualMediaTestCase(base.TestCase):
         self.assertTrue(self.sys_virtual_media._is_stale)
 
     def test_insert_media_fallback_with_etag(self):
-        self.conn.get.return_value.headers = {'Allow': 'GET,HEAD,PATCH',
-                                              'ETag': '"3d7b8a7360bf2941d"'}
+        self.conn.head.return_value.headers = {'Allow': 'GET,HEAD,PATCH',
+                                               'ETag': '"3d7b8a7360bf2941d"'}
+        self.sys_virtual_media.invalidate()
         self.sys_virtual_media._actions.insert_media = None
         self.sys_virtual_media.insert_media(
             "https://www.dmtf.org/freeImages/Sardine.img", True, False)
@@ -201,8 +204,9 @@ class VirtualMediaTestCase(base.TestCase):
         self.assertTrue(self.sys_virtual_media._is_stale)
 
     def test_insert_media_fallback_with_weak_etag(self):
-        self.conn.get.return_value.headers = {'Allow': 'GET,HEAD,PATCH',
-                                              'ETag': 'W/"3d7b8a7360bf2941d"'}
+        self.conn.head.return_value.headers = {'Allow': 'GET,HEAD,PATCH',
+                                               'ETag': 'W/"3d7b8a7360bf2941d"'}
+        self.sys_virtual_media.invalidate()
         self.sys_virtual_media._actions.insert_media = None
         self.sys_virtual_media.insert_media(
             "https://www.dmtf.org/freeImages/Sardine.img", True, False)
@@ -284,7 +288,8 @@ class VirtualMediaTestCase(base.TestCase):
         self.assertTrue(self.sys_virtual_media._is_stale)
 
     def test_eject_media_fallback(self):
-        self.conn.get.return_value.headers = {'Allow': 'GET,HEAD,PATCH'}
+        self.conn.head.return_value.headers = {'Allow': 'GET,HEAD,PATCH'}
+        self.sys_virtual_media.invalidate()
         self.sys_virtual_media._actions.eject_media = None
         self.sys_virtual_media.eject_media()
         self.sys_virtual_media._conn.patch.assert_called_once_with(
@@ -293,8 +298,9 @@ class VirtualMediaTestCase(base.TestCase):
         self.assertTrue(self.sys_virtual_media._is_stale)
 
     def test_eject_media_fallback_with_etag(self):
-        self.conn.get.return_value.headers = {'Allow': 'GET,HEAD,PATCH',
-                                              'ETag': '"3d7b8a7360bf2941d"'}
+        self.conn.head.return_value.headers = {'Allow': 'GET,HEAD,PATCH',
+                                               'ETag': '"3d7b8a7360bf2941d"'}
+        self.sys_virtual_media.invalidate()
         self.sys_virtual_media._actions.eject_media = None
         self.sys_virtual_media.eject_media()
         self.sys_virtual_media._conn.patch.assert_called_once_with(
@@ -304,8 +310,9 @@ class VirtualMediaTestCase(base.TestCase):
         self.assertTrue(self.sys_virtual_media._is_stale)
 
     def test_eject_media_fallback_with_weak_etag(self):
-        self.conn.get.return_value.headers = {'Allow': 'GET,HEAD,PATCH',
-                                              'ETag': 'W/"3d7b8a7360bf2941d"'}
+        self.conn.head.return_value.headers = {'Allow': 'GET,HEAD,PATCH',
+                                               'ETag': 'W/"3d7b8a7360bf2941d"'}
+        self.sys_virtual_media.invalidate()
         self.sys_virtual_media._actions.eject_media = None
         self.sys_virtual_media.eject_media()
         self.sys_virtual_media._conn.patch.assert_called_once_with(
@@ -368,8 +375,9 @@ class VirtualMediaTestCase(base.TestCase):
         self.sys_virtual_media._conn.post.assert_has_calls(post_calls)
 
     def test_set_verify_certificate(self):
-        self.conn.get.return_value.headers = {'Allow': 'GET,HEAD',
-                                              'ETag': '3d7b8a7360bf2941d'}
+        self.conn.head.return_value.headers = {'Allow': 'GET,HEAD',
+                                               'ETag': '3d7b8a7360bf2941d'}
+        self.sys_virtual_media.invalidate()
         with mock.patch.object(
                 self.sys_virtual_media, 'invalidate',
                 autospec=True) as invalidate_mock:
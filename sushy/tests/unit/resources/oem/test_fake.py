@@ -55,3 +55,21 @@ class FakeOEMSystemExtensionTestCase(base.TestCase):
             '/redfish/v1/Systems/437XR1138R2/Oem/Contoso/Actions/Contoso.Reset'
             )
         self.assertEqual(expected, value)
+
+    def test_set_parent_resource_not_modified(self):
+        with open('sushy/tests/unit/json_samples/system.json') as f:
+            system_json = json.load(f)
+        conn = mock.MagicMock()
+        fetched = mock.Mock(status_code=200, headers={'ETag': '"1"'})
+        fetched.content = json.dumps(system_json).encode()
+        not_modified = mock.Mock(status_code=304, headers={'ETag': '"1"'})
+        conn.get.side_effect = [fetched, not_modified]
+
+        extn = fake.FakeOEMSystemExtension(conn, '/redfish/v1/Systems/1',
+                                           redfish_version='1.0.2')
+        extn.set_parent_resource(self.sys_instance, 'Contoso')
+
+        self.assertEqual({'If-None-Match': '"1"'},
+                         conn.get.call_args[1]['headers'])
+        self.assertEqual('Contoso OEM system', extn.name)
+        self.assertEqual('USA', extn.production_location.country)
@@ -105,3 +105,116 @@ class AttributeRegistryTestCase(base.TestCase):
                           {'ValueDisplayName': 'Enable',
                            'ValueName': 'Enable'}],
                          attributes.allowable_values)
+
+    def test_attribute_index(self):
+        index = self.registry.attribute_index
+
+        self.assertEqual(2, len(index))
+        self.assertEqual(['SystemModelName', 'ProcVirtualization'],
+                         list(index))
+        self.assertIn('ProcVirtualization', index)
+        self.assertNotIn('Unknown', index)
+        self.assertIs(self.registry.registry_entries.attributes[1],
+                      index['ProcVirtualization'])
+        self.assertIs(index, self.registry.attribute_index)
+
+    def test_attribute_index_refresh(self):
+        index = self.registry.attribute_index
+
+        self.registry.refresh()
+
+        self.assertIsNot(index, self.registry.attribute_index)
+
+    def test_attribute_index_no_entries(self):
+        self.json_doc.pop('RegistryEntries')
+        self.registry.refresh()
+
+        self.assertEqual(0, len(self.registry.attribute_index))
+        self.assertEqual(
+            [('Foo', 1, 'unknown attribute')],
+            self.registry.attribute_index.validate({'Foo': 1}))
+
+    def test_validate(self):
+        self.assertEqual(
+            [], self.registry.attribute_index.validate(
+                {'ProcVirtualization': 'Disabled'}))
+
+    def test_validate_violations(self):
+        attributes = self.json_doc['RegistryEntries']['Attributes']
+        attributes.extend([
+            {'AttributeName': 'Cores', 'Type': 'Integer',
+             'LowerBound': 1, 'UpperBound': 64},
+            {'AttributeName': 'Turbo', 'Type': 'Boolean'},
+            {'AttributeName': 'Label', 'Type': 'String', 'MinLength': 2,
+             'MaxLength': 8, 'ValueExpression': '[a-z]+'},
+        ])
+        self.registry.refresh()
+
+        violations = self.registry.attribute_index.validate({
+            'SystemModelName': 'Foo',
+            'ProcVirtualization': 'Maybe',
+            'Cores': 65,
+            'Turbo': 'yes',
+            'Label': 'ABC',
+            'Missing': 1,
+        })
+
+        self.assertEqual([
+            ('SystemModelName', 'Foo', 'attribute is read-only'),
+            ('ProcVirtualization', 'Maybe',
+             'must be one of Disabled, Enabled'),
+            ('Cores', 65, 'must be at most 64'),
+            ('Turbo', 'yes', 'must be a boolean'),
+            ('Label', 'ABC', 'must match [a-z]+'),
+            ('Missing', 1, 'unknown attribute'),
+        ], violations)
+
+    def test_validate_integer_and_string(self):
+        attributes = self.json_doc['RegistryEntries']['Attributes']
+        attributes.extend([
+            {'AttributeName': 'Cores', 'Type': 'Integer', 'LowerBound': 1},
+            {'AttributeName': 'Label', 'Type': 'String', 'MinLength': 2,
+             'MaxLength': 4},
+        ])
+        self.registry.refresh()
+        validate = self.registry.attribute_index.validate
+
+        self.assertEqual('must be an integer',
+                         validate({'Cores': True})[0].reason)
+        self.assertEqual('must be at least 1',
+                         validate({'Cores': 0})[0].reason)
+        self.assertEqual('must be a string',
+                         validate({'Label': 1})[0].reason)
+        self.assertEqual('must be at least 2 characters long',
+                         validate({'Label': 'a'})[0].reason)
+        self.assertEqual('must be at most 4 characters long',
+                         validate({'Label': 'abcde'})[0].reason)
+        self.assertEqual([], validate({'Cores': 100, 'Label': 'abc'}))
+
+    @mock.patch.object(attribute_registry, 'LOG', autospec=True)
+    def test_validate_invalid_value_expression(self, mock_log):
+        attributes = self.json_doc['RegistryEntries']['Attributes']
+        attributes.append(
+            {'AttributeName': 'Label', 'Type': 'String',
+             'ValueExpression': '^(?<name>[a-z]+)$'})
+        self.registry.refresh()
+
+        self.assertEqual([], self.registry.attribute_index.validate(
+            {'Label': 'ABC'}))
+        self.assertTrue(mock_log.debug.called)
+
+    def test_validate_allowable_values_without_name(self):
+        attributes = self.json_doc['RegistryEntries']['Attributes']
+        attributes.extend([
+            {'AttributeName': 'Mode', 'Type': 'Enumeration',
+             'Value': [{'ValueDisplayName': 'Fast'}, {'ValueName': 'Slow'},
+                       {'ValueName': 'Auto'}]},
+            {'AttributeName': 'Other', 'Type': 'Enumeration',
+             'Value': [{'ValueDisplayName': 'Fast'}]},
+        ])
+        self.registry.refresh()
+
+        self.assertEqual(
+            [('Mode', 'Fast', 'must be one of Auto, Slow')],
+            self.registry.attribute_index.validate(
+                {'Mode': 'Fast', 'Other': 'Fast'}))
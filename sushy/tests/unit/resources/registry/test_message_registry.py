@@ -77,7 +77,8 @@ class MessageRegistryTestCase(base.TestCase):
             'Try Later', self.registry.messages['MissingThings'].resolution)
 
     def test__parse_attributes_return(self):
-        attributes = self.registry._parse_attributes(self.json_doc)
+        self.registry._parse_attributes(self.json_doc)
+        attributes = self.registry._get_attributes()
 
         self.assertEqual({'Failed':
                           {'description': 'Nothing is OK',
@@ -322,3 +323,37 @@ class MessageRegistryTestCase(base.TestCase):
         self.assertEqual(res_cons.Severity.WARNING, parsed_msg.severity)
         self.assertEqual('Property\'s arg1 value cannot be greater than 10.',
                          parsed_msg.message)
+
+    def test_parse_message_many_args(self):
+        message = message_registry.RegistryMessage(
+            '', '%1 %10 %2 %11', 10, None, 'None', res_cons.Severity.OK)
+        registry = mock.Mock(messages={'Many': message})
+        message_field = sushy_base.MessageListField('Foo')
+        message_field.message_id = 'Test.1.0.Many'
+        message_field.message_args = [str(i) for i in range(1, 11)]
+        message_field.severity = None
+        message_field.resolution = None
+
+        parsed_msg = message_registry.parse_message({'Test.1.0': registry},
+                                                    message_field)
+
+        self.assertEqual('1 10 2 %11', parsed_msg.message)
+
+    def test_tokenize(self):
+        self.assertEqual(
+            ("Property's ", 0, ' value cannot be greater than ', 1, '.'),
+            message_registry._tokenize(
+                "Property's %1 value cannot be greater than %2.", 2))
+        self.assertEqual(('100%', 0, ' done %2'),
+                         message_registry._tokenize('100%%1 done %2', 1))
+        self.assertEqual(('Done',), message_registry._tokenize('Done', 0))
+
+    def test_render_cached(self):
+        message_registry._render.cache_clear()
+        args = ('arg1', '10')
+
+        for _ in range(3):
+            msg = message_registry._render('%1 is over %2', 2, args)
+
+        self.assertEqual('arg1 is over 10', msg)
+        self.assertEqual(2, message_registry._render.cache_info().hits)
@@ -17,7 +17,11 @@ import json
 from unittest import mock
 
 from sushy.resources.base import FieldData
+from sushy.resources.registry import attribute_registry
+from sushy.resources.registry import message_registry
 from sushy.resources.registry import message_registry_file
+from sushy.resources.registry import registry_pool
+from sushy.resources.registry import registry_store
 from sushy.tests.unit import base
 
 
@@ -55,7 +59,8 @@ class MessageRegistryFileTestCase(base.TestCase):
                          self.reg_file.location[0].archive_file)
 
     def test__parse_attributes_return(self):
-        attributes = self.reg_file._parse_attributes(self.json_doc)
+        self.reg_file._parse_attributes(self.json_doc)
+        attributes = self.reg_file._get_attributes()
 
         # Test that various types are returned correctly
         self.assertEqual('Test Message Registry File', attributes.get('name'))
@@ -311,6 +316,261 @@ class BiosRegistryTestCase(base.TestCase):
         self.assertEqual(mock_msg_reg_rv, registry)
 
 
+class MessageRegistryFileStoreTestCase(base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.conn = mock.Mock()
+        with open('sushy/tests/unit/json_samples/'
+                  'message_registry_file.json') as f:
+            self.conn.get.return_value.json.return_value = json.load(f)
+        with open('sushy/tests/unit/json_samples/'
+                  'message_registry.json') as f:
+            self.registry_doc = json.load(f)
+
+        self.reg_file = message_registry_file.MessageRegistryFile(
+            self.conn, '/redfish/v1/Registries/Test',
+            redfish_version='1.0.2')
+        self.conn.reset_mock()
+        self.store = mock.Mock(spec=registry_store.RegistryStore)
+        self.store.get_version.return_value = '1.1.1'
+        self.store.attribute_registries = False
+
+    def test_get_message_registry_stored(self):
+        self.store.get.return_value = self.registry_doc
+
+        registry = self.reg_file.get_message_registry('EN', None,
+                                                      store=self.store)
+
+        self.assertIsInstance(registry, message_registry.MessageRegistry)
+        self.assertEqual('Test.1.1.1', registry.identity)
+        self.store.get_version.assert_called_once_with('Test', '1.0', 'en')
+        self.store.get.assert_called_once_with('Test', '1.1.1', 'en')
+        self.conn.get.assert_not_called()
+        self.store.put.assert_not_called()
+
+    def test_get_attribute_registry_stored_other_type(self):
+        self.store.get.return_value = self.registry_doc
+
+        self.assertIsNone(self.reg_file.get_attribute_registry(
+            'en', None, store=self.store))
+        self.conn.get.assert_not_called()
+
+    def _get_attribute_registry_doc(self):
+        with open('sushy/tests/unit/json_samples/'
+                  'bios_attribute_registry.json') as f:
+            return dict(json.load(f), RegistryVersion='1.1.1')
+
+    def test_get_attribute_registry_stored_not_served(self):
+        self.store.get.return_value = self._get_attribute_registry_doc()
+        self.conn.get.return_value.json.return_value = (
+            self._get_attribute_registry_doc())
+
+        registry = self.reg_file.get_attribute_registry('en', None,
+                                                        store=self.store)
+
+        self.assertIsInstance(registry, attribute_registry.AttributeRegistry)
+        self.assertTrue(self.conn.get.called)
+        self.store.put.assert_not_called()
+        self.store.set_version.assert_not_called()
+
+    def test_get_attribute_registry_stored(self):
+        self.store.attribute_registries = True
+        self.store.get.return_value = self._get_attribute_registry_doc()
+
+        registry = self.reg_file.get_attribute_registry('en', None,
+                                                        store=self.store)
+
+        self.assertIsInstance(registry, attribute_registry.AttributeRegistry)
+        self.conn.get.assert_not_called()
+
+    def test_get_attribute_registry_not_stored(self):
+        self.store.attribute_registries = True
+        self.store.get_version.return_value = None
+        doc = self._get_attribute_registry_doc()
+        self.conn.get.return_value.json.return_value = doc
+
+        self.reg_file.get_attribute_registry('en', None, store=self.store)
+
+        self.store.put.assert_called_once_with('Test', '1.1.1', 'en', doc)
+
+    def test_get_message_registry_not_stored(self):
+        self.store.get_version.return_value = None
+        self.conn.get.return_value.json.return_value = self.registry_doc
+
+        registry = self.reg_file.get_message_registry('en', None,
+                                                      store=self.store)
+
+        self.assertEqual('Test.1.1.1', registry.identity)
+        self.store.get.assert_not_called()
+        self.store.put.assert_called_once_with('Test', '1.1.1', 'en',
+                                               self.registry_doc)
+        self.store.set_version.assert_called_once_with('Test', '1.0', 'en',
+                                                       '1.1.1')
+
+    def test_get_message_registry_stored_other_version(self):
+        self.store.get.return_value = dict(self.registry_doc,
+                                           RegistryVersion='1.1.0')
+        self.conn.get.return_value.json.return_value = self.registry_doc
+
+        registry = self.reg_file.get_message_registry('en', None,
+                                                      store=self.store)
+
+        self.assertEqual('1.1.1', registry.registry_version)
+        self.assertTrue(self.conn.get.called)
+        self.store.put.assert_called_once_with('Test', '1.1.1', 'en',
+                                               self.registry_doc)
+
+    def test_get_message_registry_stored_invalid(self):
+        self.store.get.return_value = {
+            '@odata.type': '#MessageRegistry.v1_1_1.MessageRegistry',
+            'RegistryVersion': '1.1.1'}
+        self.conn.get.return_value.json.return_value = self.registry_doc
+
+        registry = self.reg_file.get_message_registry('en', None,
+                                                      store=self.store)
+
+        self.assertEqual('Test.1.1.1', registry.identity)
+        self.store.put.assert_called_once_with('Test', '1.1.1', 'en',
+                                               self.registry_doc)
+
+    def test_get_message_registry_not_stored_other_prefix(self):
+        self.store.get_version.return_value = None
+        self.conn.get.return_value.json.return_value = dict(
+            self.registry_doc, RegistryPrefix='Other')
+
+        registry = self.reg_file.get_message_registry('en', None,
+                                                      store=self.store)
+
+        self.assertEqual('Other', registry.registry_prefix)
+        self.store.put.assert_not_called()
+        self.store.set_version.assert_not_called()
+
+
+class MessageRegistryFilePoolTestCase(base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.conn = mock.Mock()
+        with open('sushy/tests/unit/json_samples/'
+                  'message_registry_file.json') as f:
+            self.conn.get.return_value.json.return_value = json.load(f)
+        self.reg_file = message_registry_file.MessageRegistryFile(
+            self.conn, '/redfish/v1/Registries/Test',
+            redfish_version='1.0.2')
+        with open('sushy/tests/unit/json_samples/'
+                  'message_registry.json') as f:
+            self.conn.get.return_value.json.return_value = json.load(f)
+        self.conn.reset_mock()
+        self.pool = registry_pool.RegistryPool()
+
+    def _get_other_file(self, json_doc):
+        conn = mock.Mock()
+        conn.get.return_value.json.return_value = json_doc
+        return message_registry_file.MessageRegistryFile(
+            conn, '/redfish/v1/Registries/Test',
+            json_doc=self.reg_file.json)
+
+    def test_get_message_registry_shared(self):
+        registry = self.reg_file.get_message_registry('en', None,
+                                                      pool=self.pool)
+        self.assertEqual(1, self.conn.get.call_count)
+
+        # Another service providing the same version of the registry
+        other_file = self._get_other_file(
+            self.conn.get.return_value.json.return_value)
+        self.assertIs(registry, other_file.get_message_registry(
+            'EN', None, pool=self.pool))
+        self.assertEqual(1, other_file._conn.get.call_count)
+        self.assertEqual(1, len(self.pool))
+
+    @mock.patch.object(message_registry, 'MessageRegistry', autospec=True)
+    def test_get_message_registry_parsed_once(self, mock_msg_reg):
+        mock_msg_reg.return_value = mock.Mock(_conn=None, _reader=None)
+        self.reg_file.get_message_registry('en', None, pool=self.pool)
+        other_file = self._get_other_file(
+            self.conn.get.return_value.json.return_value)
+        other_file.get_message_registry('en', None, pool=self.pool)
+
+        mock_msg_reg.assert_called_once_with(
+            self.conn, path='/redfish/v1/Registries/Test/Test.1.0.json',
+            reader=None, redfish_version='1.0.2',
+            json_doc=self.conn.get.return_value.json.return_value)
+
+    def test_get_message_registry_detached(self):
+        registry = self.reg_file.get_message_registry('en', None,
+                                                      pool=self.pool)
+
+        self.assertIsNone(registry._conn)
+        self.assertIsNone(registry._reader)
+
+    def test_get_message_registry_not_shared_other_version(self):
+        registry = self.reg_file.get_message_registry('en', None,
+                                                      pool=self.pool)
+
+        other_file = self._get_other_file(dict(
+            self.conn.get.return_value.json.return_value,
+            RegistryVersion='1.1.2'))
+        other = other_file.get_message_registry('en', None, pool=self.pool)
+        self.assertIsNot(registry, other)
+        self.assertEqual('1.1.2', other.registry_version)
+        self.assertEqual(2, len(self.pool))
+
+    def test_get_message_registry_stored_shared(self):
+        store = mock.Mock(spec=registry_store.RegistryStore)
+        store.attribute_registries = False
+        store.get_version.return_value = '1.1.1'
+        store.get.return_value = self.conn.get.return_value.json.return_value
+
+        registry = self.reg_file.get_message_registry(
+            'en', None, store=store, pool=self.pool)
+        other_file = self._get_other_file(None)
+
+        self.assertIs(registry, other_file.get_message_registry(
+            'en', None, store=store, pool=self.pool))
+        self.conn.get.assert_not_called()
+        other_file._conn.get.assert_not_called()
+
+    def test_get_attribute_registry_not_shared(self):
+        self.reg_file.get_message_registry('en', None, pool=self.pool)
+
+        self.assertIsNone(self.reg_file.get_attribute_registry(
+            'en', None, pool=self.pool))
+        self.assertEqual(1, len(self.pool))
+
+    def test_get_attribute_registry_not_pooled_by_default(self):
+        with open('sushy/tests/unit/json_samples/'
+                  'bios_attribute_registry.json') as f:
+            self.conn.get.return_value.json.return_value = json.load(f)
+
+        registry = self.reg_file.get_attribute_registry('en', None,
+                                                        pool=self.pool)
+
+        self.assertIsInstance(registry, attribute_registry.AttributeRegistry)
+        self.assertEqual(0, len(self.pool))
+
+    def test_get_attribute_registry_pooled(self):
+        self.pool = registry_pool.RegistryPool(attribute_registries=True)
+        with open('sushy/tests/unit/json_samples/'
+                  'bios_attribute_registry.json') as f:
+            json_doc = json.load(f)
+        self.conn.get.return_value.json.return_value = json_doc
+
+        registry = self.reg_file.get_attribute_registry('en', None,
+                                                        pool=self.pool)
+
+        self.assertIs(registry, self._get_other_file(
+            json_doc).get_attribute_registry('en', None, pool=self.pool))
+        self.assertEqual(1, len(self.pool))
+
+        # Same prefix and version, for another server model
+        other = self._get_other_file(dict(
+            json_doc, SupportedSystems=[{'ProductName': 'Other'}]))
+        self.assertIsNot(registry, other.get_attribute_registry(
+            'en', None, pool=self.pool))
+        self.assertEqual(2, len(self.pool))
+
+
 class MessageRegistryFileCollectionTestCase(base.TestCase):
 
     def setUp(self):
@@ -0,0 +1,103 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+from sushy.resources import base as resource_base
+from sushy.resources import constants as res_cons
+from sushy.resources.registry import constants as reg_cons
+from sushy.resources.registry import message_registry
+from sushy.resources.registry import packaged_registries
+from sushy.tests.unit import base
+
+
+class PackagedRegistriesTestCase(base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        packaged_registries.get_registries.cache_clear()
+        self.addCleanup(packaged_registries.get_registries.cache_clear)
+
+    def test_get_registries(self):
+        registries = packaged_registries.get_registries()
+
+        self.assertEqual(5, len(registries))
+        self.assertIs(registries, packaged_registries.get_registries())
+        base_reg = {r.identity: r for r in registries}['Base.1.3.0']
+        self.assertEqual('Base Message Registry', base_reg.name)
+        self.assertEqual('en', base_reg.language)
+        self.assertEqual('DMTF', base_reg.owning_entity)
+        self.assertEqual('Base', base_reg.registry_prefix)
+        self.assertEqual('1.3.0', base_reg.registry_version)
+
+    def test_messages(self):
+        registries = packaged_registries.get_registries()
+        base_reg = {r.identity: r for r in registries}['Base.1.3.0']
+        self.assertIsNone(base_reg._messages)
+        self.assertIsNotNone(base_reg._json_doc)
+
+        message = base_reg.messages['PropertyValueNotInList']
+
+        self.assertIsInstance(message, message_registry.RegistryMessage)
+        self.assertEqual(2, message.number_of_args)
+        self.assertEqual([reg_cons.MessageParamType.STRING,
+                          reg_cons.MessageParamType.STRING],
+                         message.param_types)
+        self.assertEqual(res_cons.Severity.WARNING, message.severity)
+        self.assertIn('%1', message.message)
+        self.assertIs(base_reg.messages, base_reg.messages)
+        self.assertIsNone(base_reg._json_doc)
+
+    def test_parse_message(self):
+        registries = {
+            r.registry_prefix + '.'
+            + r.registry_version.rsplit('.', 1)[0]: r
+            for r in packaged_registries.get_registries()}
+        message = mock.Mock(message_id='Base.1.3.PropertyValueNotInList',
+                            message_args=['Dummy', 'Boot'],
+                            message=None, severity=None, resolution=None)
+
+        parsed = message_registry.parse_message(registries, message)
+
+        self.assertEqual("The value Dummy for the property Boot is not in "
+                         "the list of acceptable values.", parsed.message)
+        self.assertEqual(res_cons.Severity.WARNING, parsed.severity)
+
+    def test_messages_same_as_message_registry(self):
+        registry = message_registry.MessageRegistry(
+            None, 'standard_registries/Base.1.4.0.json',
+            reader=resource_base.JsonPackagedFileReader('sushy'))
+        base_reg = {r.identity: r for r in
+                    packaged_registries.get_registries()}['Base.1.4.0']
+
+        self.assertEqual(registry.registry_version, base_reg.registry_version)
+        self.assertEqual(
+            {key: tuple(getattr(msg, field) for field in
+                        message_registry.RegistryMessage._fields)
+             for key, msg in registry.messages.items()},
+            {key: tuple(msg) for key, msg in base_reg.messages.items()})
+
+    @mock.patch.object(packaged_registries, 'resources', autospec=True)
+    def test_get_registries_missing(self, mock_resources):
+        mock_resources.files.return_value.joinpath.return_value\
+            .iterdir.side_effect = FileNotFoundError
+
+        self.assertIsNone(packaged_registries.get_registries())
+
+    @mock.patch.object(packaged_registries, '_read_registry_files',
+                       autospec=True)
+    def test_get_registries_invalid(self, mock_read):
+        for contents in (b'{', b'{"Id": "Base.1.0.0"}'):
+            packaged_registries.get_registries.cache_clear()
+            mock_read.return_value = {'Base.1.0.0.json': contents}
+
+            self.assertIsNone(packaged_registries.get_registries())
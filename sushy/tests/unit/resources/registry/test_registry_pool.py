@@ -0,0 +1,86 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from concurrent import futures
+import threading
+from unittest import mock
+
+from sushy.resources.registry import registry_pool
+from sushy.tests.unit import base
+
+
+class RegistryPoolTestCase(base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.pool = registry_pool.RegistryPool(maxsize=2)
+
+    def test_add_get(self):
+        registry = mock.Mock()
+        self.pool.add('a', registry)
+
+        self.assertIs(registry, self.pool.get('a'))
+        self.assertIsNone(self.pool.get('b'))
+
+    def test_lru_eviction(self):
+        self.pool.add('a', mock.Mock())
+        self.pool.add('b', mock.Mock())
+        self.pool.get('a')
+        self.pool.add('c', mock.Mock())
+
+        self.assertEqual(2, len(self.pool))
+        self.assertIsNotNone(self.pool.get('a'))
+        self.assertIsNone(self.pool.get('b'))
+        self.assertIsNotNone(self.pool.get('c'))
+
+    def test_get_or_load(self):
+        registry = mock.Mock()
+        load = mock.Mock(return_value=registry)
+
+        self.assertIs(registry, self.pool.get_or_load('a', load))
+        self.assertIs(registry, self.pool.get_or_load('a', load))
+        load.assert_called_once_with()
+
+    def test_get_or_load_not_found(self):
+        load = mock.Mock(return_value=None)
+
+        self.assertIsNone(self.pool.get_or_load('a', load))
+        self.assertIsNone(self.pool.get_or_load('a', load))
+        self.assertEqual(2, load.call_count)
+        self.assertEqual(0, len(self.pool))
+
+    def test_get_or_load_concurrently(self):
+        registry = mock.Mock()
+        loading = threading.Event()
+        proceed = threading.Event()
+
+        def load():
+            loading.set()
+            proceed.wait(5)
+            return registry
+
+        load_mock = mock.Mock(side_effect=load)
+        with futures.ThreadPoolExecutor(max_workers=4) as executor:
+            results = [executor.submit(self.pool.get_or_load, 'a', load_mock)
+                       for _ in range(4)]
+            self.assertTrue(loading.wait(5))
+            proceed.set()
+
+        self.assertEqual([registry] * 4, [r.result() for r in results])
+        load_mock.assert_called_once_with()
+        self.assertEqual({}, self.pool._loading)
+
+    def test_clear(self):
+        self.pool.add('a', mock.Mock())
+        self.pool.clear()
+
+        self.assertEqual(0, len(self.pool))
@@ -0,0 +1,89 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from sushy.resources.registry import registry_store
+from sushy.tests.unit import base
+
+
+class DirectoryRegistryStoreTestCase(base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+        self.path = os.path.join(tmp_dir, 'registries')
+        self.store = registry_store.DirectoryRegistryStore(self.path)
+
+    def test_attribute_registries(self):
+        self.assertFalse(self.store.attribute_registries)
+        self.assertTrue(registry_store.DirectoryRegistryStore(
+            self.path, attribute_registries=True).attribute_registries)
+
+    def test_put_get(self):
+        doc = {'@odata.type': '#MessageRegistry.v1_1_1.MessageRegistry',
+               'Id': 'Test.1.1.1'}
+
+        self.store.put('Test', '1.1.1', 'en', doc)
+
+        self.assertEqual(doc, self.store.get('Test', '1.1.1', 'EN'))
+        self.assertIsNone(self.store.get('Test', '1.1.1', 'fr'))
+        self.assertIsNone(self.store.get('Test', '1.1.0', 'en'))
+        self.assertEqual(['Test.1.1.1.en.json'], os.listdir(self.path))
+
+    def test_patch_versions(self):
+        self.store.put('Test', '1.1.0', 'en', {'Id': 'Test.1.1.0'})
+        self.store.put('Test', '1.1.1', 'en', {'Id': 'Test.1.1.1'})
+
+        self.assertEqual({'Id': 'Test.1.1.0'},
+                         self.store.get('Test', '1.1.0', 'en'))
+        self.assertEqual({'Id': 'Test.1.1.1'},
+                         self.store.get('Test', '1.1.1', 'en'))
+
+    def test_set_get_version(self):
+        self.assertIsNone(self.store.get_version('Test', '1.1', 'en'))
+
+        self.store.set_version('Test', '1.1', 'en', '1.1.0')
+        self.store.set_version('Test', '1.1', 'en', '1.1.1')
+
+        self.assertEqual('1.1.1', self.store.get_version('Test', '1.1', 'EN'))
+        self.assertIsNone(self.store.get_version('Test', '1.1', 'fr'))
+        self.assertEqual(['Test.1.1.en.version'], os.listdir(self.path))
+
+    def test_get_missing_directory(self):
+        self.assertIsNone(self.store.get('Test', '1.1.1', 'en'))
+        self.assertIsNone(self.store.get_version('Test', '1.1', 'en'))
+
+    @mock.patch.object(registry_store, 'LOG', autospec=True)
+    def test_get_invalid(self, mock_log):
+        os.makedirs(self.path)
+        with open(os.path.join(self.path, 'Test.1.1.1.en.json'), 'w') as f:
+            f.write('{')
+
+        self.assertIsNone(self.store.get('Test', '1.1.1', 'en'))
+        self.assertTrue(mock_log.warning.called)
+
+    def test_put_sanitized_name(self):
+        self.store.put('../Test', '1.1.1', 'en', {})
+
+        self.assertEqual(['.._Test.1.1.1.en.json'], os.listdir(self.path))
+
+    @mock.patch.object(registry_store, 'LOG', autospec=True)
+    def test_put_fails(self, mock_log):
+        self.store.put('Test', '1.1.1', 'en', {'Id': object()})
+
+        self.assertTrue(mock_log.warning.called)
+        self.assertEqual([], os.listdir(self.path))
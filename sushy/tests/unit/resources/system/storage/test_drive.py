@@ -83,7 +83,8 @@ class DriveTestCase(base.TestCase):
         self.assertEqual('3', volumes[1].identity)
 
     def test_set_indicator_led(self):
-        self.conn.get.return_value.headers = {'ETag': 'a3b01b63f80a4913'}
+        self.conn.head.return_value.headers = {'ETag': 'a3b01b63f80a4913'}
+        self.stor_drive.invalidate()
         with mock.patch.object(
                 self.stor_drive, 'invalidate',
                 autospec=True) as invalidate_mock:
@@ -119,6 +119,16 @@ class StorageTestCase(base.TestCase):
         self.assertEqual(4, len(all_drives))
         self.assertIsInstance(all_drives[0], drive.Drive.__class__)
 
+    @mock.patch.object(drive, 'Drive', autospec=True)
+    def test_drives_concurrently(self, Drive_mock):
+        # | GIVEN |
+        self.conn.max_workers = 4
+        Drive_mock.side_effect = lambda conn, path, **kwargs: path
+        # | WHEN |
+        all_drives = self.storage.drives
+        # | THEN |
+        self.assertEqual(list(self.storage.drives_identities), all_drives)
+
     def test_storage_controllers(self):
         controllers = self.storage.storage_controllers
         self.assertIsInstance(controllers, list)
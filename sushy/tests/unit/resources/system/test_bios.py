@@ -97,7 +97,8 @@ class BiosTestCase(base.TestCase):
                          self.sys_bios.update_status.status)
 
     def test__parse_attributes_return(self):
-        attributes = self.sys_bios._parse_attributes(self.bios_json)
+        self.sys_bios._parse_attributes(self.bios_json)
+        attributes = self.sys_bios._get_attributes()
 
         # Test that various types are returned correctly
         self.assertEqual('BIOS Configuration Current Settings',
@@ -138,6 +139,50 @@ class BiosTestCase(base.TestCase):
                       'MaintenanceWindowDurationInSeconds': 600}},
             etag='9234ac83b9700123cc32')
 
+    def test_set_attributes_validate(self):
+        self.conn.get.return_value.json.side_effect = [self.bios_json]
+
+        self.sys_bios.set_attributes({'ProcVirtualization': 'Disabled'},
+                                     validate=True)
+
+        self.sys_bios._conn.patch.assert_called_once_with(
+            '/redfish/v1/Systems/437XR1138R2/BIOS/Settings',
+            data={'Attributes': {'ProcVirtualization': 'Disabled'}},
+            etag='9234ac83b9700123cc32')
+
+    def test_set_attributes_validate_invalid(self):
+        exc = self.assertRaises(
+            exceptions.InvalidAttributesError,
+            self.sys_bios.set_attributes,
+            {'ProcVirtualization': 'Maybe', 'SystemModelName': 'Foo',
+             'ProcTurboMode': 'Disabled'},
+            validate=True)
+
+        self.assertEqual(['ProcVirtualization', 'SystemModelName',
+                          'ProcTurboMode'],
+                         [v.name for v in exc.violations])
+        self.assertIn("ProcTurboMode='Disabled': unknown attribute",
+                      str(exc))
+        self.sys_bios._conn.patch.assert_not_called()
+
+    def test_set_attribute_validate_invalid(self):
+        self.assertRaises(exceptions.InvalidAttributesError,
+                          self.sys_bios.set_attribute,
+                          'SystemModelName', 'Foo', validate=True)
+        self.sys_bios._conn.patch.assert_not_called()
+
+    def test_set_attributes_validate_no_registry(self):
+        self.conn.get.return_value.json.side_effect = [self.bios_json]
+        self.sys_bios._attribute_registry = 'Unknown'
+
+        self.sys_bios.set_attributes({'ProcTurboMode': 'Disabled'},
+                                     validate=True)
+
+        self.sys_bios._conn.patch.assert_called_once_with(
+            '/redfish/v1/Systems/437XR1138R2/BIOS/Settings',
+            data={'Attributes': {'ProcTurboMode': 'Disabled'}},
+            etag='9234ac83b9700123cc32')
+
     def test_set_attribute_on_refresh(self):
         self.conn.get.return_value.json.side_effect = [
             self.bios_settings_json,
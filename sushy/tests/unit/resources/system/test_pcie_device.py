@@ -170,6 +170,14 @@ class PCIeDeviceCollectionTestCase(base.TestCase):
         self.assertIsInstance(members, list)
         self.assertEqual(2, len(members))
 
+    def test_empty_refresh(self):
+        collection = pcie_device.PCIeDeviceCollection(self.conn, '/empty')
+
+        collection.refresh(force=False)
+
+        self.assertEqual([], collection.get_members())
+        self.conn.get.assert_called_once()
+
 
 class PCIeFunctionTestCase(base.TestCase):
 
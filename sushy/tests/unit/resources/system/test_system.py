@@ -20,6 +20,7 @@ from dateutil import parser
 
 import sushy
 from sushy import exceptions
+from sushy.resources import base as resource_base
 from sushy.resources.chassis import chassis
 from sushy.resources import constants as res_cons
 from sushy.resources.manager import manager
@@ -93,7 +94,8 @@ class SystemTestCase(base.TestCase):
                          self.sys_inst.boot_progress.oem_last_state)
 
     def test__parse_attributes_return(self):
-        attributes = self.sys_inst._parse_attributes(self.json_doc)
+        self.sys_inst._parse_attributes(self.json_doc)
+        attributes = self.sys_inst._get_attributes()
 
         # Test that various types are returned correctly
         self.assertEqual('Chicago-45Z-2381', attributes.get('asset_tag'))
@@ -446,6 +448,7 @@ class SystemTestCase(base.TestCase):
             etag='"3d7b838291941d"')
 
     def test_set_system_boot_options_settings_resource_lenovo(self):
+        self.conn.get.return_value.headers = {'ETag': '"222"'}
         self.sys_inst = system.System(
             self.conn, '/redfish/v1/Systems/1',
             redfish_version='1.0.2')
@@ -463,8 +466,7 @@ class SystemTestCase(base.TestCase):
 
         get_settings = mock.MagicMock(headers={'ETag': '"3d7b838291941d"'})
         get_settings.json.return_value = settings_body
-        get_system = mock.MagicMock(headers={'ETag': '"222"'})
-        self.conn.get.side_effect = [get_settings, get_system]
+        self.conn.get.side_effect = [get_settings]
 
         self.sys_inst.set_system_boot_options(
             target=sushy.BootSource.CD,
@@ -1344,6 +1346,34 @@ class SystemWithVirtualMedia(base.TestCase):
         self.assertFalse(actual_virtual_media._is_stale)
 
 
+class SystemIdentityMapTestCase(base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.docs = {}
+        for identity in ('1', '2'):
+            with open('sushy/tests/unit/json_samples/system.json') as f:
+                doc = json.load(f)
+            doc['PCIeDevices'] = [
+                {'@odata.id': f'/redfish/v1/Chassis/{identity}/PCIeDevices/1'}]
+            self.docs[f'/redfish/v1/Systems/{identity}'] = doc
+        self.conn = mock.Mock()
+        self.conn.get.side_effect = lambda path, **kwargs: mock.Mock(
+            status_code=200, headers={},
+            content=json.dumps(self.docs[path]).encode())
+        self.root = mock.Mock(_identity_map=resource_base.IdentityMap(10))
+
+    def test_embedded_pcie_devices(self):
+        systems = [system.System(self.conn, path, root=self.root)
+                   for path in sorted(self.docs)]
+
+        self.assertEqual(
+            [('/redfish/v1/Chassis/1/PCIeDevices/1',),
+             ('/redfish/v1/Chassis/2/PCIeDevices/1',)],
+            [sys_inst.pcie_devices.members_identities
+             for sys_inst in systems])
+
+
 class SystemCollectionTestCase(base.TestCase):
 
     def setUp(self):
@@ -15,6 +15,7 @@
 
 import copy
 import enum
+import gc
 from http import client as http_client
 import io
 import json
@@ -24,6 +25,7 @@ import zipfile
 from sushy import exceptions
 from sushy.resources import base as resource_base
 from sushy.tests.unit import base
+from sushy import utils
 
 
 BASE_RESOURCE_JSON = {
@@ -92,6 +94,17 @@ class ResourceBaseTestCase(base.TestCase):
         self.base_resource.refresh()
         self.conn.get.assert_called_once_with(path='/Foo')
 
+    def test_refresh_decodes_content(self):
+        doc = copy.deepcopy(BASE_RESOURCE_JSON)
+        doc['Name'] = 'Decoded'
+        self.conn.get.return_value.content = json.dumps(doc).encode()
+        self.conn.get.return_value.headers = {}
+
+        self.base_resource.refresh()
+
+        self.assertEqual(doc, self.base_resource.json)
+        self.conn.get.return_value.json.assert_not_called()
+
     def test_invalidate(self):
         self.base_resource.invalidate()
         self.conn.get.assert_not_called()
@@ -103,6 +116,33 @@ class ResourceBaseTestCase(base.TestCase):
         self.base_resource.invalidate(force_refresh=True)
         self.conn.get.assert_called_once_with(path='/Foo')
 
+    @mock.patch.object(resource_base.time, 'monotonic', autospec=True)
+    def test_refresh_no_force_max_age(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        self.base_resource.max_age = 5
+        self.base_resource.refresh()
+        self.conn.reset_mock()
+
+        mock_monotonic.return_value = 104
+        self.base_resource.refresh(force=False)
+        self.conn.get.assert_not_called()
+
+        mock_monotonic.return_value = 105
+        self.base_resource.refresh(force=False)
+        self.conn.get.assert_called_once_with(path='/Foo')
+        self.assertFalse(self.base_resource._is_stale)
+
+        self.conn.reset_mock()
+        mock_monotonic.return_value = 109
+        self.base_resource.refresh(force=False)
+        self.conn.get.assert_not_called()
+
+    @mock.patch.object(resource_base.time, 'monotonic', autospec=True)
+    def test_refresh_no_force_no_max_age(self, mock_monotonic):
+        mock_monotonic.return_value = 10 ** 6
+        self.base_resource.refresh(force=False)
+        self.conn.get.assert_not_called()
+
     def test_refresh_archive(self):
         mock_response = mock.Mock(
             headers={'content-type': 'application/zip'})
@@ -179,6 +219,183 @@ class ResourceBaseTestCase(base.TestCase):
         self.assertIsNotNone(resource._json)
         self.assertEqual('Test.1.1.1', resource._json['Id'])
 
+    def test_refresh_sends_if_none_match(self):
+        self.conn.get.return_value.headers = {'ETag': '"abc"'}
+        self.base_resource2.refresh()
+        self.conn.get.assert_called_once_with(path='/Foo')
+
+        self.conn.reset_mock()
+        self.base_resource2.refresh()
+        self.conn.get.assert_called_once_with(
+            path='/Foo', headers={'If-None-Match': '"abc"'})
+
+    @mock.patch.object(BaseResource2, '_parse_attributes', autospec=True)
+    def test_refresh_not_modified(self, mock_parse):
+        self.conn.get.return_value.headers = {'ETag': '"abc"'}
+        self.base_resource2.refresh()
+        mock_parse.reset_mock()
+        old_json = self.base_resource2.json
+
+        self.conn.get.reset_mock()
+        self.conn.get.return_value.status_code = http_client.NOT_MODIFIED
+        self.base_resource2.invalidate()
+        self.base_resource2.refresh(force=False)
+
+        self.conn.get.assert_called_once_with(
+            path='/Foo', headers={'If-None-Match': '"abc"'})
+        self.conn.get.return_value.json.assert_not_called()
+        mock_parse.assert_not_called()
+        self.assertIs(old_json, self.base_resource2.json)
+        self.assertFalse(self.base_resource2._is_stale)
+
+    def test_refresh_modified(self):
+        self.conn.get.return_value.headers = {'ETag': '"abc"'}
+        self.base_resource2.refresh()
+
+        new_json = dict(BASE_RESOURCE_JSON, Oem={})
+        self.conn.get.return_value.status_code = http_client.OK
+        self.conn.get.return_value.headers = {'ETag': '"def"'}
+        self.conn.get.return_value.json.return_value = new_json
+        self.base_resource2.refresh()
+        self.assertEqual(new_json, self.base_resource2.json)
+        self.assertEqual('"def"', self.base_resource2._reader._etags['/Foo'])
+
+    def test_refresh_etag_dropped(self):
+        self.conn.get.return_value.headers = {'ETag': '"abc"'}
+        self.base_resource2.refresh()
+        self.conn.get.return_value.headers = {}
+        self.base_resource2.refresh()
+
+        self.conn.reset_mock()
+        self.base_resource2.refresh()
+        self.conn.get.assert_called_once_with(path='/Foo')
+
+    def _set_select_query(self, supported):
+        self.base_resource2._root = mock.Mock()
+        features = self.base_resource2.root.protocol_features_supported
+        features.select_query = supported
+
+    def test_refresh_select(self):
+        self._set_select_query(True)
+        self.conn.get.return_value.json.return_value = {
+            'Oem': {'Fabrikam': {}}}
+
+        self.base_resource2.refresh(select=['Oem'])
+
+        self.conn.get.assert_called_once_with(path='/Foo?$select=Oem')
+        self.assertEqual(['Fabrikam'], self.base_resource2._oem_vendors)
+        # Attributes which were not selected are kept
+        self.assertEqual(['Contoso', 'EID_420_ASB_345'],
+                         self.base_resource2.links.oem_vendors)
+        self.assertIsNone(self.base_resource2._headers)
+
+    def test_init_select(self):
+        root = mock.Mock()
+        root.protocol_features_supported.select_query = True
+        self.conn.get.return_value.json.return_value = {
+            'Oem': {'Fabrikam': {}}}
+
+        resource = BaseResource2(connector=self.conn, path='/Foo',
+                                 root=root, select=['Oem'])
+
+        self.conn.get.assert_called_once_with(path='/Foo?$select=Oem')
+        self.assertEqual(['Fabrikam'], resource._oem_vendors)
+        self.assertIsNone(resource.links)
+
+        # The whole resource is parsed on the next refresh
+        self.conn.get.return_value.json.return_value = (
+            copy.deepcopy(BASE_RESOURCE_JSON))
+        resource.refresh()
+        self.assertEqual(['Contoso', 'EID_420_ASB_345'],
+                         resource.links.oem_vendors)
+
+    def test_refresh_select_not_supported(self):
+        self._set_select_query(False)
+
+        self.base_resource2.refresh(select=['Oem'])
+
+        self.conn.get.assert_called_once_with(path='/Foo')
+        self.assertEqual(['Contoso', 'EID_412_ASB_123'],
+                         self.base_resource2._oem_vendors)
+
+    def test_refresh_select_fails(self):
+        self._set_select_query(True)
+        self.conn.get.side_effect = [
+            exceptions.BadRequestError(
+                method='GET', url='/Foo?$select=Oem',
+                response=mock.MagicMock(status_code=http_client.BAD_REQUEST)),
+            self.conn.get.return_value]
+
+        self.base_resource2.refresh(select=['Oem'])
+
+        self.conn.get.assert_has_calls([
+            mock.call(path='/Foo?$select=Oem'),
+            mock.call(path='/Foo'),
+        ])
+        self.assertEqual(['Contoso', 'EID_412_ASB_123'],
+                         self.base_resource2._oem_vendors)
+
+    @mock.patch.object(resource_base, 'LOG', autospec=True)
+    def test_refresh_no_attributes_dump(self, mock_log):
+        mock_log.isEnabledFor.return_value = False
+        with mock.patch.object(self.base_resource2, '_get_attributes',
+                               autospec=True) as mock_get_attributes:
+            self.base_resource2.refresh()
+            mock_get_attributes.assert_not_called()
+        mock_log.debug.assert_not_called()
+
+    @mock.patch.object(resource_base, 'LOG', autospec=True)
+    def test_refresh_attributes_dump(self, mock_log):
+        mock_log.isEnabledFor.return_value = True
+        self.base_resource2.refresh()
+        expected = {
+            '_oem_vendors': ['Contoso', 'EID_412_ASB_123'],
+            'links': {'oem_vendors': ['Contoso', 'EID_420_ASB_345']},
+        }
+        mock_log.debug.assert_called_once_with(
+            mock.ANY, {'type': 'BaseResource2', 'path': '/Foo', 'source': '',
+                       'json': expected})
+
+    def test__get_headers_reuses_last_fetch(self):
+        self.conn.get.return_value.headers = {'ETag': '"abc"'}
+        self.base_resource2.refresh()
+        self.conn.reset_mock()
+
+        self.assertEqual('"abc"', self.base_resource2._get_etag())
+        self.conn.get.assert_not_called()
+        self.conn.head.assert_not_called()
+
+    def test__get_headers_head_when_stale(self):
+        self.conn.head.return_value.headers = {'Allow': 'GET, PATCH'}
+        self.base_resource2.invalidate()
+
+        self.assertTrue(self.base_resource2._allow_patch())
+        self.conn.head.assert_called_once_with(path='/Foo')
+        self.conn.get.assert_not_called()
+
+    @mock.patch('time.monotonic', autospec=True)
+    def test__get_headers_head_when_old(self, mock_monotonic):
+        mock_monotonic.return_value = 1000
+        self.conn.get.return_value.headers = {'ETag': '"abc"'}
+        self.base_resource2.refresh()
+
+        mock_monotonic.return_value = 1031
+        self.conn.head.return_value.headers = {'ETag': '"def"'}
+        self.assertEqual('"def"', self.base_resource2._get_etag())
+        self.conn.head.assert_called_once_with(path='/Foo')
+
+    def test__get_headers_head_not_supported(self):
+        response = mock.Mock(status_code=http_client.METHOD_NOT_ALLOWED)
+        self.conn.head.side_effect = exceptions.HTTPError(
+            'HEAD', '/Foo', response)
+        self.conn.get.return_value.headers = {'ETag': '"abc"'}
+        self.base_resource2.invalidate()
+        self.conn.reset_mock()
+
+        self.assertEqual('"abc"', self.base_resource2._get_etag())
+        self.conn.head.assert_called_once_with(path='/Foo')
+        self.conn.get.assert_called_once_with(path='/Foo')
+
 
 class TestResource(resource_base.ResourceBase):
     """A concrete Test Resource to test against"""
@@ -223,6 +440,110 @@ class TestResourceCollection(resource_base.ResourceCollectionBase):
             connector, 'Fakes', redfish_version, registries, root)
 
 
+class LinkedResource(resource_base.ResourceBase):
+
+    def _parse_attributes(self, json_doc):
+        pass
+
+    @property
+    @utils.cache_it
+    def peer(self):
+        return LinkedResource(self._conn, self._json['Peer'],
+                              redfish_version=self.redfish_version,
+                              root=self.root)
+
+    def _do_refresh(self, force):
+        utils.cache_clear(self, force)
+
+
+class IdentityMapTestCase(base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.conn = mock.Mock()
+        self.conn.get.return_value.json.side_effect = lambda: {
+            'Peer': '/Bar' if self.conn.get.call_args[1]['path'] == '/Foo'
+            else '/Foo'}
+        self.conn.get.return_value.headers = {}
+        self.root = mock.Mock(_identity_map=resource_base.IdentityMap(2))
+
+    def _get(self, path, **kwargs):
+        return LinkedResource(self.conn, path, redfish_version='1.0.2',
+                              root=self.root, **kwargs)
+
+    def test_resource_reused(self):
+        foo = self._get('/Foo')
+
+        self.assertIs(foo, self._get('/Foo/'))
+        self.assertIs(foo, foo.peer.peer)
+        self.assertEqual([mock.call(path='/Foo'), mock.call(path='/Bar')],
+                         self.conn.get.call_args_list)
+
+    def test_resource_refreshed_if_stale(self):
+        foo = self._get('/Foo')
+        foo.invalidate()
+
+        self.assertIs(foo, self._get('/Foo'))
+        self.assertEqual(2, self.conn.get.call_count)
+        self.assertFalse(foo._is_stale)
+
+    def test_not_reused_without_identity_map(self):
+        self.root._identity_map = None
+
+        self.assertIsNot(self._get('/Foo'), self._get('/Foo'))
+
+    def test_not_reused_with_select(self):
+        foo = self._get('/Foo')
+
+        self.assertIsNot(foo, self._get('/Foo', select=['Peer']))
+        self.assertIs(foo, self._get('/Foo'))
+
+    def test_replaced_with_json_doc(self):
+        foo = self._get('/Foo')
+        new_foo = self._get('/Foo', json_doc={'Peer': '/Baz'})
+
+        self.assertIsNot(foo, new_foo)
+        self.assertIs(new_foo, self._get('/Foo'))
+
+    def test_cascading_refresh(self):
+        foo = self._get('/Foo')
+        foo.peer.peer
+        self.conn.get.reset_mock()
+
+        foo.refresh()
+
+        self.assertEqual(2, self.conn.get.call_count)
+
+    def test_lru_eviction(self):
+        identity_map = resource_base.IdentityMap(2)
+        identity_map.add('a', LinkedResource(self.conn, '/A'))
+        identity_map.add('b', LinkedResource(self.conn, '/B'))
+        identity_map.get('a')
+        identity_map.add('c', LinkedResource(self.conn, '/C'))
+        gc.collect()
+
+        self.assertEqual(2, len(identity_map))
+        self.assertIsNotNone(identity_map.get('a'))
+        self.assertIsNone(identity_map.get('b'))
+        self.assertIsNotNone(identity_map.get('c'))
+
+    def test_referenced_resources_kept(self):
+        identity_map = resource_base.IdentityMap(1)
+        a = LinkedResource(self.conn, '/A')
+        identity_map.add('a', a)
+        identity_map.add('b', LinkedResource(self.conn, '/B'))
+        gc.collect()
+
+        self.assertIs(a, identity_map.get('a'))
+
+    def test_clear(self):
+        identity_map = resource_base.IdentityMap(2)
+        identity_map.add('a', LinkedResource(self.conn, '/A'))
+        identity_map.clear()
+
+        self.assertEqual(0, len(identity_map))
+
+
 class ResourceCollectionBaseTestCase(base.TestCase):
 
     def setUp(self):
@@ -307,6 +628,116 @@ class ResourceCollectionBaseTestCase(base.TestCase):
         result = self._validate_get_members_result(('1', '2'))
         self.assertIs(result, self.test_resource_collection.get_members())
 
+    def test_get_members_concurrently(self):
+        self.conn.max_workers = 4
+        member_ids = tuple(str(i) for i in range(10))
+        result = self._validate_get_members_result(member_ids)
+        self.assertEqual(list(member_ids), [m.identity for m in result])
+        self.assertEqual(10, self.conn.get.call_count)
+        self.assertIs(result, self.test_resource_collection.get_members())
+
+    def test_get_members_concurrently_errors(self):
+        self.conn.max_workers = 4
+        self.test_resource_collection.members_identities = ('1', '2', '3')
+
+        def _get(path):
+            if path != 'Fakes/2':
+                raise exceptions.ResourceNotFoundError(
+                    method='GET', url=path,
+                    response=mock.MagicMock(
+                        status_code=http_client.NOT_FOUND))
+            return mock.MagicMock()
+
+        self.conn.get.side_effect = _get
+
+        exc = self.assertRaises(exceptions.MembersError,
+                                self.test_resource_collection.get_members)
+        self.assertEqual(['1', '3'], list(exc.errors))
+        for error in exc.errors.values():
+            self.assertIsInstance(error, exceptions.ResourceNotFoundError)
+        self.assertIn('Failed to get 2 member(s) of Fakes', str(exc))
+
+
+class TestExpandableResource(resource_base.ResourceBase):
+
+    identity = resource_base.Field('Id', required=True)
+
+
+class TestExpandableResourceCollection(resource_base.ResourceCollectionBase):
+
+    _resource_type = TestExpandableResource
+
+
+class ResourceCollectionExpandTestCase(base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.conn = mock.Mock()
+        self.root = mock.Mock(members_expand_query='?$expand=.($levels=1)')
+        self.conn.get.return_value.json.return_value = {
+            'Members': [{'@odata.id': '/Fakes/1'},
+                        {'@odata.id': '/Fakes/2'}]
+        }
+        self.collection = TestExpandableResourceCollection(
+            self.conn, '/Fakes', root=self.root)
+        self.conn.get.reset_mock()
+        self.expanded = {
+            'Members': [{'@odata.id': '/Fakes/1', 'Id': '1'},
+                        {'@odata.id': '/Fakes/2', 'Id': '2'}]
+        }
+
+    def _assert_members(self, members):
+        self.assertEqual(['1', '2'], [m.identity for m in members])
+        self.assertEqual(['/Fakes/1', '/Fakes/2'],
+                         [m.path for m in members])
+        for member in members:
+            self.assertIs(self.root, member.root)
+
+    def test_get_members_already_expanded(self):
+        self.collection.refresh(json_doc=self.expanded)
+
+        self._assert_members(self.collection.get_members())
+        self.conn.get.assert_not_called()
+
+    def test_get_members_expand(self):
+        self.conn.get.return_value.json.return_value = self.expanded
+
+        self._assert_members(self.collection.get_members())
+        self.conn.get.assert_called_once_with(
+            path='/Fakes?$expand=.($levels=1)')
+
+    def test_get_members_expand_disabled(self):
+        self.root.members_expand_query = None
+        self.conn.get.return_value.json.side_effect = [
+            {'Id': '1'}, {'Id': '2'}]
+
+        self._assert_members(self.collection.get_members())
+        self.conn.get.assert_has_calls([
+            mock.call(path='/Fakes/1'),
+            mock.call(path='/Fakes/2'),
+        ], any_order=True)
+        self.assertEqual(2, self.conn.get.call_count)
+
+    def test_get_members_expand_ignored(self):
+        self.conn.get.return_value.json.side_effect = [
+            {'Members': [{'@odata.id': '/Fakes/1'},
+                         {'@odata.id': '/Fakes/2'}]},
+            {'Id': '1'}, {'Id': '2'}]
+
+        self._assert_members(self.collection.get_members())
+        self.assertEqual(3, self.conn.get.call_count)
+
+    def test_get_members_expand_fails(self):
+        self.conn.get.side_effect = [
+            exceptions.BadRequestError(
+                method='GET', url='/Fakes',
+                response=mock.MagicMock(status_code=http_client.BAD_REQUEST)),
+            mock.Mock(**{'json.return_value': {'Id': '1'}}),
+            mock.Mock(**{'json.return_value': {'Id': '2'}})]
+
+        self._assert_members(self.collection.get_members())
+        self.assertEqual(3, self.conn.get.call_count)
+
 
 TEST_JSON = {
     'String': 'a string',
@@ -346,6 +777,101 @@ MAPPING = {
 }
 
 
+class ResourceCollectionPagingTestCase(base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.conn = mock.Mock()
+        self.pages = {
+            '/Fakes': {
+                'Members': [{'@odata.id': '/Fakes/1'}],
+                'Members@odata.nextLink': '/Fakes?$skip=1'},
+            '/Fakes?$skip=1': {
+                'Members': [{'@odata.id': '/Fakes/2/'}],
+                'Members@odata.nextLink': '/Fakes?$skip=2'},
+            '/Fakes?$skip=2': {
+                'Members': [{'@odata.id': '/Fakes/3'}]},
+        }
+        self.conn.get.side_effect = self._get
+        self.root = mock.Mock(members_expand_query=None)
+        self.collection = TestExpandableResourceCollection(
+            self.conn, '/Fakes', root=self.root)
+        self.conn.get.reset_mock()
+
+    def _get(self, path):
+        json_doc = self.pages.get(path)
+        if json_doc is None:
+            json_doc = {'@odata.id': path, 'Id': path.rsplit('/', 1)[-1]}
+        return mock.Mock(json=mock.Mock(return_value=json_doc))
+
+    def _expand_pages(self):
+        for page in self.pages.values():
+            page['Members'] = [{'@odata.id': m['@odata.id'],
+                                'Id': m['@odata.id'].strip('/')[-1]}
+                               for m in page['Members']]
+
+    def test_members_identities(self):
+        self.assertEqual(('/Fakes/1', '/Fakes/2', '/Fakes/3'),
+                         self.collection.members_identities)
+        self.assertEqual(2, self.conn.get.call_count)
+
+        self.collection.members_identities
+        self.assertEqual(2, self.conn.get.call_count)
+
+    def test_members_identities_refresh(self):
+        self.collection.members_identities
+        self.pages['/Fakes'].pop('Members@odata.nextLink')
+        self.collection.refresh()
+
+        self.assertEqual(('/Fakes/1',), self.collection.members_identities)
+
+    def test_members_identities_loop(self):
+        self.pages['/Fakes?$skip=2']['Members@odata.nextLink'] = (
+            '/Fakes?$skip=1')
+
+        self.assertEqual(('/Fakes/1', '/Fakes/2', '/Fakes/3'),
+                         self.collection.members_identities)
+
+    def test_iter_members(self):
+        members = self.collection.iter_members()
+
+        self.assertEqual('1', next(members).identity)
+        self.conn.get.assert_called_once_with(path='/Fakes/1')
+        self.assertEqual('2', next(members).identity)
+        self.assertEqual(3, self.conn.get.call_count)
+        self.assertEqual(['3'], [m.identity for m in members])
+        self.assertEqual(5, self.conn.get.call_count)
+
+    def test_iter_members_expanded(self):
+        self._expand_pages()
+        self.collection.refresh()
+        self.conn.get.reset_mock()
+
+        members = list(self.collection.iter_members())
+
+        self.assertEqual(['1', '2', '3'], [m.identity for m in members])
+        self.assertEqual(['/Fakes/1', '/Fakes/2', '/Fakes/3'],
+                         [m.path for m in members])
+        self.assertEqual(2, self.conn.get.call_count)
+
+    def test_get_members(self):
+        members = self.collection.get_members()
+
+        self.assertEqual(['1', '2', '3'], [m.identity for m in members])
+        # Two pages and three members
+        self.assertEqual(5, self.conn.get.call_count)
+
+    def test_get_members_expanded(self):
+        self._expand_pages()
+        self.collection.refresh()
+        self.conn.get.reset_mock()
+
+        members = self.collection.get_members()
+
+        self.assertEqual(['1', '2', '3'], [m.identity for m in members])
+        self.assertEqual(2, self.conn.get.call_count)
+
+
 class EnumMapping(enum.Enum):
 
     FIELD1 = "PROTOCOL_FIELD_1"
@@ -478,11 +1004,55 @@ class FieldTestCase(base.TestCase):
         self.assertRaisesRegex(KeyError, '_load', lambda: field['_load'])
         self.assertRaisesRegex(KeyError, '__init__', lambda: field['__init__'])
 
+    def test_field_values_are_records(self):
+        nested = self.test_resource.nested
+        items = self.test_resource.field_list
+        entry = self.test_resource.dictionary['key1']
+
+        self.assertIsInstance(nested, NestedTestField)
+        self.assertIsInstance(items[0], TestListField)
+        self.assertIsInstance(entry, TestDictionaryField)
+        self.assertIs(type(items[0]), type(items[1]))
+        self.assertEqual({'string', 'integer'},
+                         set(type(items[0]).__slots__))
+        self.assertEqual({}, vars(items[0]))
+        self.assertEqual(['ListField'], items[0]._path)
+        self.assertEqual(2, items[1]['integer'])
+        # The field definitions are not modified
+        self.assertIsInstance(TestListField.string, resource_base.Field)
+        self.assertIsInstance(ComplexResource.field_list.string,
+                              resource_base.Field)
+
+    def test_field_values_record_class_per_field(self):
+        self.test_resource.refresh(force=True)
+        nested = self.test_resource.nested
+
+        self.assertIs(type(nested), type(self.test_resource.nested))
+        self.assertIsNot(type(nested),
+                         type(NestedTestField('Other')._load(
+                             {'Other': self.json['Nested']},
+                             self.test_resource)))
+
     def test_invalid_mapping_definiton(self):
         self.assertRaises(TypeError, resource_base.MappedField, 'Field', 42)
         self.assertRaises(TypeError, resource_base.MappedListField,
                           'Field', 42)
 
+    def test_collect_fields_cached_per_class(self):
+        class SubResource(ComplexResource):
+            extra = resource_base.Field('Extra')
+
+        fields = resource_base._collect_fields(self.test_resource)
+        self.assertIs(fields,
+                      resource_base._collect_fields(self.test_resource))
+        self.assertIn(('nested', ComplexResource.nested), fields)
+
+        sub_fields = dict(resource_base._collect_fields(
+            SubResource(self.conn, json_doc=self.json)))
+        self.assertIn('extra', sub_fields)
+        self.assertIn('nested', sub_fields)
+        self.assertNotIn('extra', dict(fields))
+
 
 class PartialKeyResource(resource_base.ResourceBase):
     string = resource_base.Field(
@@ -56,7 +56,8 @@ class SoftwareInventoryTestCase(base.TestCase):
         self.assertEqual('1.45.455b66-rev4', self.soft_inv.version)
 
     def test__parse_attributes_return(self):
-        attributes = self.soft_inv._parse_attributes(self.json_doc)
+        self.soft_inv._parse_attributes(self.json_doc)
+        attributes = self.soft_inv._get_attributes()
 
         # Test that various types are returned correctly
         self.assertEqual('BMC', attributes.get('identity'))
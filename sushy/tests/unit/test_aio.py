@@ -0,0 +1,348 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import asyncio
+import json
+from unittest import mock
+
+import sushy
+from sushy import aio
+from sushy import exceptions
+from sushy.resources.system import system
+from sushy.tests.unit import base
+
+# Not mocked, for responses to take time
+_sleep = asyncio.sleep
+
+
+def load_sample(name):
+    with open(f'sushy/tests/unit/json_samples/{name}') as f:
+        return json.load(f)
+
+
+class FakeResponse:
+
+    def __init__(self, status=200, json_doc=None, headers=None, delay=0):
+        self.status = status
+        self.headers = headers or {}
+        self._content = (json.dumps(json_doc).encode()
+                         if json_doc is not None else b'')
+        self._delay = delay
+
+    async def read(self):
+        await _sleep(self._delay)
+        return self._content
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *_args):
+        pass
+
+
+class FakeHTTPSession:
+    """Replies to requests by method and path."""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.requests = []
+        self.close = mock.AsyncMock()
+
+    def request(self, method, url, **kwargs):
+        self.requests.append((method, url, kwargs))
+        reply = self.routes[(method, url.replace('http://foo.bar', ''))]
+        if isinstance(reply, list):
+            reply = reply.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+
+class AsyncConnectorTestCase(base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.http = FakeHTTPSession({})
+        self.conn = aio.AsyncConnector('http://foo.bar',
+                                       http_session=self.http,
+                                       server_side_retries=1)
+        patcher = mock.patch.object(asyncio, 'sleep',
+                                    new_callable=mock.AsyncMock)
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _route(self, method, path, *replies):
+        self.http.routes[(method, path)] = list(replies)
+
+    def test_get(self):
+        self._route('GET', '/Foo', FakeResponse(json_doc={'Id': 'Foo'}))
+
+        response = asyncio.run(self.conn.get(path='/Foo'))
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual({'Id': 'Foo'}, response.json())
+        self.assertEqual(
+            [('GET', 'http://foo.bar/Foo',
+              {'json': None,
+               'headers': {'OData-Version': '4.0',
+                           'Accept-Encoding': 'identity'}})],
+            self.http.requests)
+
+    def test_session_auth(self):
+        self.conn.set_http_session_auth('token')
+        self._route('GET', '/Foo', FakeResponse())
+
+        asyncio.run(self.conn.get(path='/Foo'))
+
+        headers = self.http.requests[0][2]['headers']
+        self.assertEqual('token', headers['X-Auth-Token'])
+        self.assertNotIn('Authorization', headers)
+
+    def test_basic_auth(self):
+        self.conn.set_http_basic_auth('foo', 'bar')
+        self._route('GET', '/Foo', FakeResponse())
+
+        asyncio.run(self.conn.get(path='/Foo'))
+
+        headers = self.http.requests[0][2]['headers']
+        self.assertEqual('Basic Zm9vOmJhcg==', headers['Authorization'])
+
+    def test_no_verify(self):
+        self.conn._verify = False
+        self._route('GET', '/Foo', FakeResponse())
+
+        asyncio.run(self.conn.get(path='/Foo'))
+
+        self.assertIs(False, self.http.requests[0][2]['ssl'])
+
+    def test_server_side_error_retried(self):
+        self._route('GET', '/Foo', FakeResponse(status=500),
+                    FakeResponse(json_doc={}))
+
+        response = asyncio.run(self.conn.get(path='/Foo'))
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(2, len(self.http.requests))
+        self.sleep.assert_called_once_with(0)
+
+    def test_server_side_error(self):
+        self._route('GET', '/Foo', FakeResponse(status=500),
+                    FakeResponse(status=503))
+
+        self.assertRaises(exceptions.ServerSideError, asyncio.run,
+                          self.conn.get(path='/Foo'))
+
+    def test_not_acceptable_retried_without_identity(self):
+        self._route('GET', '/Foo', FakeResponse(status=406),
+                    FakeResponse(json_doc={}))
+
+        asyncio.run(self.conn.get(path='/Foo'))
+
+        self.assertEqual({'OData-Version': '4.0'},
+                         self.http.requests[1][2]['headers'])
+
+    def test_access_error_reauth(self):
+        auth = mock.Mock(spec=aio.AsyncSessionOrBasicAuth)
+        auth.can_refresh_session.return_value = True
+        self.conn.set_auth(auth)
+        self._route('GET', '/Foo', FakeResponse(status=401),
+                    FakeResponse(json_doc={}))
+
+        response = asyncio.run(self.conn.get(path='/Foo'))
+
+        self.assertEqual(200, response.status_code)
+        auth.refresh_session.assert_awaited_once_with()
+
+    def test_access_error_basic_auth(self):
+        self.conn.set_auth(mock.Mock(spec=aio.AsyncSessionOrBasicAuth))
+        self.conn.set_http_basic_auth('foo', 'bar')
+        self._route('GET', '/Foo', FakeResponse(status=401))
+
+        self.assertRaises(exceptions.AccessError, asyncio.run,
+                          self.conn.get(path='/Foo'))
+
+    def test_connection_error(self):
+        self.conn._server_side_retries = 3
+        self._route('GET', '/Foo', OSError('boom'), OSError('boom'),
+                    OSError('boom'))
+
+        self.assertRaisesRegex(exceptions.ConnectionError, 'boom',
+                               asyncio.run, self.conn.get(path='/Foo'))
+        self.assertEqual(3, len(self.http.requests))
+
+    def test_patch_weak_etag(self):
+        self._route('PATCH', '/Foo', FakeResponse(status=412),
+                    FakeResponse(json_doc={}))
+
+        asyncio.run(self.conn.patch(path='/Foo', data={'Foo': 'bar'},
+                                    etag='W/"abc"'))
+
+        self.assertEqual('W/"abc"',
+                         self.http.requests[0][2]['headers']['If-Match'])
+        self.assertEqual('"abc"',
+                         self.http.requests[1][2]['headers']['If-Match'])
+
+    def test_patch_strong_etag(self):
+        self._route('PATCH', '/Foo', FakeResponse(status=412),
+                    FakeResponse(json_doc={}))
+
+        asyncio.run(self.conn.patch(path='/Foo', data={'Foo': 'bar'},
+                                    etag='"abc"'))
+
+        self.assertNotIn('If-Match', self.http.requests[1][2]['headers'])
+
+    def test_blocking_not_supported(self):
+        self.assertRaises(ValueError, asyncio.run,
+                          self.conn.post(path='/Foo', blocking=True))
+
+    def test_max_concurrent_requests(self):
+        in_flight = []
+        max_in_flight = []
+
+        class CountingResponse(FakeResponse):
+
+            async def __aenter__(self):
+                in_flight.append(self)
+                max_in_flight.append(len(in_flight))
+                return self
+
+            async def __aexit__(self, *_args):
+                in_flight.remove(self)
+
+        conn = aio.AsyncConnector('http://foo.bar', http_session=self.http,
+                                  max_concurrent_requests=2)
+        self._route('GET', '/Foo',
+                    *(CountingResponse(delay=0.01) for _ in range(5)))
+
+        async def get_all():
+            return await asyncio.gather(
+                *(conn.get(path='/Foo') for _ in range(5)))
+
+        self.assertEqual(5, len(asyncio.run(get_all())))
+        self.assertEqual(2, max(max_in_flight))
+
+    def test_close(self):
+        asyncio.run(self.conn.close())
+        self.http.close.assert_not_called()
+
+    @mock.patch.object(aio, 'aiohttp', None)
+    def test_aiohttp_missing(self):
+        conn = aio.AsyncConnector('http://foo.bar')
+        self.assertRaises(ImportError, asyncio.run, conn.get(path='/Foo'))
+
+
+class AsyncSushyTestCase(base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.http = FakeHTTPSession({
+            ('GET', '/redfish/v1/'): FakeResponse(
+                json_doc=load_sample('root.json')),
+            ('POST', '/redfish/v1/SessionService/Sessions'): FakeResponse(
+                headers={'X-Auth-Token': 'token',
+                         'Location': '/redfish/v1/SessionService/Sessions/1'}),
+            ('DELETE', '/redfish/v1/SessionService/Sessions/1'):
+                FakeResponse(),
+            ('GET', '/redfish/v1/Systems'): FakeResponse(
+                json_doc=load_sample('system_collection.json')),
+            ('GET', '/redfish/v1/Systems/437XR1138R2'): FakeResponse(
+                json_doc=load_sample('system.json')),
+        })
+        self.conn = aio.AsyncConnector('http://foo.bar',
+                                       http_session=self.http)
+
+    def _connect(self, **kwargs):
+        return asyncio.run(aio.AsyncSushy.connect(
+            'http://foo.bar', username='foo', password='bar',
+            connector=self.conn, **kwargs))
+
+    def test_connect(self):
+        root = self._connect()
+
+        self.assertEqual('RootService', root.identity)
+        self.assertEqual('1.0.2', root.redfish_version)
+        self.assertEqual('token', self.conn._session.headers['X-Auth-Token'])
+        self.assertEqual({'UserName': 'foo', 'Password': 'bar'},
+                         self.http.requests[1][2]['json'])
+
+    def test_connect_fallback_to_basic_auth(self):
+        self.http.routes[('POST', '/redfish/v1/SessionService/Sessions')] = (
+            FakeResponse(status=404))
+
+        self._connect()
+
+        self.assertEqual(('foo', 'bar'), self.conn._session.auth)
+
+    def test_connect_auth_and_username(self):
+        self.assertRaises(ValueError, self._connect, auth=mock.Mock())
+
+    def test_get_system(self):
+        root = self._connect()
+
+        sys = asyncio.run(root.get_system())
+
+        self.assertIsInstance(sys, system.System)
+        self.assertEqual('437XR1138R2', sys.identity)
+        self.assertEqual(sushy.PowerState.ON, sys.power_state)
+        self.assertIs(root, sys.root)
+
+    def test_get_system_collection_members(self):
+        root = self._connect()
+
+        async def get_members():
+            collection = await root.get_system_collection()
+            return await collection.get_members_async()
+
+        members = asyncio.run(get_members())
+
+        self.assertEqual(['437XR1138R2'], [m.identity for m in members])
+
+    def test_get_system_collection_members_paged(self):
+        collection_doc = load_sample('system_collection.json')
+        collection_doc['Members@odata.nextLink'] = '/redfish/v1/Systems?p=2'
+        self.http.routes[('GET', '/redfish/v1/Systems')] = FakeResponse(
+            json_doc=collection_doc)
+        self.http.routes[('GET', '/redfish/v1/Systems?p=2')] = FakeResponse(
+            json_doc={'Members': [{'@odata.id': '/redfish/v1/Systems/2'}]})
+        doc = load_sample('system.json')
+        doc['Id'] = '2'
+        self.http.routes[('GET', '/redfish/v1/Systems/2')] = FakeResponse(
+            json_doc=doc)
+        root = self._connect()
+
+        async def get_members():
+            collection = await root.get_system_collection()
+            return await collection.get_members_async()
+
+        members = asyncio.run(get_members())
+
+        self.assertEqual(['437XR1138R2', '2'], [m.identity for m in members])
+
+    def test_refresh_async(self):
+        root = self._connect()
+        sys = asyncio.run(root.get_system('/redfish/v1/Systems/437XR1138R2'))
+        doc = load_sample('system.json')
+        doc['PowerState'] = 'Off'
+        self.http.routes[('GET', '/redfish/v1/Systems/437XR1138R2')] = (
+            FakeResponse(json_doc=doc))
+
+        asyncio.run(sys.refresh_async())
+
+        self.assertEqual(sushy.PowerState.OFF, sys.power_state)
+
+    def test_close(self):
+        root = self._connect()
+
+        asyncio.run(root.close())
+
+        self.assertEqual('DELETE', self.http.requests[-1][0])
+        self.http.close.assert_not_called()
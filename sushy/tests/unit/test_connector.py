@@ -15,10 +15,12 @@
 
 from http import client as http_client
 import json
+import threading
 import time
 from unittest import mock
 
 import requests
+from urllib3 import connectionpool
 
 from sushy import auth as sushy_auth
 from sushy import connector
@@ -70,6 +72,12 @@ class ConnectorMethodsTestCase(base.TestCase):
                                          data=self.data, headers=self.headers,
                                          blocking=True, timeout=None)
 
+    @mock.patch.object(connector.Connector, '_op', autospec=True)
+    def test_head(self, mock__op):
+        self.conn.head(path='fake/path', headers=self.headers.copy())
+        mock__op.assert_called_once_with(mock.ANY, 'HEAD', 'fake/path',
+                                         headers=self.headers, timeout=None)
+
     @mock.patch.object(connector.Connector, '_op', autospec=True)
     def test_post(self, mock__op):
         self.conn.post(path='fake/path', data=self.data.copy(),
@@ -155,6 +163,132 @@ class ConnectorMethodsTestCase(base.TestCase):
         self.conn.close()
         session.close.assert_called_once_with()
 
+    def test_init_connection_close_by_default(self):
+        self.assertEqual('close', self.conn._session.headers['Connection'])
+
+    def test_init_keep_alive(self):
+        conn = connector.Connector('http://foo.bar:1234', keep_alive=True,
+                                   pool_maxsize=4)
+        self.assertEqual('keep-alive', conn._session.headers['Connection'])
+        adapter = conn._session.get_adapter('https://foo.bar:1234')
+        self.assertIs(adapter, conn._session.get_adapter('http://foo.bar'))
+        self.assertEqual(4, adapter._pool_maxsize)
+
+    def test_init_connection_tracking(self):
+        conn = connector.Connector('http://foo.bar:1234', keep_alive=True,
+                                   keep_alive_max_requests=5)
+        pool = conn._session.get_adapter(
+            'http://foo.bar').poolmanager.connection_from_url(
+                'http://foo.bar:1234')
+        self.assertIsInstance(pool, connector._TrackingHTTPConnectionPool)
+        self.assertIs(conn._connection_tracker, pool.connection_tracker)
+        self.assertEqual(5, conn._connection_tracker._max_requests)
+
+    @mock.patch.object(connectionpool, 'is_connection_dropped',
+                       autospec=True, return_value=False)
+    def test_connection_stats_from_pool(self, mock_dropped):
+        pool = self.conn._session.get_adapter(
+            'http://foo.bar').poolmanager.connection_from_url(
+                'http://foo.bar:1234')
+        http_conn = pool._get_conn()
+        # Connected by the request
+        http_conn.sock = mock.Mock()
+        pool._put_conn(http_conn)
+        self.assertIs(http_conn, pool._get_conn())
+        self.assertEqual({'new': 1, 'reused': 1}, self.conn.connection_stats)
+
+    def test_max_workers(self):
+        self.assertEqual(1, self.conn.max_workers)
+        conn = connector.Connector('http://foo.bar:1234', max_workers=8)
+        self.assertEqual(8, conn.max_workers)
+
+
+class FakeHTTPConnection:
+
+    host = 'foo.bar'
+
+    def __init__(self):
+        self.sock = None
+
+    def connect(self):
+        self.sock = mock.Mock()
+
+    def close(self):
+        self.sock = None
+
+
+class ConnectionTrackerTestCase(base.TestCase):
+
+    def _request(self, tracker, http_conn):
+        tracker.acquire(http_conn)
+        if http_conn.sock is None:
+            http_conn.connect()
+        tracker.release(http_conn)
+
+    def test_stats(self):
+        tracker = connector._ConnectionTracker()
+        http_conn = FakeHTTPConnection()
+        for _ in range(3):
+            self._request(tracker, http_conn)
+        self.assertEqual({'new': 1, 'reused': 2}, tracker.stats)
+
+    def test_closed_by_server(self):
+        tracker = connector._ConnectionTracker()
+        http_conn = FakeHTTPConnection()
+        self._request(tracker, http_conn)
+        http_conn.close()
+        self._request(tracker, http_conn)
+        self.assertEqual({'new': 2, 'reused': 0}, tracker.stats)
+
+    def test_max_requests(self):
+        tracker = connector._ConnectionTracker(max_requests=2)
+        http_conn = FakeHTTPConnection()
+        for _ in range(5):
+            self._request(tracker, http_conn)
+        self.assertEqual({'new': 3, 'reused': 2}, tracker.stats)
+
+    @mock.patch.object(time, 'monotonic', autospec=True)
+    def test_idle_timeout(self, mock_monotonic):
+        mock_monotonic.side_effect = [100, 105, 106, 200, 201]
+        tracker = connector._ConnectionTracker(idle_timeout=10)
+        http_conn = FakeHTTPConnection()
+        for _ in range(3):
+            self._request(tracker, http_conn)
+        self.assertEqual({'new': 2, 'reused': 1}, tracker.stats)
+
+    def test_concurrent_connections(self):
+        tracker = connector._ConnectionTracker(max_requests=1,
+                                               idle_timeout=10)
+        conn1 = FakeHTTPConnection()
+        conn2 = FakeHTTPConnection()
+        # Both are in use before either is released
+        tracker.acquire(conn1)
+        conn1.connect()
+        tracker.acquire(conn2)
+        conn2.connect()
+        tracker.release(conn1)
+        # Recycling the first connection leaves the second one open
+        tracker.acquire(conn1)
+        self.assertIsNone(conn1.sock)
+        self.assertIsNotNone(conn2.sock)
+        tracker.release(conn2)
+        self.assertEqual({'new': 3, 'reused': 0}, tracker.stats)
+
+    def test_concurrent_threads(self):
+        tracker = connector._ConnectionTracker(max_requests=10)
+
+        def _worker():
+            http_conn = FakeHTTPConnection()
+            for _ in range(100):
+                self._request(tracker, http_conn)
+
+        threads = [threading.Thread(target=_worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual({'new': 80, 'reused': 720}, tracker.stats)
+
 
 class ConnectorOpTestCase(base.TestCase):
 
@@ -0,0 +1,162 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+import threading
+from unittest import mock
+
+from sushy import exceptions
+from sushy import fleet
+from sushy.tests.unit import base
+
+
+class CrawlTestCase(base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.sushy = self._patch(fleet.main, 'Sushy')
+        self.connector = self._patch(fleet.sushy_connector, 'Connector')
+        self.auth = self._patch(fleet.sushy_auth, 'SessionOrBasicAuth')
+        self.system = mock.Mock(path='/redfish/v1/Systems/1')
+        self.system.processors.get_members.return_value = ['cpu1', 'cpu2']
+        self.system.ethernet_interfaces.get_members.return_value = ['nic1']
+        self.system.simple_storage.get_members.side_effect = (
+            exceptions.MissingAttributeError(attribute='SimpleStorage',
+                                             resource='/redfish/v1/Systems/1'))
+        self.system.storage.get_members.return_value = []
+        root = self.sushy.return_value
+        root.get_system_collection.return_value.get_members.return_value = [
+            self.system]
+
+    def _patch(self, target, name):
+        patcher = mock.patch.object(target, name, autospec=True)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def test_crawl(self):
+        endpoint = fleet.Endpoint('https://bmc1', 'foo', 'bar', verify=False)
+
+        nodes = list(fleet.crawl([endpoint], max_requests_per_node=4,
+                                 expand_members=True))
+
+        self.assertEqual(1, len(nodes))
+        node = nodes[0]
+        self.assertIs(endpoint, node.endpoint)
+        self.assertIsNone(node.error)
+        self.assertEqual({'connect', 'systems', 'total'}, set(node.timings))
+        self.assertEqual(1, len(node.systems))
+        sys_inv = node.systems[0]
+        self.assertIs(self.system, sys_inv.system)
+        self.assertEqual({'processors': ['cpu1', 'cpu2'],
+                          'ethernet_interfaces': ['nic1'],
+                          'storage': []}, sys_inv.resources)
+        self.assertEqual(set(fleet.DEFAULT_RESOURCES), set(sys_inv.timings))
+        self.assertEqual({'simple_storage'}, set(sys_inv.errors))
+        self.auth.assert_called_once_with(username='foo', password='bar')
+        self.connector.assert_called_once_with(
+            'https://bmc1', verify=False, max_workers=4,
+            server_side_retries=10, server_side_retries_delay=3)
+        self.sushy.assert_called_once_with(
+            'https://bmc1', auth=self.auth.return_value,
+            connector=self.connector.return_value, expand_members=True)
+        self.auth.return_value.close.assert_called_once_with()
+        self.connector.return_value.close.assert_called_once_with()
+
+    def test_crawl_resources(self):
+        nodes = list(fleet.crawl([fleet.Endpoint('https://bmc1')],
+                                 resources=['processors']))
+
+        self.assertEqual({'processors': ['cpu1', 'cpu2']},
+                         nodes[0].systems[0].resources)
+        self.system.storage.get_members.assert_not_called()
+
+    def test_crawl_error(self):
+        error = exceptions.ConnectionError(url='https://bmc1', error='boom')
+        self.sushy.side_effect = error
+
+        nodes = list(fleet.crawl([fleet.Endpoint('https://bmc1')]))
+
+        self.assertIs(error, nodes[0].error)
+        self.assertEqual([], nodes[0].systems)
+        self.assertIn('connect', nodes[0].timings)
+        self.assertIn('total', nodes[0].timings)
+        self.connector.return_value.close.assert_called_once_with()
+
+    def test_crawl_unexpected_error(self):
+        error = ValueError('Expecting value: line 1 column 1 (char 0)')
+
+        def connect(base_url, **kwargs):
+            if base_url == 'https://bmc2':
+                raise error
+            return mock.DEFAULT
+
+        self.sushy.side_effect = connect
+        endpoints = [fleet.Endpoint('https://bmc%d' % i) for i in range(1, 4)]
+
+        nodes = {node.endpoint.base_url: node
+                 for node in fleet.crawl(endpoints)}
+
+        self.assertEqual({'https://bmc1', 'https://bmc2', 'https://bmc3'},
+                         set(nodes))
+        self.assertIs(error, nodes['https://bmc2'].error)
+        self.assertEqual([], nodes['https://bmc2'].systems)
+        self.assertIsNone(nodes['https://bmc1'].error)
+        self.assertEqual(1, len(nodes['https://bmc3'].systems))
+
+    def test_crawl_system_unexpected_error(self):
+        error = ValueError('Expecting value: line 1 column 1 (char 0)')
+        self.system.storage.get_members.side_effect = error
+
+        nodes = list(fleet.crawl([fleet.Endpoint('https://bmc1')]))
+
+        sys_inv = nodes[0].systems[0]
+        self.assertIs(error, sys_inv.errors['storage'])
+        self.assertEqual(['cpu1', 'cpu2'], sys_inv.resources['processors'])
+
+    def test_crawl_streams_results(self):
+        slow = threading.Event()
+
+        def connect(base_url, **kwargs):
+            if base_url == 'https://slow':
+                slow.wait(5)
+            return mock.DEFAULT
+
+        self.sushy.side_effect = connect
+        nodes = fleet.crawl([fleet.Endpoint('https://slow'),
+                             fleet.Endpoint('https://fast')], max_nodes=2)
+
+        # The fast node is yielded while the slow one is still crawled
+        self.assertEqual('https://fast', next(nodes).endpoint.base_url)
+        slow.set()
+        self.assertEqual('https://slow', next(nodes).endpoint.base_url)
+        self.assertRaises(StopIteration, next, nodes)
+
+    def test_crawl_max_nodes(self):
+        lock = threading.Lock()
+        running = []
+        max_running = []
+
+        def connect(base_url, **kwargs):
+            with lock:
+                running.append(base_url)
+                max_running.append(len(running))
+            threading.Event().wait(0.01)
+            with lock:
+                running.remove(base_url)
+            return mock.DEFAULT
+
+        self.sushy.side_effect = connect
+        endpoints = [fleet.Endpoint(f'https://bmc{i}') for i in range(6)]
+
+        nodes = list(fleet.crawl(endpoints, max_nodes=2))
+
+        self.assertEqual(6, len(nodes))
+        self.assertLessEqual(max(max_running), 2)
@@ -20,12 +20,16 @@ from sushy import auth
 from sushy import connector
 from sushy import exceptions
 from sushy import main
+from sushy.resources import base as resource_base
 from sushy.resources.chassis import chassis
 from sushy.resources.compositionservice import compositionservice
 from sushy.resources.eventservice import eventservice
 from sushy.resources.fabric import fabric
 from sushy.resources.manager import manager
+from sushy.resources.registry import message_registry
 from sushy.resources.registry import message_registry_file
+from sushy.resources.registry import packaged_registries
+from sushy.resources.registry import registry_pool
 from sushy.resources.sessionservice import session
 from sushy.resources.sessionservice import sessionservice
 from sushy.resources.system import system
@@ -81,6 +85,56 @@ class MainTestCase(base.TestCase):
         self.assertEqual('/redfish/v1/CompositionService',
                          self.root._composition_service_path)
 
+    def test_members_expand_query_disabled(self):
+        self.root.protocol_features_supported.expand_query = {
+            'NoLinks': True, 'Levels': True}
+        self.assertIsNone(self.root.members_expand_query)
+
+    def test_members_expand_query_not_supported(self):
+        self.root._expand_members = True
+        self.assertIsNone(self.root.members_expand_query)
+
+    def test_members_expand_query(self):
+        self.root._expand_members = True
+        self.root.protocol_features_supported.expand_query = {
+            'NoLinks': True, 'Levels': True, 'MaxLevels': 3}
+        self.assertEqual('?$expand=.($levels=1)',
+                         self.root.members_expand_query)
+
+    def test_members_expand_query_no_levels(self):
+        self.root._expand_members = True
+        self.root.protocol_features_supported.expand_query = {
+            'NoLinks': True, 'Levels': False}
+        self.assertEqual('?$expand=.', self.root.members_expand_query)
+
+    def test_members_expand_query_no_links_not_supported(self):
+        self.root._expand_members = True
+        self.root.protocol_features_supported.expand_query = {
+            'ExpandAll': True, 'NoLinks': False}
+        self.assertIsNone(self.root.members_expand_query)
+
+    def test_identity_map_disabled(self):
+        self.assertIsNone(self.root._identity_map)
+
+    def test_registry_pool_disabled(self):
+        self.assertIsNone(self.root._registry_pool)
+
+    @mock.patch.object(main.Sushy, 'refresh', autospec=True)
+    def test_identity_map(self, mock_refresh):
+        conn = mock.Mock()
+        with open('sushy/tests/unit/json_samples/system.json') as f:
+            conn.get.return_value.json.return_value = json.load(f)
+        root = main.Sushy('http://foo.bar:1234', connector=conn,
+                          auth=mock.Mock(), identity_map_size=10)
+
+        sys1 = root.get_system('/redfish/v1/Systems/437XR1138R2')
+
+        self.assertIs(sys1,
+                      root.get_system('/redfish/v1/Systems/437XR1138R2'))
+        conn.get.assert_called_once_with(
+            path='/redfish/v1/Systems/437XR1138R2')
+        self.assertIsInstance(root._identity_map, resource_base.IdentityMap)
+
     @mock.patch.object(connector, 'Connector', autospec=True)
     def test__init_throws_exception(self, mock_Connector):
         self.assertRaises(
@@ -121,7 +175,18 @@ class MainTestCase(base.TestCase):
             self.root._conn, 'fake-system-id',
             redfish_version=self.root.redfish_version,
             registries=mock_lazy_registries,
-            root=self.root)
+            root=self.root, select=None)
+
+    @mock.patch.object(system, 'System', autospec=True)
+    @mock.patch('sushy.Sushy.lazy_registries', autospec=True)
+    def test_get_system_select(self, mock_lazy_registries, mock_system):
+        self.root._standard_message_registries_path = None
+        self.root.get_system('fake-system-id', select=['PowerState'])
+        mock_system.assert_called_once_with(
+            self.root._conn, 'fake-system-id',
+            redfish_version=self.root.redfish_version,
+            registries=mock_lazy_registries,
+            root=self.root, select=['PowerState'])
 
     @mock.patch.object(system, 'SystemCollection', autospec=True)
     @mock.patch.object(system, 'System', autospec=True)
@@ -143,7 +208,7 @@ class MainTestCase(base.TestCase):
             self.root._conn, 'fake-system-id',
             redfish_version=self.root.redfish_version,
             registries=mock_lazy_registries,
-            root=self.root)
+            root=self.root, select=None)
 
     @mock.patch.object(system, 'SystemCollection', autospec=True)
     @mock.patch.object(system, 'System', autospec=True)
@@ -460,6 +525,38 @@ class MainTestCase(base.TestCase):
 
         self.assertEqual(5, len(registries))
         self.assertIn('Base.1.3.0', {r.identity for r in registries})
+        self.assertIs(packaged_registries.get_registries(), registries)
+
+    @mock.patch.object(packaged_registries, 'get_registries',
+                       autospec=True, return_value=None)
+    def test__get_standard_message_registry_collection_no_index(
+            self, mock_get_registries):
+        registries = self.root._get_standard_message_registry_collection()
+
+        self.assertEqual(5, len(registries))
+        self.assertIsInstance(registries[0], message_registry.MessageRegistry)
+
+    @mock.patch.object(packaged_registries, 'get_registries',
+                       autospec=True, return_value=None)
+    def test__get_standard_message_registry_collection_pool(
+            self, mock_get_registries):
+        self.root._registry_pool = registry_pool.RegistryPool()
+        registries = self.root._get_standard_message_registry_collection()
+
+        self.assertEqual(5, len(self.root._registry_pool))
+        again = self.root._get_standard_message_registry_collection()
+        self.assertEqual([id(r) for r in registries], [id(r) for r in again])
+
+    @mock.patch.object(packaged_registries, 'get_registries',
+                       autospec=True, return_value=None)
+    def test__get_standard_message_registry_collection_no_pool(
+            self, mock_get_registries):
+        self.root._registry_pool = None
+        registries = self.root._get_standard_message_registry_collection()
+
+        again = self.root._get_standard_message_registry_collection()
+        self.assertEqual(5, len(again))
+        self.assertIsNot(registries[0], again[0])
 
     @mock.patch('sushy.Sushy._get_standard_message_registry_collection',
                 autospec=True)
@@ -523,6 +620,27 @@ class MainTestCase(base.TestCase):
         self.assertEqual(expected, registries)
         self.assertEqual(cached_registries, registries)
 
+    @mock.patch('sushy.Sushy._get_standard_message_registry_collection',
+                autospec=True)
+    @mock.patch('sushy.Sushy._get_registry_collection', autospec=True)
+    def test_registries_store_and_pool(self, mock_col, mock_st_col):
+        mock_st_col.return_value = []
+        store = mock.Mock()
+        pool = mock.Mock()
+        self.root._registry_store = store
+        self.root._registry_pool = pool
+        mock_msg_reg_file = mock.Mock()
+        mock_msg_reg_file.get_message_registry.return_value = None
+        mock_msg_reg_file.get_attribute_registry.return_value = None
+        mock_col.return_value.get_members.return_value = [mock_msg_reg_file]
+
+        self.assertEqual({}, self.root.registries)
+
+        mock_msg_reg_file.get_message_registry.assert_called_once_with(
+            'en', self.root._public_connector, store=store, pool=pool)
+        mock_msg_reg_file.get_attribute_registry.assert_called_once_with(
+            'en', self.root._public_connector, store=store, pool=pool)
+
     @mock.patch('sushy.Sushy._get_standard_message_registry_collection',
                 autospec=True)
     @mock.patch('sushy.Sushy._get_registry_collection', autospec=True)
@@ -0,0 +1,79 @@
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+from unittest import mock
+
+from sushy import polling
+from sushy.tests.unit import base
+
+
+class FixedPollStrategyTestCase(base.TestCase):
+
+    def test_delay(self):
+        strategy = polling.FixedPollStrategy(5)
+
+        self.assertEqual(5, strategy.delay(0))
+        self.assertEqual(5, strategy.delay(10, percent_complete=50,
+                                           elapsed=100))
+        self.assertEqual(20, strategy.delay(0, retry_after=20))
+        self.assertEqual(0, strategy.delay(0, retry_after=0))
+
+
+class BackoffPollStrategyTestCase(base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.strategy = polling.BackoffPollStrategy(
+            initial=1, factor=2, max_delay=30, jitter=0)
+
+    def test_backoff(self):
+        self.assertEqual([1, 2, 4, 8, 16, 30, 30],
+                         [self.strategy.delay(attempt)
+                          for attempt in range(7)])
+        self.assertEqual(30, self.strategy.delay(10000))
+
+    def test_retry_after(self):
+        self.assertEqual(3, self.strategy.delay(10, retry_after=3))
+
+    def test_progress(self):
+        # Half done in 10 seconds, about 10 seconds remain
+        self.assertEqual(10, self.strategy.delay(5, percent_complete=50,
+                                                 elapsed=10))
+        # Not shorter than the initial delay
+        self.assertEqual(1, self.strategy.delay(5, percent_complete=99,
+                                                elapsed=10))
+        # Not longer than the backoff
+        self.assertEqual(2, self.strategy.delay(1, percent_complete=1,
+                                                elapsed=10))
+        for percent_complete in (None, 0, 100):
+            self.assertEqual(30, self.strategy.delay(
+                5, percent_complete=percent_complete, elapsed=10))
+
+    def test_progress_disabled(self):
+        strategy = polling.BackoffPollStrategy(
+            max_delay=30, jitter=0, use_progress=False)
+
+        self.assertEqual(30, strategy.delay(5, percent_complete=50,
+                                            elapsed=10))
+
+    @mock.patch.object(polling.random, 'uniform', autospec=True)
+    def test_jitter(self, mock_uniform):
+        strategy = polling.BackoffPollStrategy(
+            initial=10, max_delay=100, jitter=0.2)
+
+        mock_uniform.return_value = -0.2
+        self.assertEqual(8, strategy.delay(0))
+        mock_uniform.assert_called_once_with(-0.2, 0.2)
+
+        # The jitter does not exceed the maximum delay
+        mock_uniform.return_value = 0.2
+        self.assertEqual(100, strategy.delay(10))
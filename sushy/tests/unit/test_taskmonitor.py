@@ -11,13 +11,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from concurrent import futures
 from http import client as http_client
 import json
+import threading
+import time
 from unittest import mock
 
 import requests
 
 from sushy import exceptions
+from sushy import polling
 from sushy.resources import base as resource_base
 from sushy.resources.taskservice import task
 from sushy import taskmonitor
@@ -172,6 +176,27 @@ class TaskMonitorTestCase(base.TestCase):
             'Fri, 31 Dec 1999 23:59:59 GMT'
         self.assertEqual(0, self.task_monitor.sleep_for)
 
+    def test_sleep_for_retry_after_digit_string(self):
+        self.task_monitor._response.headers["Retry-After"] = '20'
+        self.assertEqual(20, self.task_monitor.sleep_for)
+
+    def test_sleep_for_poll_strategy(self):
+        strategy = mock.Mock(spec=polling.PollStrategy)
+        task_monitor = taskmonitor.TaskMonitor(
+            self.conn, '/Task/545', response=self.response,
+            poll_strategy=strategy)
+        self.response.headers['Retry-After'] = None
+        self.conn.get.return_value = self.response
+        task_monitor.refresh()
+
+        self.assertIs(strategy.delay.return_value, task_monitor.sleep_for)
+        args, kwargs = strategy.delay.call_args
+        self.assertEqual((1,), args)
+        self.assertIsNone(kwargs['retry_after'])
+        self.assertEqual(task_monitor.task.percent_complete,
+                         kwargs['percent_complete'])
+        self.assertGreaterEqual(kwargs['elapsed'], 0)
+
     def test_not_cancellable_no_header(self):
         response = mock.Mock()
         response.status_code = http_client.ACCEPTED
@@ -261,6 +286,51 @@ class TaskMonitorTestCase(base.TestCase):
         self.assertRaises(exceptions.ConnectionError,
                           self.task_monitor.wait, -10)
 
+    @mock.patch('time.sleep', autospec=True)
+    def test_wait_polls_once_per_cycle(self, mock_sleep):
+        self.conn.reset_mock()
+        processing = mock.MagicMock(spec=requests.Response)
+        processing.status_code = http_client.ACCEPTED
+        processing.headers = {'Retry-After': 5}
+        processing.content = None
+        done = mock.MagicMock(spec=requests.Response)
+        done.status_code = http_client.OK
+        done.headers = {}
+        self.conn.get.side_effect = [processing, processing, done]
+        polls = self.task_monitor.poll_count
+
+        self.task_monitor.wait(60)
+
+        self.assertEqual(3, self.conn.get.call_count)
+        self.assertEqual(polls + 3, self.task_monitor.poll_count)
+        self.assertEqual([mock.call(5), mock.call(5)],
+                         mock_sleep.call_args_list)
+
+    @mock.patch('time.monotonic', autospec=True)
+    @mock.patch('time.sleep', autospec=True)
+    def test_wait_timeout_polls_once_per_cycle(self, mock_sleep,
+                                               mock_monotonic):
+        clock = [100]
+        mock_monotonic.side_effect = lambda: clock[0]
+        mock_sleep.side_effect = lambda secs: clock.__setitem__(
+            0, clock[0] + secs)
+        self.conn.reset_mock()
+        processing = mock.MagicMock(spec=requests.Response)
+        processing.status_code = http_client.ACCEPTED
+        processing.headers = {'Retry-After': 5}
+        processing.content = None
+        self.conn.get.return_value = processing
+        polls = self.task_monitor.poll_count
+
+        self.assertRaisesRegex(exceptions.ConnectionError, 'polls = ',
+                               self.task_monitor.wait, 8)
+
+        # Polled at 100, 105 and when timing out at 108
+        self.assertEqual(3, self.conn.get.call_count)
+        self.assertEqual(polls + 3, self.task_monitor.poll_count)
+        self.assertEqual([mock.call(5), mock.call(3)],
+                         mock_sleep.call_args_list)
+
     def test_from_response_no_content(self):
         self.conn.reset_mock()
         self.conn.get.return_value.status_code = 202
@@ -322,3 +392,157 @@ class TaskMonitorTestCase(base.TestCase):
         self.assertEqual('/Task/545', tm.task_monitor_uri)
         self.assertIsNotNone(tm.task)
         self.assertEqual('545', tm.task.identity)
+
+
+class FakeTaskMonitor:
+    """Task monitor completed after a number of polls"""
+
+    def __init__(self, uri, polls, sleep_for=0, error=None):
+        self.task_monitor_uri = uri
+        self.sleep_for = sleep_for
+        self.is_processing = polls > 0
+        self.polls = 0
+        self._remaining = polls
+        self._error = error
+        self.threads = set()
+
+    @property
+    def check_is_processing(self):
+        self.polls += 1
+        self.threads.add(threading.current_thread().name)
+        if self._error is not None:
+            raise self._error
+        self._remaining -= 1
+        self.is_processing = self._remaining > 0
+        return self.is_processing
+
+
+class TaskMonitorGroupTestCase(base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.group = taskmonitor.TaskMonitorGroup(max_workers=2)
+        self.addCleanup(self.group.close)
+
+    def test_add(self):
+        monitors = [FakeTaskMonitor(f'/taskmon/{i}', polls=i % 3 + 1)
+                    for i in range(20)]
+
+        waits = [self.group.add(monitor, timeout_sec=10)
+                 for monitor in monitors]
+        done, not_done = futures.wait(waits, timeout=10)
+
+        self.assertEqual(set(), not_done)
+        self.assertEqual(monitors, [wait.result() for wait in waits])
+        self.assertEqual([i % 3 + 1 for i in range(20)],
+                         [monitor.polls for monitor in monitors])
+        threads = set().union(*(monitor.threads for monitor in monitors))
+        self.assertLessEqual(len(threads), 2)
+        self.assertEqual(0, len(self.group))
+
+    def test_add_completed(self):
+        monitor = FakeTaskMonitor('/taskmon/1', polls=0)
+
+        wait = self.group.add(monitor)
+
+        self.assertIs(monitor, wait.result(timeout=0))
+        self.assertEqual(0, monitor.polls)
+
+    def test_retry_after_order(self):
+        slow = FakeTaskMonitor('/taskmon/slow', polls=1, sleep_for=0.5)
+        fast = FakeTaskMonitor('/taskmon/fast', polls=1, sleep_for='0')
+        done = []
+
+        waits = [self.group.add(slow), self.group.add(fast)]
+        for wait in waits:
+            wait.add_done_callback(
+                lambda f: done.append(f.result().task_monitor_uri))
+        futures.wait(waits, timeout=10)
+
+        self.assertEqual(['/taskmon/fast', '/taskmon/slow'], done)
+
+    @mock.patch.object(taskmonitor, 'LOG', autospec=True)
+    def test_logged_delay(self, mock_log):
+        delays = iter([0.01, 0.02, 0.03])
+
+        class JitteredTaskMonitor(FakeTaskMonitor):
+            sleep_for = property(lambda self: next(delays),
+                                 lambda self, value: None)
+
+        monitor = JitteredTaskMonitor('/taskmon/1', polls=2)
+        futures.wait([self.group.add(monitor)], timeout=10)
+
+        mock_log.debug.assert_called_once_with(mock.ANY, mock.ANY)
+        self.assertAlmostEqual(0.02, mock_log.debug.call_args[0][1]['sleep'])
+        # Read once per poll
+        self.assertEqual(0.03, next(delays))
+
+    def test_timeout(self):
+        monitor = FakeTaskMonitor('/taskmon/1', polls=100, sleep_for=0.01)
+
+        wait = self.group.add(monitor, timeout_sec=0.05)
+
+        self.assertRaisesRegex(exceptions.ConnectionError,
+                               'Timeout waiting for task monitor /taskmon/1',
+                               wait.result, timeout=10)
+        self.assertLess(monitor.polls, 100)
+
+    def test_error(self):
+        error = exceptions.ConnectionError(url='/taskmon/1', error='boom')
+        monitor = FakeTaskMonitor('/taskmon/1', polls=1, error=error)
+
+        wait = self.group.add(monitor)
+
+        self.assertIs(error, wait.exception(timeout=10))
+
+    def test_close(self):
+        monitor = FakeTaskMonitor('/taskmon/1', polls=1, sleep_for=60)
+        wait = self.group.add(monitor)
+
+        self.group.close()
+
+        self.assertTrue(wait.cancelled())
+        self.assertEqual(0, monitor.polls)
+        self.assertRaises(RuntimeError, self.group.add,
+                          FakeTaskMonitor('/taskmon/2', polls=1))
+
+    def test_close_notifies_waiters(self):
+        group = taskmonitor.TaskMonitorGroup(max_workers=1)
+        self.addCleanup(group.close)
+        proceed = threading.Event()
+
+        class BlockingTaskMonitor(FakeTaskMonitor):
+            @property
+            def check_is_processing(self):
+                proceed.wait(10)
+                return True
+
+        waits = [group.add(BlockingTaskMonitor(f'/taskmon/{i}', polls=1))
+                 for i in range(5)]
+        # All the task monitors are handed to the only worker
+        for _ in range(100):
+            if not len(group):
+                break
+            time.sleep(0.01)
+        self.assertEqual(0, len(group))
+
+        group.close(wait=False)
+        done, not_done = futures.wait(waits, timeout=5)
+        proceed.set()
+
+        self.assertEqual(set(), not_done)
+        self.assertTrue(all(wait.cancelled() for wait in waits))
+        self.assertEqual(set(waits),
+                         set(futures.as_completed(waits, timeout=5)))
+
+    def test_cancel(self):
+        monitor = FakeTaskMonitor('/taskmon/1', polls=1, sleep_for=0.05)
+        wait = self.group.add(monitor)
+
+        self.assertTrue(wait.cancel())
+        futures.wait([self.group.add(
+            FakeTaskMonitor('/taskmon/2', polls=1, sleep_for=0.1))],
+            timeout=10)
+
+        self.assertEqual(0, monitor.polls)
+        self.assertEqual({wait}, futures.wait([wait], timeout=5).done)
@@ -13,8 +13,10 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+from concurrent import futures
 import datetime
 import json
+import threading
 from unittest import mock
 
 import sushy
@@ -134,6 +136,62 @@ class UtilsTestCase(base.TestCase):
             utils.camelcase_to_underscore_joined, '')
 
 
+class JsonDecoderTestCase(base.TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(utils.set_json_decoder)
+
+    def test_default_decoder(self):
+        if utils.orjson is None:
+            self.assertIs(json.loads, utils._json_loads)
+        else:
+            self.assertIs(utils.orjson.loads, utils._json_loads)
+
+    def test_json_from_response(self):
+        response = mock.Mock(content=b'{"Id": "1", "Name": "\xc3\xa9"}')
+
+        self.assertEqual({'Id': '1', 'Name': '\xe9'},
+                         utils.json_from_response(response))
+        response.json.assert_not_called()
+
+    def test_json_from_response_no_bytes(self):
+        response = mock.Mock(content=None)
+
+        self.assertIs(response.json.return_value,
+                      utils.json_from_response(response))
+
+    def test_json_from_response_fallback(self):
+        response = mock.Mock(content=b'\xef\xbb\xbf{"Id": "1"}')
+        response.json.return_value = {'Id': '1'}
+
+        self.assertEqual({'Id': '1'}, utils.json_from_response(response))
+        response.json.assert_called_once_with()
+
+    def test_json_from_response_invalid(self):
+        response = mock.Mock(content=b'<html></html>')
+        response.json.side_effect = ValueError('invalid')
+
+        self.assertRaises(ValueError, utils.json_from_response, response)
+
+    def test_set_json_decoder(self):
+        loads = mock.Mock(return_value={'Id': '1'})
+        utils.set_json_decoder(loads)
+
+        response = mock.Mock(content=b'{}')
+        self.assertEqual({'Id': '1'}, utils.json_from_response(response))
+        loads.assert_called_once_with(b'{}')
+
+        utils.set_json_decoder(None)
+        self.assertEqual({}, utils.json_from_response(response))
+
+    @mock.patch.object(utils, 'orjson', None)
+    def test_set_json_decoder_no_orjson(self):
+        utils.set_json_decoder()
+
+        self.assertIs(json.loads, utils._json_loads)
+
+
 class NestedResource(resource_base.ResourceBase):
 
     def _parse_attributes(self, json_doc):
@@ -209,6 +267,21 @@ class CacheTestCase(base.TestCase):
         for n_res in self.res._cache_few_nested_resources:
             self.assertFalse(n_res._is_stale)
 
+    @mock.patch.object(resource_base.time, 'monotonic', autospec=True)
+    def test_cache_nested_resource_max_age(self, mock_monotonic):
+        mock_monotonic.return_value = 100
+        self.res.nested_resource.max_age = 60
+        self.res.nested_resource.refresh()
+        self.conn.reset_mock()
+
+        mock_monotonic.return_value = 130
+        self.res.nested_resource
+        self.conn.get.assert_not_called()
+
+        mock_monotonic.return_value = 160
+        self.res.nested_resource
+        self.conn.get.assert_called_once_with(path='path/to/nested_resource')
+
     def test_cache_non_resource_retrieval(self):
         with mock.patch.object(
                 self.res, '_do_some_crunch_work_to_get_a',
@@ -239,6 +312,53 @@ class CacheTestCase(base.TestCase):
         self.assertRaises(
             TypeError, utils.cache_clear, self.res, False, only_these=10)
 
+    def test_cache_concurrent_single_flight(self):
+        started = threading.Event()
+        proceed = threading.Event()
+
+        def crunch():
+            started.set()
+            proceed.wait(5)
+            return 'a'
+
+        with mock.patch.object(self.res, '_do_some_crunch_work_to_get_a',
+                               autospec=True,
+                               side_effect=crunch) as crunch_mock:
+            with futures.ThreadPoolExecutor(max_workers=4) as executor:
+                results = [executor.submit(self.res.get_a)
+                           for _ in range(4)]
+                self.assertTrue(started.wait(5))
+                # Other cached methods are not blocked meanwhile
+                self.assertEqual('b', self.res.get_b())
+                proceed.set()
+
+        self.assertEqual(['a'] * 4, [r.result() for r in results])
+        crunch_mock.assert_called_once_with()
+
+    def test_cache_concurrent_refresh_single_flight(self):
+        nested_res = self.res.nested_resource
+        nested_res.invalidate()
+        self.conn.reset_mock()
+
+        with futures.ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(
+                lambda _: self.res.nested_resource, range(4)))
+
+        self.assertEqual([nested_res] * 4, results)
+        self.conn.get.assert_called_once_with(path='path/to/nested_resource')
+
+    def test_cache_clear_not_populated(self):
+        self.res.get_a()
+        with mock.patch.object(self.res, '_do_some_crunch_work_to_get_b',
+                               autospec=True,
+                               side_effect=exceptions.SushyError):
+            self.assertRaises(exceptions.SushyError, self.res.get_b)
+
+        utils.cache_clear(self.res, False)
+
+        self.assertIsNone(self.res._cache_get_a)
+        self.assertIsNone(getattr(self.res, '_cache_get_b', None))
+
     def test_sanitize(self):
         orig = {'UserName': 'admin', 'Password': 'pwd',
                 'nested': {'answer': 42, 'password': 'secret'}}
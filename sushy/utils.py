@@ -14,16 +14,67 @@
 #    under the License.
 
 import collections
+from concurrent import futures
 import functools
+import json
 import logging
 import threading
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from sushy import exceptions
 from sushy.resources import constants as res_cons
 
 LOG = logging.getLogger(__name__)
 
 CACHE_ATTR_NAMES_VAR_NAME = '_cache_attr_names'
+CACHE_LOCKS_VAR_NAME = '_cache_locks'
+
+# Guards the creation of the caching locks of all resources, it is only held
+# for the time of a dictionary lookup
+_cache_locks_guard = threading.Lock()
+
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def set_json_decoder(loads=None):
+    """Set the function decoding the JSON bodies of responses
+
+    :param loads: A callable taking the body as bytes and returning the
+        parsed document, raising ValueError if it is not valid JSON. None
+        restores the default, ``orjson.loads`` if orjson is installed,
+        otherwise ``json.loads``.
+    """
+    global _json_loads
+    if loads is None:
+        loads = orjson.loads if orjson is not None else json.loads
+    _json_loads = loads
+
+
+def json_from_response(response):
+    """Decode the JSON body of a response
+
+    The body is decoded from the bytes of ``response.content`` with the
+    decoder set by :py:func:`~set_json_decoder`. Responses the decoder
+    cannot handle, e.g. with a byte order mark or not encoded in UTF-8,
+    are decoded by ``response.json()``.
+
+    :param response: A ``requests.Response``
+    :returns: The parsed JSON document
+    :raises: ValueError if the body is not valid JSON
+    """
+    content = response.content
+    if not isinstance(content, bytes):
+        return response.json()
+
+    try:
+        return _json_loads(content)
+    except ValueError:
+        return response.json()
 
 
 def revert_dictionary(dictionary):
@@ -55,6 +106,43 @@ def get_members_identities(members):
     return tuple(members_list)
 
 
+def get_members(connector, get_member, identities, path):
+    """Get the members with the given identities
+
+    Members are fetched concurrently, in the order of ``identities``, if the
+    ``max_workers`` of the connector is greater than 1.
+
+    :param connector: A Connector instance
+    :param get_member: Callable returning the member with the given identity
+    :param identities: The identities of the members
+    :param path: The path of the collection, used for error reporting
+    :returns: A list of members
+    :raises: MembersError with all errors if fetching members concurrently
+        fails
+    """
+    max_workers = getattr(connector, 'max_workers', 1)
+    if (not isinstance(max_workers, int) or max_workers <= 1
+            or len(identities) <= 1):
+        return [get_member(id_) for id_ in identities]
+
+    with futures.ThreadPoolExecutor(
+            max_workers=min(max_workers, len(identities))) as executor:
+        fetches = [executor.submit(get_member, id_) for id_ in identities]
+
+    members = []
+    errors = {}
+    for identity, fetch in zip(identities, fetches):
+        try:
+            members.append(fetch.result())
+        except exceptions.SushyError as exc:
+            errors[identity] = exc
+
+    if errors:
+        raise exceptions.MembersError(resource=path, errors=errors)
+
+    return members
+
+
 def int_or_none(x):
     """Given a value x it cast as int or None
 
@@ -160,6 +248,34 @@ def setdefaultattr(obj, name, default):
     return default
 
 
+def _get_cache_lock(res_selfie, cache_attr_name):
+    """Get the lock guarding a caching attribute of a resource
+
+    The attribute name is also registered in the collection of the caching
+    attribute names of the resource.
+
+    :param res_selfie: the resource instance.
+    :param cache_attr_name: the name of the caching attribute.
+    :returns: a reentrant lock
+    """
+    cache_locks = getattr(res_selfie, CACHE_LOCKS_VAR_NAME, None)
+    lock = cache_locks.get(cache_attr_name) if cache_locks else None
+    if lock is None:
+        with _cache_locks_guard:
+            cache_locks = setdefaultattr(
+                res_selfie, CACHE_LOCKS_VAR_NAME, {})
+            lock = cache_locks.get(cache_attr_name)
+            if lock is None:
+                lock = cache_locks[cache_attr_name] = threading.RLock()
+                # Note(deray): Each resource instance maintains a
+                # collection of all the cache attribute names in a private
+                # attribute.
+                cache_attr_names = setdefaultattr(
+                    res_selfie, CACHE_ATTR_NAMES_VAR_NAME, set())
+                cache_attr_names.add(cache_attr_name)
+    return lock
+
+
 def cache_it(res_accessor_method):
     """Utility decorator to cache the return value of the decorated method.
 
@@ -216,8 +332,10 @@ def cache_it(res_accessor_method):
           # selective attribute clearing
           cache_clear(self, force, only_these=['nested_resource'])
 
-    Do note that this is not thread safe. So guard your code to protect it
-    from any kind of concurrency issues while using this decorator.
+    This is thread safe. Each caching attribute of each resource instance is
+    guarded by its own lock, so threads calling the same method concurrently
+    wait for the value computed by the first one instead of computing it
+    again, while calls to other methods are not blocked.
 
     :param res_accessor_method: the resource accessor decorated method.
 
@@ -227,26 +345,21 @@ def cache_it(res_accessor_method):
     @functools.wraps(res_accessor_method)
     def func_wrapper(res_selfie):
 
-        cache_attr_val = getattr(res_selfie, cache_attr_name, None)
-        if cache_attr_val is None:
-
-            cache_attr_val = res_accessor_method(res_selfie)
-            setattr(res_selfie, cache_attr_name, cache_attr_val)
+        with _get_cache_lock(res_selfie, cache_attr_name):
+            cache_attr_val = getattr(res_selfie, cache_attr_name, None)
+            if cache_attr_val is None:
 
-            # Note(deray): Each resource instance maintains a collection of
-            # all the cache attribute names in a private attribute.
-            cache_attr_names = setdefaultattr(
-                res_selfie, CACHE_ATTR_NAMES_VAR_NAME, set())
-            cache_attr_names.add(cache_attr_name)
+                cache_attr_val = res_accessor_method(res_selfie)
+                setattr(res_selfie, cache_attr_name, cache_attr_val)
 
-        from sushy.resources import base
+            from sushy.resources import base
 
-        if isinstance(cache_attr_val, base.ResourceBase):
-            cache_attr_val.refresh(force=False)
-        elif isinstance(cache_attr_val, collections.abc.Sequence):
-            for elem in cache_attr_val:
-                if isinstance(elem, base.ResourceBase):
-                    elem.refresh(force=False)
+            if isinstance(cache_attr_val, base.ResourceBase):
+                cache_attr_val.refresh(force=False)
+            elif isinstance(cache_attr_val, collections.abc.Sequence):
+                for elem in cache_attr_val:
+                    if isinstance(elem, base.ResourceBase):
+                        elem.refresh(force=False)
 
         return cache_attr_val
 
@@ -278,22 +391,23 @@ def cache_clear(res_selfie, force_refresh, only_these=None):
         cache_attr_names = cache_attr_names.intersection(
             '_cache_' + attr for attr in only_these)
 
-    for cache_attr_name in cache_attr_names:
-        cache_attr_val = getattr(res_selfie, cache_attr_name)
-
-        from sushy.resources import base
-
-        if isinstance(cache_attr_val, base.ResourceBase):
-            cache_attr_val.invalidate(force_refresh)
-        elif isinstance(cache_attr_val, collections.abc.Sequence):
-            for elem in cache_attr_val:
-                if isinstance(elem, base.ResourceBase):
-                    elem.invalidate(force_refresh)
-                else:
-                    setattr(res_selfie, cache_attr_name, None)
-                    break
-        else:
-            setattr(res_selfie, cache_attr_name, None)
+    from sushy.resources import base
+
+    for cache_attr_name in list(cache_attr_names):
+        with _get_cache_lock(res_selfie, cache_attr_name):
+            cache_attr_val = getattr(res_selfie, cache_attr_name, None)
+
+            if isinstance(cache_attr_val, base.ResourceBase):
+                cache_attr_val.invalidate(force_refresh)
+            elif isinstance(cache_attr_val, collections.abc.Sequence):
+                for elem in cache_attr_val:
+                    if isinstance(elem, base.ResourceBase):
+                        elem.invalidate(force_refresh)
+                    else:
+                        setattr(res_selfie, cache_attr_name, None)
+                        break
+            else:
+                setattr(res_selfie, cache_attr_name, None)
 
 
 def camelcase_to_underscore_joined(camelcase_str):
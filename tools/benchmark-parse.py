@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+#    Licensed under the Apache License, Version 2.0 (the "License"); you may
+#    not use this file except in compliance with the License. You may obtain
+#    a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#    Unless required by applicable law or agreed to in writing, software
+#    distributed under the License is distributed on an "AS IS" BASIS, WITHOUT
+#    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
+#    License for the specific language governing permissions and limitations
+#    under the License.
+
+"""Measure how long it takes to refresh large resources.
+
+Refreshes an attribute registry and a message registry built from the unit
+test samples, without any BMC, and prints the time per refresh with the
+sushy logger at INFO and at DEBUG level.
+"""
+
+import argparse
+import json
+import logging
+import os
+import timeit
+from unittest import mock
+
+from sushy.resources.registry import attribute_registry
+from sushy.resources.registry import message_registry
+
+SAMPLES = os.path.join(os.path.dirname(__file__), os.pardir, 'sushy',
+                       'tests', 'unit', 'json_samples')
+
+
+def load_sample(name):
+    with open(os.path.join(SAMPLES, name)) as fp:
+        return json.load(fp)
+
+
+def attribute_registry_doc(size):
+    doc = load_sample('bios_attribute_registry.json')
+    attributes = doc['RegistryEntries']['Attributes']
+    doc['RegistryEntries']['Attributes'] = [
+        dict(attributes[i % len(attributes)], AttributeName=f'Attribute{i}')
+        for i in range(size)
+    ]
+    return doc
+
+
+def message_registry_doc(size):
+    doc = load_sample('message_registry.json')
+    messages = list(doc['Messages'].values())
+    doc['Messages'] = {f'Message{i}': messages[i % len(messages)]
+                       for i in range(size)}
+    return doc
+
+
+def measure(resource_class, doc, number):
+    conn = mock.Mock()
+    conn.get.return_value.json.return_value = doc
+    conn.get.return_value.headers = {}
+    resource = resource_class(conn, '/redfish/v1/Registries/Test')
+    timer = timeit.Timer(resource.refresh)
+    return min(timer.repeat(repeat=3, number=number)) / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--size', type=int, default=5000,
+                        help='number of entries in every registry')
+    parser.add_argument('--number', type=int, default=5,
+                        help='number of refreshes per measurement')
+    args = parser.parse_args()
+
+    logging.basicConfig(handlers=[logging.NullHandler()])
+    logger = logging.getLogger('sushy')
+
+    cases = [
+        ('AttributeRegistry', attribute_registry.AttributeRegistry,
+         attribute_registry_doc(args.size)),
+        ('MessageRegistry', message_registry.MessageRegistry,
+         message_registry_doc(args.size)),
+    ]
+    for name, resource_class, doc in cases:
+        for level in (logging.INFO, logging.DEBUG):
+            logger.setLevel(level)
+            seconds = measure(resource_class, doc, args.number)
+            print(f'{name} ({args.size} entries), '
+                  f'{logging.getLevelName(level)}: '
+                  f'{seconds * 1000:.1f} ms per refresh')
+
+
+if __name__ == '__main__':
+    main()